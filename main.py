@@ -4,7 +4,10 @@ import os
 # Ajouter le dossier src au path pour les imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.performance_analyzer import run_benchmark, display_results_table
+from src.history import DEFAULT_HISTORY_PATH, record_benchmark
+from src.performance_analyzer import (BenchmarkMatrix, display_results_table,
+                                      run_benchmark_matrix, run_seed)
+from src.telemetry import ProgressRenderer
 from src.visualization import generate_all_plots
 
 
@@ -60,48 +63,63 @@ def main():
 
         NUM_SAMPLES = 50_000_000
         NUM_RUNS = 5
+        SEED = 42  # Graine maître: runs reproductibles, figure = points du benchmark
+
+        # Matrice du benchmark: workers = puissances de deux jusqu'au nombre de cœurs
+        matrix = BenchmarkMatrix(sample_sizes=(NUM_SAMPLES,))
+        worker_counts = ", ".join(str(count) for count in matrix.worker_counts)
 
         print("⚙️  CONFIGURATION")
         print(f"   • Échantillons par simulation: {NUM_SAMPLES:,}")
         print(f"   • Nombre de runs par configuration: {NUM_RUNS}")
-        print("   • Configurations testées: Mono-thread, Multi-thread (2, 4, 8 threads)\n")
+        print(f"   • Configurations testées: Mono-thread, Multi-thread ({worker_counts} threads)\n")
 
-        input("Appuyez sur Entrée pour commencer le benchmark...\n")
+        # Pas de pause sans terminal (redirection, tâche planifiée): voir aussi
+        # `python -m src.cli` pour un benchmark sans interaction
+        if sys.stdin.isatty():
+            input("Appuyez sur Entrée pour commencer le benchmark...\n")
 
         print("🚀 DÉMARRAGE DU BENCHMARK")
         print("   Cela peut prendre quelques minutes...\n")
 
-        results = run_benchmark(num_samples=NUM_SAMPLES, num_runs=NUM_RUNS)
+        # Barre de progression en direct pendant chaque run
+        results = run_benchmark_matrix(matrix, num_runs=NUM_RUNS, seed=SEED,
+                                       callbacks=[ProgressRenderer()])
 
         display_results_table(results)
 
+        # Historique: comparer plus tard avec `python -m src.history compare`
+        run_id = record_benchmark(results, NUM_SAMPLES, NUM_RUNS, seed=SEED)
+        print(f"💾 Benchmark enregistré: {run_id} ({DEFAULT_HISTORY_PATH})\n")
+
         print("📊 GÉNÉRATION DES GRAPHIQUES")
         print("   Création des visualisations pour la présentation...\n")
 
-        generate_all_plots(results)
+        # Visualisation: les points du premier run mono-thread du benchmark
+        generate_all_plots(results, seed=run_seed(SEED, 0), num_samples=NUM_SAMPLES)
 
         print("\n" + "=" * 80)
         print("✅ DÉMONSTRATION TERMINÉE AVEC SUCCÈS !")
         print("=" * 80)
 
-        best_speedup = max(
-            results["multi_2"].speedup,
-            results["multi_4"].speedup,
-            results["multi_8"].speedup
-        )
+        # Meilleure configuration multi-worker et son mono-thread de référence
+        best = max((r for r in results.values() if r.baseline is not None),
+                   key=lambda r: r.speedup)
+        mono = results[best.baseline]
 
         print(f"""
 📈 RÉSULTATS CLÉS:
-   • Meilleur speedup: {best_speedup:.2f}x plus rapide avec le multi-threading
-   • Temps mono-thread: {results['mono'].avg_time:.3f}s
-   • Temps multi-thread (8 threads): {results['multi_8'].avg_time:.3f}s
-   • Gain de temps: {(results['mono'].avg_time - results['multi_8'].avg_time):.3f}s
+   • Meilleur speedup: {best.speedup:.2f}x plus rapide avec le multi-threading
+   • Temps mono-thread: {mono.avg_time:.3f}s
+   • Temps {best.configuration}: {best.avg_time:.3f}s
+   • Gain de temps: {(mono.avg_time - best.avg_time):.3f}s
 
 📁 FICHIERS GÉNÉRÉS:
    • results/execution_times.png - Comparaison des temps
    • results/scalability.png - Graphique de scalabilité
    • results/speedup.png - Facteur d'accélération
    • results/monte_carlo_method.png - Visualisation de la méthode
+   • {DEFAULT_HISTORY_PATH} - Historique des benchmarks
 """)
 
     except KeyboardInterrupt:
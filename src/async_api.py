@@ -0,0 +1,306 @@
+"""
+API asyncio pour intégrer les simulations dans un service asynchrone
+
+calculate_pi_multi bloque l'appelant jusqu'à la fin de tous les workers: dans
+un service asyncio, la boucle d'événements serait bloquée pendant tout le
+calcul. Ce module fournit des équivalents asynchrones:
+
+- iter_pi_estimates:       itérateur asynchrone d'estimations partielles
+- calculate_pi_mono_async: équivalent de calculate_pi_mono
+- calculate_pi_multi_async: équivalent de calculate_pi_multi
+- WorkerBudget:            pool de workers borné, partagé par plusieurs requêtes
+
+Le calcul est découpé en tâches de task_size échantillons, exécutées dans un
+WorkerPool; la boucle d'événements ne fait qu'attendre leurs résultats. Chaque
+tâche couvre une plage fixe du flux de la graine maître: pour une graine et un
+noyau donnés, le résultat final est celui des simulateurs synchrones.
+
+Annulation coopérative: si la coroutine est annulée (asyncio.CancelledError,
+timeout de asyncio.wait_for, ...), les tâches pas encore démarrées sont
+abandonnées; les workers s'arrêtent à la fin de leur tâche en cours.
+"""
+
+import asyncio
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional, Tuple
+
+from src.kernels import DEFAULT_CHUNK_SIZE
+from src.monte_carlo_multi import resolve_kernel
+from src.scheduler import DEFAULT_TASK_SIZE, count_task
+from src.seeding import iter_segments, resolve_seed
+from src.worker_pool import WorkerPool
+
+
+@dataclass
+class PartialEstimate:
+    """Estimation partielle de Pi, produite après chaque tâche terminée."""
+    pi_value: float              # Estimation sur les échantillons déjà traités
+    samples_done: int            # Nombre d'échantillons traités
+    num_samples: int             # Nombre total d'échantillons demandés
+    elapsed_time: float          # Temps écoulé depuis le début, en secondes
+
+    @property
+    def progress(self) -> float:
+        """Fraction du travail terminée (entre 0 et 1)."""
+        return self.samples_done / self.num_samples
+
+
+class WorkerBudget:
+    """
+    Budget de workers partagé par plusieurs simulations asynchrones.
+
+    Toutes les requêtes qui utilisent le même budget se partagent un seul
+    WorkerPool de max_workers workers: au plus max_workers tâches s'exécutent
+    en même temps, quel que soit le nombre de requêtes concurrentes.
+
+    Exemple:
+        async with WorkerBudget(max_workers=4) as budget:
+            results = await asyncio.gather(
+                calculate_pi_multi_async(10_000_000, 4, budget=budget),
+                calculate_pi_multi_async(10_000_000, 4, budget=budget),
+            )
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, backend: str = "thread"):
+        """
+        Args:
+            max_workers: Nombre maximal de tâches simultanées (nombre de cœurs si None)
+            backend: "thread" ou "process"
+
+        Raises:
+            ValueError: Si le backend est inconnu ou max_workers <= 0
+        """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(f"max_workers doit être > 0, reçu: {max_workers}")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.pool = WorkerPool(backend, self.max_workers)
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def run(self, fn, *args):
+        """
+        Exécute une tâche dans le pool dès qu'un worker du budget est libre.
+
+        Args:
+            fn: Fonction à exécuter (picklable pour le backend "process")
+            *args: Arguments de la fonction
+
+        Returns:
+            Résultat de la tâche
+        """
+        # Sémaphore créé au premier usage, dans la boucle d'événements courante
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+
+        async with self._slots:
+            return await asyncio.wrap_future(self.pool.submit(fn, *args))
+
+    def close(self):
+        """Arrête les workers du budget."""
+        self.pool.shutdown()
+
+    async def __aenter__(self) -> "WorkerBudget":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+async def iter_pi_estimates(num_samples: int, num_workers: int = 1,
+                            backend: str = "thread",
+                            seed: Optional[int] = None, kernel: str = "numpy",
+                            chunk_size: int = DEFAULT_CHUNK_SIZE,
+                            sampling: str = "pseudo",
+                            task_size: int = DEFAULT_TASK_SIZE,
+                            budget: Optional[WorkerBudget] = None
+                            ) -> AsyncIterator[PartialEstimate]:
+    """
+    Calcule Pi de façon asynchrone, en produisant une estimation après chaque tâche.
+
+    Au plus num_workers tâches de cette simulation sont en cours à la fois
+    (et au plus budget.max_workers pour l'ensemble des simulations du budget).
+
+    Exemple:
+        async for partial in iter_pi_estimates(10_000_000, 4, seed=42):
+            print(f"{partial.progress:.0%}: Pi ≈ {partial.pi_value:.6f}")
+
+    Args:
+        num_samples: Nombre total de points aléatoires
+        num_workers: Nombre de tâches simultanées pour cette simulation
+        backend: "thread" ou "process" (ignoré si un budget est fourni)
+        seed: Graine maître pour un résultat reproductible (aléatoire si None)
+        kernel: Noyau de calcul, "python", "numpy", "integer" ou "auto"
+        chunk_size: Taille des blocs des noyaux vectorisés
+        sampling: "pseudo" (pseudo-aléatoire) ou "halton" (quasi-Monte Carlo)
+        task_size: Nombre d'échantillons par tâche (granularité des résultats
+                   partiels et de l'annulation)
+        budget: Budget de workers partagé (None = pool créé pour l'appel)
+
+    Yields:
+        PartialEstimate: Estimation sur les échantillons traités jusqu'ici
+
+    Raises:
+        ValueError: Si un paramètre est invalide
+    """
+    # Validation des entrées
+    if num_samples <= 0:
+        raise ValueError(f"num_samples doit être > 0, reçu: {num_samples}")
+
+    if num_workers <= 0:
+        raise ValueError(f"num_workers doit être > 0, reçu: {num_workers}")
+
+    if task_size <= 0:
+        raise ValueError(f"task_size doit être > 0, reçu: {task_size}")
+
+    kernel = resolve_kernel(kernel)
+    seed = resolve_seed(seed)
+
+    own_budget = budget is None
+    if own_budget:
+        budget = WorkerBudget(num_workers, backend)
+
+    tasks = iter_segments(0, num_samples, task_size)
+    pending = set()
+    inside = 0
+    samples_done = 0
+    start_time = time.perf_counter()
+
+    def schedule_next() -> bool:
+        # Soumettre la prochaine tâche de la plage, s'il en reste
+        segment = next(tasks, None)
+        if segment is None:
+            return False
+        task_start, samples = segment
+        pending.add(asyncio.ensure_future(
+            budget.run(count_task, samples, seed, task_start, kernel, chunk_size, sampling)
+        ))
+        return True
+
+    try:
+        # Fenêtre de num_workers tâches en cours
+        for _ in range(num_workers):
+            if not schedule_next():
+                break
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for finished in done:
+                task_inside, task_samples, _ = finished.result()
+                inside += task_inside
+                samples_done += task_samples
+                schedule_next()
+
+            yield PartialEstimate(
+                pi_value=4.0 * inside / samples_done,
+                samples_done=samples_done,
+                num_samples=num_samples,
+                elapsed_time=time.perf_counter() - start_time,
+            )
+    finally:
+        # Annulation (ou erreur): abandonner les tâches pas encore démarrées
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if own_budget:
+            # Les workers finissent leur tâche en cours sans bloquer la boucle
+            await asyncio.get_running_loop().run_in_executor(None, budget.close)
+
+
+async def calculate_pi_multi_async(num_samples: int, num_threads: int,
+                                   backend: str = "thread",
+                                   seed: Optional[int] = None, kernel: str = "numpy",
+                                   chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                   sampling: str = "pseudo",
+                                   task_size: int = DEFAULT_TASK_SIZE,
+                                   budget: Optional[WorkerBudget] = None
+                                   ) -> Tuple[float, float]:
+    """
+    Équivalent asynchrone de calculate_pi_multi.
+
+    La boucle d'événements reste libre pendant le calcul. Pour limiter sa
+    durée, utiliser asyncio.wait_for: à l'expiration, la simulation est
+    annulée et ses tâches restantes abandonnées.
+
+    Args:
+        num_samples: Nombre total de points aléatoires
+        num_threads: Nombre de tâches simultanées (threads ou processus)
+        backend: "thread" ou "process" (ignoré si un budget est fourni)
+        seed: Graine maître pour un résultat reproductible (aléatoire si None)
+        kernel: Noyau de calcul, "python", "numpy", "integer" ou "auto"
+        chunk_size: Taille des blocs des noyaux vectorisés
+        sampling: "pseudo" (pseudo-aléatoire) ou "halton" (quasi-Monte Carlo)
+        task_size: Nombre d'échantillons par tâche
+        budget: Budget de workers partagé (None = pool créé pour l'appel)
+
+    Returns:
+        tuple: (valeur_de_pi, temps_execution_en_secondes)
+    """
+    pi_estimate, execution_time = math.nan, 0.0
+
+    async for partial in iter_pi_estimates(num_samples, num_threads, backend, seed,
+                                           kernel, chunk_size, sampling, task_size,
+                                           budget):
+        pi_estimate, execution_time = partial.pi_value, partial.elapsed_time
+
+    return pi_estimate, execution_time
+
+
+async def calculate_pi_mono_async(num_samples: int, kernel: str = "numpy",
+                                  chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                  seed: Optional[int] = None,
+                                  sampling: str = "pseudo",
+                                  task_size: int = DEFAULT_TASK_SIZE,
+                                  budget: Optional[WorkerBudget] = None
+                                  ) -> Tuple[float, float]:
+    """
+    Équivalent asynchrone de calculate_pi_mono.
+
+    Les tâches sont exécutées une par une, dans un seul worker à la fois.
+
+    Args:
+        num_samples: Nombre de points aléatoires
+        kernel: Noyau de calcul, "python", "numpy" ou "integer"
+        chunk_size: Taille des blocs des noyaux vectorisés
+        seed: Graine maître pour un résultat reproductible (aléatoire si None)
+        sampling: "pseudo" (pseudo-aléatoire) ou "halton" (quasi-Monte Carlo)
+        task_size: Nombre d'échantillons par tâche
+        budget: Budget de workers partagé (None = thread créé pour l'appel)
+
+    Returns:
+        tuple: (valeur_de_pi, temps_execution_en_secondes)
+    """
+    return await calculate_pi_multi_async(num_samples, 1, "thread", seed, kernel,
+                                          chunk_size, sampling, task_size, budget)
+
+
+if __name__ == "__main__":
+    # Test rapide du module
+    print("=== Test de l'API asyncio ===\n")
+
+    async def demo():
+        # Estimations partielles au fil du calcul
+        async for partial in iter_pi_estimates(4_000_000, 2, seed=42, task_size=1_048_576):
+            print(f"  {partial.progress:>5.0%} | Pi ≈ {partial.pi_value:.6f} "
+                  f"| {partial.elapsed_time:.4f}s")
+
+        # Plusieurs requêtes concurrentes dans un budget de 2 workers
+        async with WorkerBudget(max_workers=2) as budget:
+            results = await asyncio.gather(*[
+                calculate_pi_multi_async(2_000_000, 2, seed=seed, budget=budget)
+                for seed in range(3)
+            ])
+        for seed, (pi_value, exec_time) in enumerate(results):
+            print(f"  Requête {seed}: Pi = {pi_value:.6f} ({exec_time:.4f}s)")
+
+        # Annulation par timeout
+        try:
+            await asyncio.wait_for(calculate_pi_mono_async(50_000_000, kernel="python"), 0.5)
+        except asyncio.TimeoutError:
+            print("  Simulation annulée après 0,5 s")
+
+    asyncio.run(demo())
@@ -0,0 +1,363 @@
+"""
+Cache des comptes par bloc: prolonger une estimation au lieu de la refaire
+
+Avec les flux déterministes (src/seeding.py), les échantillons [0, 2N) d'une
+graine contiennent les échantillons [0, N): une estimation à 2N points refait
+tout le travail de l'estimation à N points. Ce module mémorise le nombre de
+points dans le cercle de chaque bloc de flux complet (STREAM_BLOCK_SIZE
+points), pour un flux donné:
+
+    (graine, échantillonnage, noyau)  →  numéro de bloc  →  points dans le cercle
+
+Une demande de plus d'échantillons ne calcule que les blocs manquants; un
+balayage de tailles croissantes ne coûte donc que la plus grande.
+
+Le backend d'exécution et le nombre de workers ne font pas partie de la clé:
+pour une graine donnée, le compte d'un bloc est le même quel que soit le
+découpage du travail. Un cache rempli avec des threads sert aussi aux
+processus.
+
+Les blocs les moins récemment utilisés sont évincés au-delà de max_blocks
+entrées en mémoire (LRU). Avec un fichier de débordement (spill_path), les
+blocs évincés y sont écrits (module dbm) puis relus à la demande, et close()
+y enregistre tous les blocs: le cache survit alors d'un processus à l'autre.
+
+Seuls les blocs complets sont mis en cache: le début et la fin d'une plage
+qui ne tombent pas sur une frontière de bloc sont recomptés à chaque appel
+(au plus deux blocs partiels).
+"""
+
+import dbm
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from src.kernels import DEFAULT_CHUNK_SIZE, iter_block_counts
+from src.monte_carlo_mono import count_inside_mono
+from src.monte_carlo_multi import BACKENDS, resolve_kernel
+from src.qmc import SAMPLINGS, count_inside_halton
+from src.scheduler import wait_for_results
+from src.seeding import STREAM_BLOCK_SIZE, iter_blocks, resolve_seed
+from src.worker_pool import WorkerPool
+
+
+# Nombre maximal de blocs gardés en mémoire (≈ 10⁹ échantillons, quelques Mo)
+DEFAULT_MAX_BLOCKS = 16_384
+
+# Nombre de tâches par worker pour les blocs manquants (équilibrage de charge)
+TASKS_PER_WORKER = 4
+
+# Clé d'un flux: (graine, échantillonnage, noyau)
+StreamKey = Tuple[int, str, str]
+
+
+def stream_key(seed: int, kernel: str, sampling: str = "pseudo") -> StreamKey:
+    """
+    Clé du flux dont les blocs sont mis en cache.
+
+    En mode "halton", le noyau n'est pas utilisé (toujours vectorisé): tous
+    les noyaux partagent alors le même flux.
+
+    Args:
+        seed: Graine maître (déjà résolue)
+        kernel: Noyau effectif ("python", "numpy" ou "integer")
+        sampling: "pseudo" ou "halton"
+
+    Returns:
+        tuple: (graine, échantillonnage, noyau)
+    """
+    return int(seed), sampling, kernel if sampling == "pseudo" else "-"
+
+
+@dataclass
+class CacheStats:
+    """Compteurs d'utilisation d'un BlockCache."""
+    memory_hits: int = 0         # Blocs trouvés en mémoire
+    disk_hits: int = 0           # Blocs relus depuis le fichier de débordement
+    misses: int = 0              # Blocs absents (à calculer)
+    evictions: int = 0           # Blocs évincés de la mémoire
+
+
+class BlockCache:
+    """
+    Comptes de points dans le cercle par bloc de flux, avec éviction LRU.
+
+    Exemple:
+        with BlockCache(spill_path="results/block_cache") as cache:
+            for n in (10**6, 10**7, 10**8):
+                pi_value, exec_time = calculate_pi_cached(n, 4, cache=cache, seed=42)
+    """
+
+    def __init__(self, max_blocks: int = DEFAULT_MAX_BLOCKS,
+                 spill_path: Optional[str] = None):
+        """
+        Args:
+            max_blocks: Nombre maximal de blocs gardés en mémoire
+            spill_path: Fichier dbm recevant les blocs évincés (None = blocs
+                        évincés perdus)
+
+        Raises:
+            ValueError: Si max_blocks <= 0
+        """
+        if max_blocks <= 0:
+            raise ValueError(f"max_blocks doit être > 0, reçu: {max_blocks}")
+
+        self.max_blocks = max_blocks
+        self.spill_path = spill_path
+        self.stats = CacheStats()
+
+        self._entries: "OrderedDict[Tuple[StreamKey, int], int]" = OrderedDict()
+        self._disk = dbm.open(spill_path, "c") if spill_path is not None else None
+
+    @staticmethod
+    def _disk_key(stream: StreamKey, block_index: int) -> bytes:
+        """Clé d'un bloc dans le fichier de débordement."""
+        seed, sampling, kernel = stream
+        return f"{seed}:{sampling}:{kernel}:{block_index}".encode()
+
+    def get(self, stream: StreamKey, block_index: int) -> Optional[int]:
+        """
+        Compte mémorisé d'un bloc (le bloc devient le plus récemment utilisé).
+
+        Args:
+            stream: Clé du flux (voir stream_key)
+            block_index: Numéro du bloc
+
+        Returns:
+            int: Points dans le cercle du bloc, ou None s'il n'est pas en cache
+        """
+        key = (stream, block_index)
+        count = self._entries.get(key)
+        if count is not None:
+            self._entries.move_to_end(key)
+            self.stats.memory_hits += 1
+            return count
+
+        if self._disk is not None:
+            value = self._disk.get(self._disk_key(stream, block_index))
+            if value is not None:
+                self.stats.disk_hits += 1
+                count = int(value)
+                self.put(stream, block_index, count)
+                return count
+
+        self.stats.misses += 1
+        return None
+
+    def put(self, stream: StreamKey, block_index: int, count: int):
+        """
+        Mémorise le compte d'un bloc, en évinçant les blocs les plus anciens.
+
+        Args:
+            stream: Clé du flux (voir stream_key)
+            block_index: Numéro du bloc
+            count: Points dans le cercle du bloc complet
+        """
+        key = (stream, block_index)
+        self._entries[key] = count
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_blocks:
+            (old_stream, old_block), old_count = self._entries.popitem(last=False)
+            self.stats.evictions += 1
+            if self._disk is not None:
+                self._disk[self._disk_key(old_stream, old_block)] = str(old_count).encode()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self):
+        """Enregistre les blocs en mémoire dans le fichier de débordement et le ferme."""
+        if self._disk is None:
+            return
+
+        for (stream, block_index), count in self._entries.items():
+            self._disk[self._disk_key(stream, block_index)] = str(count).encode()
+        self._disk.close()
+        self._disk = None
+
+    def __enter__(self) -> "BlockCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def count_blocks(first_block: int, num_blocks: int, seed: int, kernel: str,
+                 chunk_size: int, sampling: str = "pseudo") -> List[int]:
+    """
+    Compte les points dans le cercle de blocs complets consécutifs (tâche d'un worker).
+
+    Les blocs sont comptés en un seul passage du noyau (iter_block_counts):
+    un appel par bloc coûterait nettement plus cher (tableaux de travail
+    réalloués à chaque appel).
+
+    Args:
+        first_block: Numéro du premier bloc
+        num_blocks: Nombre de blocs consécutifs
+        seed: Graine maître
+        kernel: Noyau effectif
+        chunk_size: Taille des blocs des noyaux vectorisés
+        sampling: Mode d'échantillonnage
+
+    Returns:
+        list: Points dans le cercle de chaque bloc, dans l'ordre
+    """
+    if sampling == "halton":
+        return [count_inside_halton(STREAM_BLOCK_SIZE, chunk_size, seed,
+                                    block_index * STREAM_BLOCK_SIZE)
+                for block_index in range(first_block, first_block + num_blocks)]
+
+    return [count for _, count in iter_block_counts(num_blocks * STREAM_BLOCK_SIZE, kernel,
+                                                    chunk_size, seed,
+                                                    first_block * STREAM_BLOCK_SIZE)]
+
+
+def _block_runs(blocks: Sequence[int], max_length: int) -> List[Tuple[int, int]]:
+    """Regroupe des numéros de blocs croissants en plages consécutives (début, longueur)."""
+    runs = []
+    for block_index in blocks:
+        if runs and runs[-1][0] + runs[-1][1] == block_index and runs[-1][1] < max_length:
+            runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+        else:
+            runs.append((block_index, 1))
+    return runs
+
+
+def count_inside_cached(num_samples: int, num_workers: int = 1,
+                        backend: str = "thread", seed: Optional[int] = None,
+                        kernel: str = "python", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        start: int = 0, cache: Optional[BlockCache] = None,
+                        pool: Optional[WorkerPool] = None,
+                        sampling: str = "pseudo") -> int:
+    """
+    Compte les points dans le cercle en réutilisant les blocs déjà calculés.
+
+    Les blocs complets de la plage [start, start + num_samples) sont lus dans
+    le cache; les blocs manquants sont comptés (répartis entre num_workers
+    workers) puis ajoutés au cache. Le résultat est identique à celui de
+    count_inside_mono et count_inside_multi pour la même graine.
+
+    Args:
+        num_samples: Nombre d'échantillons de la plage
+        num_workers: Nombre de workers pour les blocs manquants
+        backend: "thread" ou "process" (ignoré si un pool est fourni)
+        seed: Graine maître (aléatoire si None: le cache ne sert alors pas)
+        kernel: Noyau ("python", "numpy", "integer" ou "auto")
+        chunk_size: Taille des blocs des noyaux vectorisés
+        start: Indice global du premier échantillon de la plage
+        cache: Cache des comptes par bloc (None = cache temporaire pour l'appel)
+        pool: Pool persistant à réutiliser
+        sampling: "pseudo" ou "halton"
+
+    Returns:
+        int: Nombre de points tombés dans le cercle
+
+    Raises:
+        ValueError: Si un paramètre est invalide
+    """
+    if num_samples <= 0:
+        raise ValueError(f"num_samples doit être > 0, reçu: {num_samples}")
+
+    if num_workers <= 0:
+        raise ValueError(f"num_workers doit être > 0, reçu: {num_workers}")
+
+    if backend not in BACKENDS:
+        raise ValueError(f"backend doit être parmi {BACKENDS}, reçu: {backend!r}")
+
+    if sampling not in SAMPLINGS:
+        raise ValueError(f"sampling doit être parmi {SAMPLINGS}, reçu: {sampling!r}")
+
+    seed = resolve_seed(seed)
+    kernel = resolve_kernel(kernel)
+    cache = cache if cache is not None else BlockCache()
+    stream = stream_key(seed, kernel, sampling)
+
+    inside = 0
+    missing = []
+
+    for block_index, lo, hi in iter_blocks(start, num_samples):
+        if lo == 0 and hi == STREAM_BLOCK_SIZE:
+            count = cache.get(stream, block_index)
+            if count is None:
+                missing.append(block_index)
+            else:
+                inside += count
+        else:
+            # Bloc partiel (début ou fin de plage): recompté, jamais mis en cache
+            inside += count_inside_mono(hi - lo, kernel, chunk_size, seed,
+                                        block_index * STREAM_BLOCK_SIZE + lo, sampling)
+
+    if not missing:
+        return inside
+
+    if num_workers == 1 and pool is None:
+        # Une seule tâche par plage de blocs manquants consécutifs
+        tasks = _block_runs(missing, len(missing))
+        results = [count_blocks(first, length, seed, kernel, chunk_size, sampling)
+                   for first, length in tasks]
+    else:
+        tasks = _block_runs(missing, math.ceil(len(missing) / (TASKS_PER_WORKER * num_workers)))
+        # Attente sans limite: une tâche couvre 1/(TASKS_PER_WORKER × num_workers)
+        # des blocs manquants, et peut durer bien plus d'une minute sur un grand
+        # balayage (ex: noyau python, 10¹⁰ échantillons)
+        if pool is not None:
+            pool.resize(num_workers)
+            results = wait_for_results([pool.submit(count_blocks, first, length, seed,
+                                                    kernel, chunk_size, sampling)
+                                        for first, length in tasks], stall_timeout=None)
+        else:
+            with WorkerPool(backend, num_workers) as temporary_pool:
+                results = wait_for_results([temporary_pool.submit(count_blocks, first, length,
+                                                                  seed, kernel, chunk_size,
+                                                                  sampling)
+                                            for first, length in tasks],
+                                           stall_timeout=None)
+    counts = [count for task_counts in results for count in task_counts]
+
+    for block_index, count in zip(missing, counts):
+        cache.put(stream, block_index, count)
+        inside += count
+
+    return inside
+
+
+def calculate_pi_cached(num_samples: int, num_workers: int = 1,
+                        backend: str = "thread", seed: Optional[int] = None,
+                        kernel: str = "python", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        cache: Optional[BlockCache] = None,
+                        pool: Optional[WorkerPool] = None,
+                        sampling: str = "pseudo") -> tuple[float, float]:
+    """
+    Calcule Pi en ne comptant que les blocs absents du cache.
+
+    Mêmes paramètres que count_inside_cached (la plage commence à 0).
+
+    Returns:
+        tuple: (valeur_de_pi, temps_d_exécution_en_secondes)
+    """
+    start_time = time.perf_counter()
+    inside = count_inside_cached(num_samples, num_workers, backend, seed, kernel,
+                                 chunk_size, 0, cache, pool, sampling)
+    execution_time = time.perf_counter() - start_time
+
+    return 4.0 * inside / num_samples, execution_time
+
+
+if __name__ == "__main__":
+    # Test rapide du module
+    from src.monte_carlo_mono import calculate_pi_mono
+
+    print("=== Test du cache des comptes par bloc ===\n")
+
+    cache = BlockCache()
+    for samples in (1_000_000, 2_000_000, 4_000_000, 8_000_000):
+        pi_value, exec_time = calculate_pi_cached(samples, 2, kernel="numpy",
+                                                  seed=42, cache=cache)
+        reference, _ = calculate_pi_mono(samples, "numpy", seed=42)
+        print(f"Échantillons: {samples:>10,} | Pi = {pi_value:.8f} "
+              f"(direct: {reference:.8f}) | Temps: {exec_time:.4f}s")
+
+    print(f"\nBlocs en mémoire: {len(cache)} | {cache.stats}")
@@ -0,0 +1,458 @@
+"""
+Points de reprise (checkpoints) pour les très longues simulations
+
+Une simulation de 10¹¹ échantillons dure des heures: si le processus est
+tué, calculate_pi_mono et calculate_pi_multi perdent tout, car leurs
+compteurs ne vivent qu'en mémoire. Ici, l'état de la simulation est écrit
+régulièrement dans un fichier JSON local, et une simulation interrompue
+reprend exactement là où elle s'était arrêtée.
+
+L'état d'un worker tient en quelques entiers: sa plage [start, start + samples),
+les échantillons déjà traités et les points dans le cercle comptés. L'état
+de son générateur aléatoire n'a pas besoin d'être sérialisé: avec les flux
+par bloc (src/seeding.py), il est entièrement déterminé par la graine maître
+et la position courante (start + samples_done), enregistrées toutes les deux.
+Le résultat final d'une simulation reprise est donc identique, au bit près,
+à celui d'une simulation d'une traite.
+
+Écriture atomique: le checkpoint est écrit dans un fichier temporaire, forcé
+sur disque (fsync), puis renommé (os.replace). Un arrêt brutal pendant
+l'écriture laisse l'ancien checkpoint intact.
+
+Coût borné: les workers publient déjà leur progression dans leur case de
+ResultSlots tous les progress_interval échantillons (voir src/telemetry.py);
+le thread de surveillance lit ces cases et CheckpointWriter n'écrit le
+fichier qu'au plus une fois toutes les checkpoint_interval secondes. Le
+surcoût est mesuré (overhead_time) et reste de l'ordre de
+durée_d_écriture / checkpoint_interval.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import wait
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional, Sequence
+
+from src.kernels import DEFAULT_CHUNK_SIZE
+from src.monte_carlo_multi import BACKENDS, resolve_kernel, share_starts, slot_worker, split_samples
+from src.qmc import SAMPLINGS
+from src.result_slots import ResultSlots
+from src.seeding import STREAM_BLOCK_SIZE, resolve_seed
+from src.telemetry import (
+    DEFAULT_PROGRESS_INTERVAL,
+    DEFAULT_TELEMETRY_INTERVAL,
+    TelemetryCallback,
+    TelemetryMonitor,
+    TelemetrySnapshot,
+)
+from src.worker_pool import WorkerPool
+
+
+# Temps minimal entre deux écritures du checkpoint, en secondes
+DEFAULT_CHECKPOINT_INTERVAL = 30.0
+
+# Version du format de fichier
+CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class WorkerCheckpoint:
+    """État d'un worker: sa plage et sa progression."""
+    start: int                   # Indice global du premier échantillon de la part
+    samples: int                 # Nombre d'échantillons de la part
+    samples_done: int = 0        # Échantillons traités (depuis start)
+    hits: int = 0                # Points dans le cercle comptés
+
+    @property
+    def position(self) -> int:
+        """Indice global du prochain échantillon (position dans le flux)."""
+        return self.start + self.samples_done
+
+    @property
+    def remaining(self) -> int:
+        """Échantillons restant à traiter."""
+        return self.samples - self.samples_done
+
+
+@dataclass
+class Checkpoint:
+    """État complet d'une simulation, suffisant pour la reprendre."""
+    num_samples: int             # Nombre total d'échantillons
+    seed: int                    # Graine maître (résolue)
+    kernel: str                  # Noyau effectif
+    sampling: str                # "pseudo" ou "halton"
+    chunk_size: int              # Taille des blocs des noyaux vectorisés
+    workers: List[WorkerCheckpoint] = field(default_factory=list)
+    elapsed_time: float = 0.0    # Temps de calcul cumulé sur toutes les sessions
+    version: int = CHECKPOINT_VERSION
+
+    @property
+    def samples_done(self) -> int:
+        """Échantillons traités par l'ensemble des workers."""
+        return sum(worker.samples_done for worker in self.workers)
+
+    @property
+    def hits(self) -> int:
+        """Points dans le cercle comptés par l'ensemble des workers."""
+        return sum(worker.hits for worker in self.workers)
+
+    @property
+    def complete(self) -> bool:
+        """True si tous les échantillons ont été traités."""
+        return self.samples_done == self.num_samples
+
+    @property
+    def pi_value(self) -> float:
+        """Estimation de Pi sur les échantillons déjà traités."""
+        if self.samples_done == 0:
+            return 0.0
+        return 4.0 * self.hits / self.samples_done
+
+
+def new_checkpoint(num_samples: int, num_workers: int, seed: int, kernel: str,
+                   sampling: str = "pseudo",
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> Checkpoint:
+    """
+    Crée l'état initial d'une simulation (aucun échantillon traité).
+
+    Les parts sont celles de calculate_pi_multi (le dernier worker prend le reste).
+
+    Args:
+        num_samples: Nombre total d'échantillons
+        num_workers: Nombre de workers
+        seed: Graine maître (résolue)
+        kernel: Noyau effectif
+        sampling: "pseudo" ou "halton"
+        chunk_size: Taille des blocs des noyaux vectorisés
+
+    Returns:
+        Checkpoint: État initial
+    """
+    shares = split_samples(num_samples, num_workers)
+    return Checkpoint(
+        num_samples=num_samples,
+        seed=seed,
+        kernel=kernel,
+        sampling=sampling,
+        chunk_size=chunk_size,
+        workers=[WorkerCheckpoint(start=start, samples=share)
+                 for share, start in zip(shares, share_starts(shares))],
+    )
+
+
+def save_checkpoint(checkpoint: Checkpoint, path: str):
+    """
+    Écrit un checkpoint de façon atomique (fichier temporaire, fsync, renommage).
+
+    Args:
+        checkpoint: État à enregistrer
+        path: Fichier JSON du checkpoint
+    """
+    data = asdict(checkpoint)
+    # Position de chaque flux, pour un humain qui lit le fichier
+    for worker, state in zip(checkpoint.workers, data["workers"]):
+        state["next_block"], state["block_offset"] = divmod(worker.position,
+                                                            STREAM_BLOCK_SIZE)
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary_path, path)
+
+
+def load_checkpoint(path: str) -> Checkpoint:
+    """
+    Lit un checkpoint écrit par save_checkpoint.
+
+    Args:
+        path: Fichier JSON du checkpoint
+
+    Returns:
+        Checkpoint: État enregistré
+
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas
+        ValueError: Si la version du format n'est pas prise en charge
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    if data.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"version de checkpoint non prise en charge: {data.get('version')!r} "
+                         f"(attendu: {CHECKPOINT_VERSION})")
+
+    workers = [WorkerCheckpoint(start=w["start"], samples=w["samples"],
+                                samples_done=w["samples_done"], hits=w["hits"])
+               for w in data.pop("workers")]
+    return Checkpoint(workers=workers, **data)
+
+
+class CheckpointWriter:
+    """
+    Rappel de télémétrie qui enregistre la progression dans un checkpoint.
+
+    Les cases lues par le thread de surveillance ne contiennent que la
+    progression de la session courante: elle est ajoutée à l'état de départ
+    (base) pour obtenir l'état complet.
+
+    Exemple:
+        writer = CheckpointWriter("run.ckpt.json", base, interval=60)
+        with TelemetryMonitor(slots, remaining, [writer]):
+            ...
+    """
+
+    def __init__(self, path: str, base: Checkpoint,
+                 interval: float = DEFAULT_CHECKPOINT_INTERVAL):
+        """
+        Args:
+            path: Fichier JSON du checkpoint
+            base: État au début de la session (un worker par case)
+            interval: Temps minimal entre deux écritures, en secondes
+
+        Raises:
+            ValueError: Si interval < 0
+        """
+        if interval < 0:
+            raise ValueError(f"interval doit être >= 0, reçu: {interval}")
+
+        self.path = path
+        self.base = base
+        self.interval = interval
+        self.num_writes = 0
+        self.overhead_time = 0.0
+        self.last_checkpoint: Optional[Checkpoint] = None
+        self._last_write = time.perf_counter()
+
+    def checkpoint(self, snapshot: TelemetrySnapshot) -> Checkpoint:
+        """
+        État complet correspondant à un instantané de la session courante.
+
+        Args:
+            snapshot: Instantané des cases des workers
+
+        Returns:
+            Checkpoint: État de départ + progression de la session
+        """
+        workers = [WorkerCheckpoint(start=base.start, samples=base.samples,
+                                    samples_done=base.samples_done + worker.samples_done,
+                                    hits=base.hits + worker.hits)
+                   for base, worker in zip(self.base.workers, snapshot.workers)]
+        return Checkpoint(
+            num_samples=self.base.num_samples,
+            seed=self.base.seed,
+            kernel=self.base.kernel,
+            sampling=self.base.sampling,
+            chunk_size=self.base.chunk_size,
+            workers=workers,
+            elapsed_time=self.base.elapsed_time + snapshot.elapsed_time,
+        )
+
+    def __call__(self, snapshot: TelemetrySnapshot):
+        now = time.perf_counter()
+        # Le dernier instantané (fin ou interruption) est toujours enregistré
+        if not snapshot.final and now - self._last_write < self.interval:
+            return
+
+        self.last_checkpoint = self.checkpoint(snapshot)
+        save_checkpoint(self.last_checkpoint, self.path)
+        self._last_write = time.perf_counter()
+        self.num_writes += 1
+        self.overhead_time += self._last_write - now
+
+
+def _run_session(checkpoint: Checkpoint, path: str, backend: str,
+                 pool: Optional[WorkerPool], checkpoint_interval: float,
+                 progress_interval: int, callbacks: Sequence[TelemetryCallback],
+                 telemetry_interval: float) -> Checkpoint:
+    """
+    Traite les échantillons restants de chaque worker en enregistrant des checkpoints.
+
+    Contrairement à calculate_pi_multi, l'attente des workers n'a pas de
+    timeout: une part de 10¹¹ échantillons dure des heures (les rappels de
+    télémétrie, ex: ProgressRenderer, signalent un worker bloqué).
+
+    Returns:
+        Checkpoint: État final (complet, sauf exception)
+    """
+    num_workers = len(checkpoint.workers)
+    remaining = [worker.remaining for worker in checkpoint.workers]
+    writer = CheckpointWriter(path, checkpoint, checkpoint_interval)
+
+    if pool is not None:
+        backend = pool.backend
+
+    with ResultSlots(num_workers, shared=(backend == "process")) as slots, \
+            TelemetryMonitor(slots, max(sum(remaining), 1), [writer, *callbacks],
+                             telemetry_interval, remaining):
+        tasks = [(samples, slots, index, checkpoint.seed, worker.position, checkpoint.kernel,
+                  checkpoint.chunk_size, checkpoint.sampling, progress_interval)
+                 for index, (worker, samples) in enumerate(zip(checkpoint.workers, remaining))
+                 if samples > 0]
+
+        if tasks:
+            if pool is not None:
+                pool.resize(num_workers)
+                futures = [pool.submit(slot_worker, *args) for args in tasks]
+                wait(futures)
+            else:
+                with WorkerPool(backend, num_workers) as session_pool:
+                    futures = [session_pool.submit(slot_worker, *args) for args in tasks]
+                    wait(futures)
+
+            # Propager l'erreur d'un worker (le dernier checkpoint reste valide)
+            for future in futures:
+                future.result()
+
+    # L'instantané final (TelemetryMonitor.stop) a été enregistré par le writer
+    return writer.last_checkpoint
+
+
+def calculate_pi_checkpointed(num_samples: int, num_threads: int = 1,
+                              backend: str = "thread", seed: Optional[int] = None,
+                              kernel: str = "python", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                              sampling: str = "pseudo",
+                              checkpoint_path: str = "pi.ckpt.json",
+                              checkpoint_interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+                              progress_interval: int = DEFAULT_PROGRESS_INTERVAL,
+                              pool: Optional[WorkerPool] = None,
+                              callbacks: Sequence[TelemetryCallback] = (),
+                              telemetry_interval: float = DEFAULT_TELEMETRY_INTERVAL
+                              ) -> tuple[float, float]:
+    """
+    Calcule Pi en enregistrant régulièrement un checkpoint, et reprend s'il existe.
+
+    Si checkpoint_path existe déjà, la simulation qu'il décrit est reprise
+    (relancer la même commande après un arrêt brutal suffit): ses paramètres
+    doivent alors correspondre à ceux demandés, et seed=None reprend sa graine.
+
+    Args:
+        num_samples: Nombre total d'échantillons
+        num_threads: Nombre de workers (1 = un seul worker)
+        backend: "thread" ou "process" (ignoré si un pool est fourni)
+        seed: Graine maître (aléatoire si None, puis enregistrée)
+        kernel: Noyau ("python", "numpy", "integer" ou "auto")
+        chunk_size: Taille des blocs des noyaux vectorisés
+        sampling: "pseudo" ou "halton"
+        checkpoint_path: Fichier JSON du checkpoint
+        checkpoint_interval: Temps minimal entre deux écritures, en secondes
+        progress_interval: Échantillons entre deux publications de la
+                           progression d'un worker (granularité de la reprise)
+        pool: Pool persistant à réutiliser
+        callbacks: Rappels de télémétrie supplémentaires (ex: ProgressRenderer)
+        telemetry_interval: Temps entre deux lectures des cases, en secondes
+
+    Returns:
+        tuple: (valeur_de_pi, temps_d_exécution_de_cette_session_en_secondes)
+
+    Raises:
+        ValueError: Si un paramètre est invalide ou ne correspond pas au
+                    checkpoint existant
+    """
+    if num_samples <= 0:
+        raise ValueError(f"num_samples doit être > 0, reçu: {num_samples}")
+
+    if num_threads <= 0:
+        raise ValueError(f"num_threads doit être > 0, reçu: {num_threads}")
+
+    if backend not in BACKENDS:
+        raise ValueError(f"backend doit être parmi {BACKENDS}, reçu: {backend!r}")
+
+    if sampling not in SAMPLINGS:
+        raise ValueError(f"sampling doit être parmi {SAMPLINGS}, reçu: {sampling!r}")
+
+    if progress_interval <= 0:
+        raise ValueError(f"progress_interval doit être > 0, reçu: {progress_interval}")
+
+    kernel = resolve_kernel(kernel)
+
+    if os.path.exists(checkpoint_path):
+        checkpoint = load_checkpoint(checkpoint_path)
+        requested = {"num_samples": num_samples, "num_workers": num_threads,
+                     "kernel": kernel, "sampling": sampling}
+        if seed is not None:
+            requested["seed"] = resolve_seed(seed)
+        stored = {"num_samples": checkpoint.num_samples,
+                  "num_workers": len(checkpoint.workers), "kernel": checkpoint.kernel,
+                  "sampling": checkpoint.sampling, "seed": checkpoint.seed}
+        for name, value in requested.items():
+            if stored[name] != value:
+                raise ValueError(f"{checkpoint_path} décrit une autre simulation: "
+                                 f"{name}={stored[name]!r}, demandé: {value!r}")
+    else:
+        checkpoint = new_checkpoint(num_samples, num_threads, resolve_seed(seed), kernel,
+                                    sampling, chunk_size)
+
+    start_time = time.perf_counter()
+    final = _run_session(checkpoint, checkpoint_path, backend, pool, checkpoint_interval,
+                         progress_interval, callbacks, telemetry_interval)
+    execution_time = time.perf_counter() - start_time
+
+    return 4.0 * final.hits / final.num_samples, execution_time
+
+
+def resume_pi(checkpoint_path: str, backend: str = "thread",
+              checkpoint_interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+              progress_interval: int = DEFAULT_PROGRESS_INTERVAL,
+              pool: Optional[WorkerPool] = None,
+              callbacks: Sequence[TelemetryCallback] = (),
+              telemetry_interval: float = DEFAULT_TELEMETRY_INTERVAL) -> tuple[float, float]:
+    """
+    Reprend une simulation à partir de son checkpoint, avec ses paramètres.
+
+    Le backend peut différer de celui de la session interrompue: les comptes
+    ne dépendent que de la graine et des plages des workers.
+
+    Args:
+        checkpoint_path: Fichier JSON du checkpoint
+        backend: "thread" ou "process" (ignoré si un pool est fourni)
+        checkpoint_interval: Temps minimal entre deux écritures, en secondes
+        progress_interval: Échantillons entre deux publications de la progression
+        pool: Pool persistant à réutiliser
+        callbacks: Rappels de télémétrie supplémentaires
+        telemetry_interval: Temps entre deux lectures des cases, en secondes
+
+    Returns:
+        tuple: (valeur_de_pi, temps_d_exécution_de_cette_session_en_secondes)
+
+    Raises:
+        FileNotFoundError: Si le checkpoint n'existe pas
+    """
+    checkpoint = load_checkpoint(checkpoint_path)
+    return calculate_pi_checkpointed(checkpoint.num_samples, len(checkpoint.workers), backend,
+                                     checkpoint.seed, checkpoint.kernel, checkpoint.chunk_size,
+                                     checkpoint.sampling, checkpoint_path, checkpoint_interval,
+                                     progress_interval, pool, callbacks, telemetry_interval)
+
+
+if __name__ == "__main__":
+    # Test rapide du module: interruption simulée puis reprise
+    import tempfile
+
+    from src.monte_carlo_multi import calculate_pi_multi
+
+    print("=== Test des checkpoints ===\n")
+
+    num_samples = 20_000_000
+    reference, _ = calculate_pi_multi(num_samples, 4, kernel="numpy", seed=42)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "pi.ckpt.json")
+
+        # Session interrompue: seule la première moitié des parts est traitée
+        partial = new_checkpoint(num_samples, 4, 42, "numpy")
+        for worker in partial.workers:
+            worker.samples = worker.samples // 2
+        _run_session(partial, path, "thread", None, 0.1, DEFAULT_PROGRESS_INTERVAL, (), 0.1)
+        interrupted = load_checkpoint(path)
+        for worker, share in zip(interrupted.workers, split_samples(num_samples, 4)):
+            worker.samples = share
+        save_checkpoint(interrupted, path)
+        print(f"Checkpoint: {interrupted.samples_done:,} / {num_samples:,} échantillons, "
+              f"Pi partiel = {interrupted.pi_value:.8f}")
+
+        pi_value, exec_time = resume_pi(path, backend="process", checkpoint_interval=0.1)
+        print(f"Reprise:    Pi = {pi_value:.8f} en {exec_time:.4f}s")
+        print(f"Référence:  Pi = {reference:.8f} (identique: {pi_value == reference})")
@@ -0,0 +1,551 @@
+"""
+Ligne de commande non interactive (python -m src.cli)
+
+main.py est une démonstration commentée: explications, pause au clavier,
+graphiques. Pour des scripts et des traitements par lots, ce module expose
+quatre commandes sans interaction. Les trois premières écrivent leurs
+résultats en tableau, en JSON ou en CSV:
+
+- estimate:  une estimation de Pi par (taille, backend, graine)
+             (-n, -w, --backends, --cache, --checkpoint)
+- benchmark: une matrice de benchmark complète par graine
+             (-n, --runs, -w, --backends, --weak)
+- cluster:   une estimation répartie entre plusieurs machines, dont ce
+             processus est le coordinateur (-n, --listen HOST:PORT,
+             --local-nodes, --shard-size; voir src/cluster.py)
+- node:      un nœud de calcul qui rejoint un coordinateur et compte les
+             shards qu'il reçoit (HOST:PORT, -w, --backend, --name)
+
+Démarrage rapide: seuls les simulateurs sont importés pour une estimation.
+L'analyseur de performance (psutil, mesure CPU, statistiques) n'est importé
+que par la commande benchmark, et matplotlib jamais. Les messages des
+simulateurs et la progression du benchmark vont sur la sortie d'erreur: la
+sortie standard ne contient que les résultats.
+
+Avec --cache, les comptes par bloc sont réutilisés (voir src/block_cache.py):
+un balayage de tailles croissantes ne coûte que la plus grande, et avec un
+fichier (--cache PATH) les blocs servent aussi aux appels suivants.
+
+Avec --checkpoint PATH, une longue estimation enregistre régulièrement son
+état (voir src/checkpoint.py): relancer la même commande après une
+interruption reprend le calcul là où il s'était arrêté.
+
+Exemples:
+    python -m src.cli estimate -n 1e7 -w 4 --kernel numpy --seeds 1 2 3
+    python -m src.cli estimate -n 1e6 1e7 1e8 --kernel numpy --seeds 1 --cache results/block_cache
+    python -m src.cli estimate -n 1e11 -w 8 --backends process --kernel numpy --checkpoint pi.ckpt.json
+    python -m src.cli benchmark -n 1e6 --runs 3 --backends thread process --format csv
+    python -m src.cli cluster -n 1e10 --seeds 1 --listen 0.0.0.0:5555
+    python -m src.cli node coordinator-host:5555 -w 8 --backend process
+"""
+
+import argparse
+import contextlib
+import csv
+import itertools
+import json
+import math
+import os
+import sys
+from typing import List, Optional, Sequence, Tuple
+
+
+# Formats de sortie
+FORMATS = ("table", "json", "csv")
+
+# Colonnes de chaque commande et format d'affichage dans le tableau
+ESTIMATE_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("backend", ""),
+    ("workers", "d"),
+    ("kernel", ""),
+    ("sampling", ""),
+    ("seed", "d"),
+    ("samples", ",d"),
+    ("pi", ".8f"),
+    ("error", ".2e"),
+    ("time", ".4f"),
+)
+
+BENCHMARK_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("key", ""),
+    ("backend", ""),
+    ("workers", "d"),
+    ("kernel", ""),
+    ("sampling", ""),
+    ("scaling", ""),
+    ("seed", "d"),
+    ("samples", ",d"),
+    ("runs", "d"),
+    ("avg_time", ".4f"),
+    ("median_time", ".4f"),
+    ("std_time", ".4f"),
+    ("speedup", ".2f"),
+    ("efficiency", ".1%"),
+    ("pi", ".8f"),
+    ("error", ".2e"),
+    ("throughput", ".3g"),
+    ("parallelism", ".2f"),
+)
+
+
+def _count(value: str) -> int:
+    """
+    Convertit un argument en entier > 0 (accepte 1000000, 1_000_000 ou 1e6).
+
+    Raises:
+        argparse.ArgumentTypeError: Si la valeur n'est pas un entier > 0
+    """
+    try:
+        number = float(value) if "e" in value.lower() else int(value)
+    except ValueError:
+        number = None
+
+    if number is None or number != int(number) or number <= 0:
+        raise argparse.ArgumentTypeError(f"doit être un entier > 0, reçu: {value!r}")
+    return int(number)
+
+
+def _seed(value: str) -> int:
+    """
+    Convertit un argument en graine (entier >= 0).
+
+    Raises:
+        argparse.ArgumentTypeError: Si la valeur n'est pas un entier >= 0
+    """
+    try:
+        seed = int(value)
+    except ValueError:
+        seed = -1
+
+    if seed < 0:
+        raise argparse.ArgumentTypeError(f"doit être un entier >= 0, reçu: {value!r}")
+    return seed
+
+
+def _address(value: str) -> Tuple[str, int]:
+    """
+    Convertit un argument HOST:PORT en adresse (hôte, port).
+
+    Raises:
+        argparse.ArgumentTypeError: Si la valeur n'est pas de la forme HOST:PORT
+    """
+    host, _, port = value.rpartition(":")
+    if not host or not port.isdigit() or int(port) > 65535:
+        raise argparse.ArgumentTypeError(f"doit être de la forme HOST:PORT, reçu: {value!r}")
+    return host, int(port)
+
+
+def run_estimates(sample_sizes: Sequence[int], num_workers: int = 1,
+                  backends: Sequence[str] = ("thread",),
+                  seeds: Sequence[Optional[int]] = (None,),
+                  kernel: str = "python", sampling: str = "pseudo",
+                  cache=None) -> List[dict]:
+    """
+    Calcule une estimation de Pi par taille, par backend et par graine.
+
+    Avec un seul worker, le backend n'a pas d'effet: une seule estimation
+    (backend "mono") est faite par graine. Une graine None est tirée au hasard,
+    puis reportée dans le résultat pour que l'estimation soit reproductible.
+
+    Args:
+        sample_sizes: Nombres d'échantillons des estimations
+        num_workers: Nombre de workers (1 = mono-thread)
+        backends: Backends d'exécution multi-worker
+        seeds: Graines maîtres (None = aléatoire)
+        kernel: Noyau de calcul
+        sampling: "pseudo" ou "halton"
+        cache: BlockCache des comptes par bloc (None = tout est recalculé)
+
+    Returns:
+        list: Une ligne (dict) par estimation, colonnes de ESTIMATE_FIELDS
+    """
+    from src.monte_carlo_mono import calculate_pi_mono
+    from src.monte_carlo_multi import calculate_pi_multi, resolve_kernel
+    from src.seeding import resolve_seed
+
+    kernel = resolve_kernel(kernel)
+    seeds = [resolve_seed(seed) for seed in seeds]
+    rows = []
+
+    for backend, seed, num_samples in itertools.product(
+            backends if num_workers > 1 else ("mono",), seeds, sample_sizes):
+        if cache is not None:
+            # Import local: le cache n'est chargé qu'avec --cache
+            from src.block_cache import calculate_pi_cached
+
+            pi_value, exec_time = calculate_pi_cached(
+                num_samples, num_workers, "thread" if backend == "mono" else backend,
+                seed, kernel, cache=cache, sampling=sampling)
+        elif backend == "mono":
+            pi_value, exec_time = calculate_pi_mono(num_samples, kernel, seed=seed,
+                                                    sampling=sampling)
+        else:
+            pi_value, exec_time = calculate_pi_multi(num_samples, num_workers, backend,
+                                                     seed=seed, kernel=kernel,
+                                                     sampling=sampling)
+        rows.append(_estimate_row(backend, num_workers, kernel, sampling, seed,
+                                  num_samples, pi_value, exec_time))
+
+    return rows
+
+
+def run_checkpointed_estimate(num_samples: int, num_workers: int = 1, backend: str = "thread",
+                              seed: Optional[int] = None, kernel: str = "python",
+                              sampling: str = "pseudo",
+                              checkpoint_path: str = "pi.ckpt.json",
+                              checkpoint_interval: Optional[float] = None) -> dict:
+    """
+    Calcule une estimation de Pi avec checkpoints, ou reprend celle du fichier.
+
+    Args:
+        num_samples: Nombre d'échantillons
+        num_workers: Nombre de workers
+        backend: "thread" ou "process"
+        seed: Graine maître (None = aléatoire, ou celle du checkpoint existant)
+        kernel: Noyau de calcul
+        sampling: "pseudo" ou "halton"
+        checkpoint_path: Fichier JSON du checkpoint
+        checkpoint_interval: Temps minimal entre deux écritures, en secondes
+                             (None = DEFAULT_CHECKPOINT_INTERVAL)
+
+    Returns:
+        dict: Une ligne, colonnes de ESTIMATE_FIELDS (time = durée de cette session)
+    """
+    from src.checkpoint import (DEFAULT_CHECKPOINT_INTERVAL, calculate_pi_checkpointed,
+                                load_checkpoint)
+
+    if checkpoint_interval is None:
+        checkpoint_interval = DEFAULT_CHECKPOINT_INTERVAL
+
+    pi_value, exec_time = calculate_pi_checkpointed(
+        num_samples, num_workers, backend, seed, kernel, sampling=sampling,
+        checkpoint_path=checkpoint_path, checkpoint_interval=checkpoint_interval)
+
+    # Graine et noyau effectifs, tels qu'enregistrés
+    checkpoint = load_checkpoint(checkpoint_path)
+    return _estimate_row(backend if num_workers > 1 else "mono", num_workers,
+                         checkpoint.kernel, sampling, checkpoint.seed, num_samples,
+                         pi_value, exec_time)
+
+
+def run_cluster_estimate(num_samples: int, seed: Optional[int] = None, kernel: str = "numpy",
+                         sampling: str = "pseudo", listen: Tuple[str, int] = ("127.0.0.1", 0),
+                         local_nodes: int = 0, workers_per_node: int = 1,
+                         backend: str = "thread", shard_size: Optional[int] = None) -> dict:
+    """
+    Calcule une estimation répartie: coordinateur, et éventuellement des nœuds locaux.
+
+    Args:
+        num_samples: Nombre d'échantillons
+        seed: Graine maître (None = aléatoire)
+        kernel: Noyau de calcul des nœuds
+        sampling: "pseudo" ou "halton"
+        listen: Adresse d'écoute du coordinateur
+        local_nodes: Nombre de nœuds à démarrer sur cette machine
+        workers_per_node: Nombre de workers des nœuds locaux
+        backend: Backend des nœuds locaux
+        shard_size: Nombre d'échantillons par shard (None = DEFAULT_SHARD_SIZE)
+
+    Returns:
+        dict: Une ligne, colonnes de ESTIMATE_FIELDS (workers = nœuds ayant compté)
+    """
+    from src.cluster import DEFAULT_SHARD_SIZE, Coordinator, start_local_nodes
+
+    host, port = listen
+    with Coordinator(num_samples, seed, kernel, sampling=sampling,
+                     shard_size=shard_size or DEFAULT_SHARD_SIZE,
+                     host=host, port=port) as coordinator:
+        print(f"Coordinateur à l'écoute sur {coordinator.address[0]}:{coordinator.address[1]}")
+        nodes = start_local_nodes(coordinator.address, local_nodes, workers_per_node, backend)
+        try:
+            report = coordinator.run()
+        finally:
+            for node in nodes:
+                node.join()
+
+    print(f"Shards: {report.num_shards} | Réattribués: {report.reassigned}")
+    return _estimate_row("cluster", len(report.shards_per_node), coordinator.kernel, sampling,
+                         coordinator.seed, num_samples, report.pi_value, report.elapsed_time)
+
+
+def _estimate_row(backend: str, num_workers: int, kernel: str, sampling: str, seed: int,
+                  num_samples: int, pi_value: float, exec_time: float) -> dict:
+    """Ligne de résultat d'une estimation (colonnes de ESTIMATE_FIELDS)."""
+    return {
+        "backend": backend,
+        "workers": num_workers,
+        "kernel": kernel,
+        "sampling": sampling,
+        "seed": seed,
+        "samples": num_samples,
+        "pi": pi_value,
+        "error": abs(pi_value - math.pi),
+        "time": exec_time,
+    }
+
+
+def run_benchmarks(matrix, num_runs: int = 5,
+                   seeds: Sequence[Optional[int]] = (None,)) -> List[dict]:
+    """
+    Exécute une matrice de benchmark pour chaque graine.
+
+    Args:
+        matrix: BenchmarkMatrix à mesurer
+        num_runs: Nombre de runs par configuration
+        seeds: Graines maîtres du benchmark (None = runs non reproductibles)
+
+    Returns:
+        list: Une ligne (dict) par configuration et par graine, colonnes de
+              BENCHMARK_FIELDS
+    """
+    from src.performance_analyzer import run_benchmark_matrix
+
+    rows = []
+    for seed in seeds:
+        results = run_benchmark_matrix(matrix, num_runs=num_runs, seed=seed)
+        for key, result in results.items():
+            rows.append({
+                "key": key,
+                "backend": result.backend,
+                "workers": result.num_workers,
+                "kernel": result.kernel,
+                "sampling": result.sampling,
+                "scaling": result.scaling,
+                "seed": seed,
+                "samples": result.num_samples,
+                "runs": len(result.times),
+                "avg_time": result.avg_time,
+                "median_time": result.median_time,
+                "std_time": result.std_time,
+                "speedup": result.speedup,
+                "efficiency": result.efficiency,
+                "pi": result.avg_pi,
+                "error": result.pi_error,
+                "throughput": result.throughput,
+                "parallelism": result.effective_parallelism,
+            })
+
+    return rows
+
+
+def format_table(rows: List[dict], fields: Sequence[Tuple[str, str]]) -> str:
+    """
+    Met des lignes en forme de tableau texte aligné (sans décoration).
+
+    Args:
+        rows: Lignes à afficher
+        fields: Colonnes (nom, format) à afficher
+
+    Returns:
+        str: Tableau, une ligne de texte par ligne de résultat plus l'en-tête
+    """
+    names = [name for name, _ in fields]
+    cells = [[format(row[name], spec) if row[name] is not None else "-"
+              for name, spec in fields] for row in rows]
+    widths = [max([len(name)] + [len(line[i]) for line in cells])
+              for i, name in enumerate(names)]
+
+    lines = ["  ".join(name.ljust(width) for name, width in zip(names, widths))]
+    for line in cells:
+        # Texte aligné à gauche, nombres à droite
+        lines.append("  ".join(
+            cell.ljust(width) if not spec else cell.rjust(width)
+            for cell, width, (_, spec) in zip(line, widths, fields)))
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def write_rows(rows: List[dict], fields: Sequence[Tuple[str, str]], output_format: str,
+               stream=None):
+    """
+    Écrit des lignes de résultats dans le format demandé.
+
+    Args:
+        rows: Lignes à écrire
+        fields: Colonnes (nom, format du tableau)
+        output_format: "table", "json" ou "csv"
+        stream: Flux de sortie (défaut: sys.stdout)
+
+    Raises:
+        ValueError: Si le format est inconnu
+    """
+    stream = stream if stream is not None else sys.stdout
+
+    if output_format == "table":
+        stream.write(format_table(rows, fields) + "\n")
+    elif output_format == "json":
+        json.dump(rows, stream, indent=2)
+        stream.write("\n")
+    elif output_format == "csv":
+        writer = csv.DictWriter(stream, fieldnames=[name for name, _ in fields],
+                                lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        raise ValueError(f"output_format doit être parmi {FORMATS}, reçu: {output_format!r}")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Analyseur des arguments des commandes estimate, benchmark, cluster et node."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Estimations, benchmarks et estimations réparties Monte Carlo "
+                    "(coordinateur et nœuds), sans interaction",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # Options communes aux commandes estimate, benchmark et cluster
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--seeds", type=_seed, nargs="+", default=[None],
+                        help="Graines maîtres, un résultat par graine (défaut: aléatoire)")
+    common.add_argument("--kernel", default="python",
+                        help="Noyau: python, numpy, integer ou auto (défaut: python)")
+    common.add_argument("--sampling", default="pseudo",
+                        help="Échantillonnage: pseudo ou halton (défaut: pseudo)")
+    common.add_argument("--format", choices=FORMATS, default="table", dest="output_format",
+                        help="Format de sortie (défaut: table)")
+    common.add_argument("-q", "--quiet", action="store_true",
+                        help="Ne pas afficher la progression sur la sortie d'erreur")
+
+    estimate = commands.add_parser("estimate", parents=[common],
+                                   help="Estimer Pi (une estimation par backend et graine)")
+    estimate.add_argument("-n", "--samples", type=_count, nargs="+", default=[1_000_000],
+                          help="Tailles d'échantillon, une estimation par taille (défaut: 1e6)")
+    estimate.add_argument("-w", "--workers", type=_count, default=1,
+                          help="Nombre de workers (défaut: 1 = mono-thread)")
+    estimate.add_argument("--backends", nargs="+", default=["thread"],
+                          help="Backends multi-worker: thread, process (défaut: thread)")
+    estimate.add_argument("--cache", nargs="?", const="", default=None, metavar="PATH",
+                          help="Réutiliser les comptes par bloc (en mémoire, ou dans le "
+                               "fichier PATH pour les appels suivants)")
+    estimate.add_argument("--checkpoint", default=None, metavar="PATH",
+                          help="Enregistrer régulièrement l'état dans PATH, et reprendre "
+                               "s'il existe (une seule taille, graine et backend)")
+    estimate.add_argument("--checkpoint-interval", type=float, default=None, metavar="SEC",
+                          help="Temps minimal entre deux checkpoints (défaut: 30)")
+
+    benchmark = commands.add_parser("benchmark", parents=[common],
+                                    help="Mesurer une matrice de benchmark")
+    benchmark.add_argument("-n", "--samples", type=_count, nargs="+", default=[1_000_000],
+                           help="Tailles d'échantillon (défaut: 1e6)")
+    benchmark.add_argument("--runs", type=_count, default=5,
+                           help="Runs par configuration (défaut: 5)")
+    benchmark.add_argument("-w", "--workers", type=_count, nargs="+", default=None,
+                           help="Nombres de workers (défaut: puissances de 2 jusqu'aux cœurs)")
+    benchmark.add_argument("--backends", nargs="+", default=["thread"],
+                           help="Backends multi-worker: thread, process (défaut: thread)")
+    benchmark.add_argument("--weak", action="store_true",
+                           help="Scalabilité faible: échantillons par worker")
+
+    cluster = commands.add_parser("cluster", parents=[common],
+                                  help="Coordonner une estimation répartie entre des nœuds")
+    cluster.add_argument("-n", "--samples", type=_count, default=1_000_000,
+                         help="Nombre d'échantillons (défaut: 1e6)")
+    cluster.add_argument("--listen", type=_address, default=("127.0.0.1", 0),
+                         metavar="HOST:PORT",
+                         help="Adresse d'écoute (défaut: 127.0.0.1, port libre)")
+    cluster.add_argument("--local-nodes", type=int, default=0, metavar="K",
+                         help="Nœuds à démarrer sur cette machine (défaut: 0)")
+    cluster.add_argument("-w", "--workers", type=_count, default=1,
+                         help="Workers par nœud local (défaut: 1)")
+    cluster.add_argument("--backend", choices=("thread", "process"), default="thread",
+                         help="Backend des nœuds locaux (défaut: thread)")
+    cluster.add_argument("--shard-size", type=_count, default=None,
+                         help="Échantillons par shard (défaut: 64 blocs de flux)")
+
+    node = commands.add_parser("node", help="Rejoindre un coordinateur comme nœud de calcul")
+    node.add_argument("address", type=_address, metavar="HOST:PORT",
+                      help="Adresse du coordinateur")
+    node.add_argument("-w", "--workers", type=_count, default=1,
+                      help="Nombre de workers du nœud (défaut: 1 = mono-thread)")
+    node.add_argument("--backend", choices=("thread", "process"), default="thread",
+                      help="Backend des workers (défaut: thread)")
+    node.add_argument("--name", default=None, help="Nom du nœud (défaut: machine-PID)")
+
+    return parser
+
+
+def _run_estimate_command(args: argparse.Namespace) -> List[dict]:
+    """Commande estimate, avec ou sans cache des comptes par bloc ou checkpoints."""
+    if args.checkpoint is not None:
+        if len(args.samples) > 1 or len(args.seeds) > 1 or len(args.backends) > 1:
+            raise ValueError("--checkpoint nécessite une seule taille, une seule graine "
+                             "et un seul backend")
+        if args.cache is not None:
+            raise ValueError("--checkpoint et --cache ne peuvent pas être combinés")
+        return [run_checkpointed_estimate(args.samples[0], args.workers, args.backends[0],
+                                          args.seeds[0], args.kernel, args.sampling,
+                                          args.checkpoint, args.checkpoint_interval)]
+
+    if args.cache is None:
+        return run_estimates(args.samples, args.workers, args.backends, args.seeds,
+                             args.kernel, args.sampling)
+
+    from src.block_cache import BlockCache
+
+    # Tailles croissantes: chaque estimation prolonge la précédente
+    with BlockCache(spill_path=args.cache or None) as cache:
+        return run_estimates(sorted(args.samples), args.workers, args.backends, args.seeds,
+                             args.kernel, args.sampling, cache)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Point d'entrée en ligne de commande (python -m src.cli).
+
+    Returns:
+        int: Code de sortie (2 si un paramètre est invalide)
+    """
+    args = _build_parser().parse_args(argv)
+
+    if args.command == "node":
+        from src.cluster import run_node
+
+        try:
+            num_shards = run_node(args.address, args.workers, args.backend, args.name)
+        except (ValueError, OSError) as error:
+            print(f"❌ {error}", file=sys.stderr)
+            return 2
+        print(f"{num_shards} shards comptés", file=sys.stderr)
+        return 0
+
+    # Les messages des simulateurs ne doivent pas se mêler aux résultats
+    progress = open(os.devnull, "w") if args.quiet else sys.stderr
+
+    try:
+        with contextlib.redirect_stdout(progress):
+            if args.command == "estimate":
+                fields = ESTIMATE_FIELDS
+                rows = _run_estimate_command(args)
+            elif args.command == "cluster":
+                if len(args.seeds) > 1:
+                    raise ValueError("cluster nécessite une seule graine")
+                fields = ESTIMATE_FIELDS
+                rows = [run_cluster_estimate(args.samples, args.seeds[0], args.kernel,
+                                             args.sampling, args.listen, args.local_nodes,
+                                             args.workers, args.backend, args.shard_size)]
+            else:
+                from src.performance_analyzer import BenchmarkMatrix, default_worker_counts
+
+                fields = BENCHMARK_FIELDS
+                matrix = BenchmarkMatrix(
+                    worker_counts=args.workers or default_worker_counts(),
+                    sample_sizes=args.samples,
+                    backends=args.backends,
+                    kernels=(args.kernel,),
+                    samplings=(args.sampling,),
+                    scaling="weak" if args.weak else "strong",
+                )
+                rows = run_benchmarks(matrix, args.runs, args.seeds)
+    except ValueError as error:
+        print(f"❌ {error}", file=sys.stderr)
+        return 2
+    finally:
+        if args.quiet:
+            progress.close()
+
+    write_rows(rows, fields, args.output_format)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
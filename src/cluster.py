@@ -0,0 +1,513 @@
+"""
+Exécution répartie sur plusieurs machines (coordinateur et nœuds TCP)
+
+Une seule machine plafonne au nombre de ses cœurs. Ici, une estimation est
+répartie entre plusieurs nœuds (machines) reliés par TCP:
+
+- le coordinateur (Coordinator) découpe la plage [0, N) en shards, des
+  plages [start, start + n) du flux de la graine maître alignées sur les
+  blocs de flux, et les distribue aux nœuds connectés;
+- chaque nœud (run_node) compte les points d'un shard avec les backends
+  existants (mono-thread, threads ou processus) et renvoie son compte;
+- le coordinateur additionne les comptes.
+
+Les flux sont dérivés de la graine maître et de l'indice de bloc (voir
+src/seeding.py): le compte d'un shard ne dépend ni du nœud, ni de son
+backend, ni de son nombre de workers. Le résultat est donc identique à celui
+d'une estimation sur une seule machine avec la même graine et le même noyau.
+
+Tolérance aux pannes: un nœud qui se déconnecte (processus tué, réseau
+coupé) ou qui ne répond pas avant node_timeout secondes est abandonné, et
+son shard en cours est remis en tête de la file pour un autre nœud. Un
+shard n'est compté qu'une fois. Un nœud peut rejoindre le calcul à tout
+moment, y compris pour remplacer un nœud perdu. En revanche, une erreur de
+calcul signalée par un nœud (paramètre refusé, noyau indisponible) se
+reproduirait sur les autres nœuds: elle arrête l'estimation au lieu de faire
+tourner le shard indéfiniment.
+
+Protocole: un message JSON par ligne, dans les deux sens.
+
+    nœud -> coordinateur  {"type": "hello", "protocol": 1, "name": ..., "workers": ..., "backend": ...}
+    coordinateur -> nœud  {"type": "shard", "shard": i, "start": ..., "samples": ..., "seed": ...,
+                           "kernel": ..., "chunk_size": ..., "sampling": ...}
+    nœud -> coordinateur  {"type": "result", "shard": i, "inside": ...}
+                          ou {"type": "error", "shard": i, "message": ...}
+    coordinateur -> nœud  {"type": "done"}
+
+Le protocole n'est ni chiffré ni authentifié: le coordinateur écoute par
+défaut sur 127.0.0.1, et ne doit être ouvert que sur un réseau de confiance.
+
+Exemple sur une seule machine (des processus jouent le rôle des nœuds):
+    pi_value, exec_time = calculate_pi_cluster(100_000_000, num_nodes=4, seed=42)
+"""
+
+import json
+import multiprocessing
+import os
+import socket
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from src.kernels import DEFAULT_CHUNK_SIZE
+from src.monte_carlo_mono import count_inside_mono
+from src.monte_carlo_multi import BACKENDS, count_inside_multi, resolve_kernel
+from src.qmc import SAMPLINGS
+from src.seeding import STREAM_BLOCK_SIZE, iter_segments, resolve_seed
+from src.worker_pool import WorkerPool
+
+
+# Version du protocole (vérifiée à la connexion d'un nœud)
+PROTOCOL_VERSION = 1
+
+# Taille par défaut d'un shard (multiple de STREAM_BLOCK_SIZE): assez grande
+# pour que l'aller-retour réseau soit négligeable devant le calcul
+DEFAULT_SHARD_SIZE = 64 * STREAM_BLOCK_SIZE
+
+# Temps maximal pour traiter un shard avant d'abandonner le nœud, en secondes
+DEFAULT_NODE_TIMEOUT = 300.0
+
+Address = Tuple[str, int]
+
+
+def _send(connection: socket.socket, message: dict):
+    """Envoie un message (une ligne JSON)."""
+    connection.sendall((json.dumps(message) + "\n").encode("utf-8"))
+
+
+def _receive(stream) -> dict:
+    """
+    Lit le message suivant (une ligne JSON).
+
+    Raises:
+        ConnectionError: Si la connexion est fermée
+    """
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("connexion fermée par le pair")
+    return json.loads(line)
+
+
+@dataclass
+class ClusterReport:
+    """Résultat d'une estimation répartie."""
+    inside: int                  # Points dans le cercle (total)
+    num_samples: int             # Nombre total d'échantillons
+    num_shards: int              # Nombre de shards
+    reassigned: int = 0          # Shards remis dans la file après la perte d'un nœud
+    elapsed_time: float = 0.0    # Durée de l'estimation, en secondes
+    shards_per_node: Dict[str, int] = field(default_factory=dict)   # Shards comptés par nœud
+    samples_per_node: Dict[str, int] = field(default_factory=dict)  # Échantillons par nœud
+    lost_nodes: List[str] = field(default_factory=list)             # Nœuds abandonnés
+
+    @property
+    def pi_value(self) -> float:
+        """Estimation de Pi."""
+        return 4.0 * self.inside / self.num_samples
+
+
+class Coordinator:
+    """
+    Coordinateur: distribue les shards aux nœuds connectés et additionne les comptes.
+
+    Le socket d'écoute est ouvert dès la construction (port=0 choisit un port
+    libre, voir address); les nœuds peuvent se connecter avant run().
+
+    Exemple:
+        with Coordinator(10**9, seed=42, host="0.0.0.0", port=5555) as coordinator:
+            report = coordinator.run()
+    """
+
+    def __init__(self, num_samples: int, seed: Optional[int] = None, kernel: str = "numpy",
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, sampling: str = "pseudo",
+                 shard_size: int = DEFAULT_SHARD_SIZE, host: str = "127.0.0.1",
+                 port: int = 0, node_timeout: float = DEFAULT_NODE_TIMEOUT):
+        """
+        Args:
+            num_samples: Nombre total d'échantillons
+            seed: Graine maître (aléatoire si None)
+            kernel: Noyau de calcul des nœuds ("python", "numpy", "integer" ou "auto",
+                    résolu sur le coordinateur pour que tous les nœuds utilisent le même)
+            chunk_size: Taille des blocs des noyaux vectorisés
+            sampling: "pseudo" ou "halton"
+            shard_size: Nombre d'échantillons par shard
+            host: Adresse d'écoute
+            port: Port d'écoute (0 = port libre choisi par le système)
+            node_timeout: Temps maximal de traitement d'un shard, en secondes
+
+        Raises:
+            ValueError: Si un paramètre est invalide
+        """
+        if num_samples <= 0:
+            raise ValueError(f"num_samples doit être > 0, reçu: {num_samples}")
+
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size doit être > 0, reçu: {chunk_size}")
+
+        if sampling not in SAMPLINGS:
+            raise ValueError(f"sampling doit être parmi {SAMPLINGS}, reçu: {sampling!r}")
+
+        if shard_size <= 0:
+            raise ValueError(f"shard_size doit être > 0, reçu: {shard_size}")
+
+        if node_timeout <= 0:
+            raise ValueError(f"node_timeout doit être > 0, reçu: {node_timeout}")
+
+        self.num_samples = num_samples
+        self.seed = resolve_seed(seed)
+        self.kernel = resolve_kernel(kernel)
+        self.chunk_size = chunk_size
+        self.sampling = sampling
+        self.node_timeout = node_timeout
+        self.shards: List[Tuple[int, int]] = list(iter_segments(0, num_samples, shard_size))
+        self.report = ClusterReport(inside=0, num_samples=num_samples,
+                                    num_shards=len(self.shards))
+
+        self._pending = deque(range(len(self.shards)))
+        self._counts: Dict[int, int] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._failure: Optional[str] = None
+        self._handlers: List[threading.Thread] = []
+        self._server = socket.create_server((host, port))
+
+    @property
+    def address(self) -> Address:
+        """Adresse (hôte, port) à laquelle les nœuds se connectent."""
+        host, port = self._server.getsockname()[:2]
+        return host, port
+
+    @property
+    def complete(self) -> bool:
+        """True si tous les shards ont été comptés."""
+        return len(self._counts) == len(self.shards)
+
+    def _next_shard(self) -> Optional[int]:
+        """Prochain shard à traiter (attend si tous sont en cours), None à la fin."""
+        with self._condition:
+            while not self._pending and not self.complete and not self._closed \
+                    and self._failure is None:
+                self._condition.wait()
+            if not self._pending or self._closed or self._failure is not None:
+                return None
+            return self._pending.popleft()
+
+    def _complete_shard(self, shard: int, inside: int, node_name: str):
+        """Enregistre le compte d'un shard (une seule fois)."""
+        with self._condition:
+            if shard not in self._counts:
+                self._counts[shard] = inside
+                report = self.report
+                report.shards_per_node[node_name] = report.shards_per_node.get(node_name, 0) + 1
+                report.samples_per_node[node_name] = (report.samples_per_node.get(node_name, 0)
+                                                      + self.shards[shard][1])
+            self._condition.notify_all()
+
+    def _requeue(self, shard: int, node_name: str):
+        """Remet en tête de file le shard d'un nœud perdu."""
+        with self._condition:
+            self.report.lost_nodes.append(node_name)
+            if shard not in self._counts:
+                self._pending.appendleft(shard)
+                self.report.reassigned += 1
+            self._condition.notify_all()
+
+    def _fail(self, message: str):
+        """Arrête l'estimation après une erreur de calcul signalée par un nœud."""
+        with self._condition:
+            if self._failure is None:
+                self._failure = message
+            self._condition.notify_all()
+
+    def _serve_node(self, connection: socket.socket):
+        """Dialogue avec un nœud: lui envoie des shards jusqu'à la fin du calcul."""
+        connection.settimeout(self.node_timeout)
+        with connection, connection.makefile("r", encoding="utf-8") as stream:
+            try:
+                hello = _receive(stream)
+            except (OSError, ValueError):
+                return
+            if hello.get("type") != "hello" or hello.get("protocol") != PROTOCOL_VERSION:
+                return
+            node_name = str(hello.get("name", "node"))
+
+            while True:
+                shard = self._next_shard()
+                if shard is None:
+                    try:
+                        _send(connection, {"type": "done"})
+                    except OSError:
+                        pass
+                    return
+
+                start, samples = self.shards[shard]
+                try:
+                    _send(connection, {"type": "shard", "shard": shard, "start": start,
+                                       "samples": samples, "seed": self.seed,
+                                       "kernel": self.kernel, "chunk_size": self.chunk_size,
+                                       "sampling": self.sampling})
+                    result = _receive(stream)
+                    if result.get("type") == "error" and result.get("shard") == shard:
+                        self._fail(f"nœud {node_name}, shard {shard}: {result.get('message')}")
+                        return
+                    if result.get("type") != "result" or result.get("shard") != shard:
+                        raise ConnectionError(f"réponse inattendue: {result!r}")
+                    inside = int(result["inside"])
+                except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                    # Nœud mort, muet ou incohérent: son shard passe à un autre
+                    self._requeue(shard, node_name)
+                    return
+
+                self._complete_shard(shard, inside, node_name)
+
+    def _accept_nodes(self):
+        """Boucle d'acceptation des connexions (un thread par nœud)."""
+        while True:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                return  # Socket d'écoute fermé (close)
+            handler = threading.Thread(target=self._serve_node, args=(connection,),
+                                       name="cluster-node", daemon=True)
+            self._handlers.append(handler)
+            handler.start()
+
+    def run(self, timeout: Optional[float] = None) -> ClusterReport:
+        """
+        Distribue les shards et attend que tous soient comptés.
+
+        Args:
+            timeout: Durée maximale de l'estimation, en secondes (None = sans limite;
+                     sans nœud connecté, le coordinateur attend qu'un nœud arrive)
+
+        Returns:
+            ClusterReport: Total et répartition des shards entre les nœuds
+
+        Raises:
+            RuntimeError: Si des shards ne sont pas comptés avant le timeout, ou
+                          si un nœud signale une erreur de calcul
+        """
+        start_time = time.perf_counter()
+        acceptor = threading.Thread(target=self._accept_nodes, name="cluster-accept",
+                                    daemon=True)
+        acceptor.start()
+
+        try:
+            with self._condition:
+                finished = self._condition.wait_for(
+                    lambda: self.complete or self._failure is not None, timeout)
+                if self._failure is not None:
+                    raise RuntimeError(f"estimation interrompue: {self._failure}")
+                if not finished:
+                    raise RuntimeError(f"{len(self.shards) - len(self._counts)} shards "
+                                       f"non comptés après {timeout}s (nœuds perdus?)")
+        finally:
+            self.close()
+
+        # Les nœuds encore connectés reçoivent "done" et se déconnectent
+        for handler in list(self._handlers):
+            handler.join(timeout=1.0)
+
+        self.report.inside = sum(self._counts.values())
+        self.report.elapsed_time = time.perf_counter() - start_time
+        return self.report
+
+    def close(self):
+        """Ferme le socket d'écoute et libère les nœuds en attente."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._server.close()
+
+    def __enter__(self) -> "Coordinator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def run_node(address: Address, num_workers: int = 1, backend: str = "thread",
+             name: Optional[str] = None, connect_timeout: float = 10.0) -> int:
+    """
+    Nœud: se connecte au coordinateur et compte les shards qu'il reçoit.
+
+    Avec un seul worker, un shard est compté par count_inside_mono; sinon par
+    count_inside_multi, sur un pool persistant de num_workers threads ou
+    processus réutilisé d'un shard à l'autre.
+
+    Args:
+        address: Adresse (hôte, port) du coordinateur
+        num_workers: Nombre de workers du nœud
+        backend: "thread" ou "process" (si num_workers > 1)
+        name: Nom du nœud dans le rapport (défaut: machine-PID)
+        connect_timeout: Temps maximal de connexion, en secondes
+
+    Returns:
+        int: Nombre de shards comptés par ce nœud
+
+    Raises:
+        ValueError: Si num_workers <= 0 ou si le backend est inconnu
+        ConnectionError: Si le coordinateur ferme la connexion avant la fin
+    """
+    if num_workers <= 0:
+        raise ValueError(f"num_workers doit être > 0, reçu: {num_workers}")
+
+    if backend not in BACKENDS:
+        raise ValueError(f"backend doit être parmi {BACKENDS}, reçu: {backend!r}")
+
+    name = name or f"{socket.gethostname()}-{os.getpid()}"
+    pool = WorkerPool(backend, num_workers) if num_workers > 1 else None
+    num_shards = 0
+
+    try:
+        with socket.create_connection(address, timeout=connect_timeout) as connection, \
+                connection.makefile("r", encoding="utf-8") as stream:
+            # Un shard peut durer longtemps: pas de timeout pendant le calcul
+            connection.settimeout(None)
+            _send(connection, {"type": "hello", "protocol": PROTOCOL_VERSION, "name": name,
+                               "workers": num_workers, "backend": backend})
+
+            while True:
+                message = _receive(stream)
+                if message["type"] == "done":
+                    return num_shards
+
+                args = (message["samples"], message["seed"], message["kernel"],
+                        message["chunk_size"], message["start"], message["sampling"])
+                try:
+                    if pool is None:
+                        samples, seed, kernel, chunk_size, start, sampling = args
+                        inside = count_inside_mono(samples, kernel, chunk_size, seed, start,
+                                                   sampling)
+                    else:
+                        inside = _count_shard_multi(pool, *args)
+                except Exception as error:
+                    # Signalée au coordinateur: relancer le shard ailleurs échouerait aussi
+                    _send(connection, {"type": "error", "shard": message["shard"],
+                                       "message": f"{type(error).__name__}: {error}"})
+                    raise
+
+                _send(connection, {"type": "result", "shard": message["shard"],
+                                   "inside": inside})
+                num_shards += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def _count_shard_multi(pool: WorkerPool, samples: int, seed: int, kernel: str,
+                       chunk_size: int, start: int, sampling: str) -> int:
+    """Compte un shard avec les workers du pool du nœud."""
+    return count_inside_multi(samples, pool.num_workers, seed=seed, kernel=kernel,
+                              chunk_size=chunk_size, start=start, pool=pool,
+                              sampling=sampling)
+
+
+def start_local_nodes(address: Address, num_nodes: int, num_workers: int = 1,
+                      backend: str = "thread") -> List[multiprocessing.Process]:
+    """
+    Démarre des processus locaux qui jouent le rôle de nœuds.
+
+    Les processus ne sont pas des démons: un nœud "process" peut ainsi créer
+    ses propres processus workers.
+
+    Args:
+        address: Adresse du coordinateur
+        num_nodes: Nombre de nœuds
+        num_workers: Nombre de workers par nœud
+        backend: Backend des nœuds
+
+    Returns:
+        list: Processus des nœuds (déjà démarrés)
+    """
+    nodes = [multiprocessing.Process(target=run_node,
+                                     args=(address, num_workers, backend, f"node-{index}"),
+                                     name=f"node-{index}")
+             for index in range(num_nodes)]
+    for node in nodes:
+        node.start()
+    return nodes
+
+
+def calculate_pi_cluster(num_samples: int, num_nodes: int = 2, workers_per_node: int = 1,
+                         backend: str = "thread", seed: Optional[int] = None,
+                         kernel: str = "numpy", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         sampling: str = "pseudo", shard_size: int = DEFAULT_SHARD_SIZE,
+                         timeout: Optional[float] = None) -> tuple[float, float]:
+    """
+    Calcule Pi avec un coordinateur et des nœuds locaux (sur localhost).
+
+    Args:
+        num_samples: Nombre total d'échantillons
+        num_nodes: Nombre de nœuds (processus locaux)
+        workers_per_node: Nombre de workers de chaque nœud
+        backend: Backend des nœuds ("thread" ou "process")
+        seed: Graine maître (aléatoire si None)
+        kernel: Noyau de calcul
+        chunk_size: Taille des blocs des noyaux vectorisés
+        sampling: "pseudo" ou "halton"
+        shard_size: Nombre d'échantillons par shard
+        timeout: Durée maximale de l'estimation, en secondes
+
+    Returns:
+        tuple: (valeur_de_pi, temps_d_exécution_en_secondes)
+
+    Raises:
+        ValueError: Si num_nodes <= 0 ou si un paramètre est invalide
+    """
+    if num_nodes <= 0:
+        raise ValueError(f"num_nodes doit être > 0, reçu: {num_nodes}")
+
+    with Coordinator(num_samples, seed, kernel, chunk_size, sampling, shard_size) as coordinator:
+        # Nœuds démarrés avant les threads du coordinateur (fork sans threads)
+        nodes = start_local_nodes(coordinator.address, num_nodes, workers_per_node, backend)
+        try:
+            report = coordinator.run(timeout)
+        finally:
+            for node in nodes:
+                node.join(timeout=5.0)
+                if node.is_alive():
+                    node.terminate()
+
+    return report.pi_value, report.elapsed_time
+
+
+if __name__ == "__main__":
+    # Test rapide du module: 3 nœuds locaux, dont un tué en cours de calcul
+    from src.monte_carlo_mono import calculate_pi_mono
+
+    print("=== Test de l'exécution répartie ===\n")
+
+    num_samples = 40_000_000
+    reference, _ = calculate_pi_mono(num_samples, "numpy", seed=42)
+
+    with Coordinator(num_samples, seed=42, shard_size=16 * STREAM_BLOCK_SIZE) as coordinator:
+        nodes = start_local_nodes(coordinator.address, 3, num_workers=2)
+        runner = threading.Thread(target=lambda: coordinator.run(timeout=120))
+        runner.start()
+
+        # Panne simulée: node-0 est tué après son premier shard
+        while coordinator.report.shards_per_node.get("node-0", 0) == 0 \
+                and runner.is_alive():
+            time.sleep(0.01)
+        nodes[0].kill()
+
+        runner.join()
+        for node in nodes:
+            node.join()
+
+    report = coordinator.report
+    print(f"Shards: {report.num_shards} | Réattribués: {report.reassigned} | "
+          f"Nœuds perdus: {report.lost_nodes}")
+    for node_name, count in sorted(report.shards_per_node.items()):
+        print(f"  {node_name:<8} {count:>3} shards, "
+              f"{report.samples_per_node[node_name]:>12,} échantillons")
+    print(f"\nRéparti:     Pi = {report.pi_value:.8f} en {report.elapsed_time:.4f}s")
+    print(f"Mono-thread: Pi = {reference:.8f} (identique: {report.pi_value == reference})")
+
+    # Dernier shard plus petit que le nombre de workers du nœud
+    pi_value, _ = calculate_pi_cluster(3, num_nodes=1, workers_per_node=4, seed=1, timeout=60)
+    assert pi_value == calculate_pi_mono(3, "numpy", seed=1)[0]
+    print("Shard plus petit que le nombre de workers: OK")
@@ -0,0 +1,223 @@
+"""
+Mesure de l'utilisation CPU pendant une simulation
+
+Un seul psutil.cpu_percent à la fin du benchmark ne dit rien sur la
+simulation elle-même. CpuSampler mesure, pendant le run:
+
+- le temps CPU du processus (et de ses processus workers)
+- le temps CPU de chaque thread et de chaque processus worker
+- l'utilisation de chaque cœur du système
+
+Le parallélisme effectif = secondes CPU ÷ secondes réelles montre directement
+la sérialisation par le GIL: 4 threads en Python pur restent proches de 1.0,
+alors que 4 threads NumPy (ou 4 processus) approchent 4.0.
+
+Les temps CPU totaux viennent de deux relevés (début et fin). Un thread de
+surveillance relève en plus, à intervalle régulier, les compteurs de chaque
+thread et de chaque processus enfant: ceux qui se terminent avant la fin du
+run gardent ainsi leur dernier relevé.
+
+Les compteurs CPU du noyau ont une résolution d'environ 10 ms: pour des runs
+de quelques millisecondes, le parallélisme mesuré n'est qu'approximatif.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import psutil
+
+
+# Intervalle par défaut entre deux relevés des threads et processus enfants
+DEFAULT_SAMPLING_INTERVAL = 0.05
+
+
+@dataclass
+class CpuUsageReport:
+    """Utilisation CPU mesurée pendant un run."""
+    wall_time: float                    # Temps réel écoulé, en secondes
+    cpu_time: float                     # Temps CPU du processus et de ses workers
+    worker_cpu_times: Dict[str, float] = field(default_factory=dict)  # Par thread / processus
+    core_utilization: List[float] = field(default_factory=list)       # % par cœur (système)
+
+    @property
+    def effective_parallelism(self) -> float:
+        """Nombre moyen de cœurs occupés: secondes CPU ÷ secondes réelles."""
+        if self.wall_time <= 0:
+            return 0.0
+        return self.cpu_time / self.wall_time
+
+    @property
+    def cpu_usage(self) -> float:
+        """Utilisation CPU en % d'un cœur (convention psutil: 200% = 2 cœurs pleins)."""
+        return 100.0 * self.effective_parallelism
+
+
+def _busy_fraction(start, end) -> float:
+    """Fraction du temps où un cœur n'était pas inactif entre deux relevés."""
+    total = sum(end) - sum(start)
+    if total <= 0:
+        return 0.0
+    idle = (end.idle - start.idle) + (getattr(end, "iowait", 0.0) - getattr(start, "iowait", 0.0))
+    return max(0.0, min(1.0, 1.0 - idle / total))
+
+
+class CpuSampler:
+    """
+    Relève l'utilisation CPU pendant l'exécution d'un bloc de code.
+
+    Exemple:
+        with CpuSampler() as sampler:
+            calculate_pi_multi(10_000_000, 4)
+        print(sampler.report.effective_parallelism)
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLING_INTERVAL):
+        """
+        Args:
+            interval: Temps entre deux relevés des threads et processus enfants,
+                      en secondes
+
+        Raises:
+            ValueError: Si interval <= 0
+        """
+        if interval <= 0:
+            raise ValueError(f"interval doit être > 0, reçu: {interval}")
+
+        self.interval = interval
+        self.report: Optional[CpuUsageReport] = None
+
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._sampler_thread_id: Optional[int] = None
+
+        self._start_wall = 0.0
+        self._start_cpu = None
+        self._start_cores = None
+        self._thread_start: Dict[int, float] = {}
+        self._thread_last: Dict[int, float] = {}
+        self._child_start: Dict[int, float] = {}
+        self._child_last: Dict[int, float] = {}
+        self._child_seen: Dict[int, float] = {}
+
+    def _read_workers(self) -> tuple:
+        """Compteurs CPU cumulés des threads du processus et des processus enfants."""
+        threads = {thread.id: thread.user_time + thread.system_time
+                   for thread in self._process.threads()}
+
+        children = {}
+        for child in self._process.children(recursive=True):
+            try:
+                times = child.cpu_times()
+            except psutil.NoSuchProcess:
+                continue
+            children[child.pid] = times.user + times.system
+
+        return threads, children
+
+    def _sample(self):
+        """Met à jour le dernier relevé de chaque thread et processus enfant."""
+        threads, children = self._read_workers()
+        self._thread_last.update(threads)
+        # Les processus terminés sortent du relevé: leur temps est alors compté
+        # dans children_user / children_system du processus parent (leur dernier
+        # relevé reste affiché par worker)
+        self._child_last = children
+        self._child_seen.update(children)
+
+    def _run(self):
+        """Boucle du thread de surveillance."""
+        self._sampler_thread_id = threading.get_native_id()
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        """Prend les relevés de départ et démarre la surveillance."""
+        self._thread_start, self._child_start = self._read_workers()
+        self._thread_last = dict(self._thread_start)
+        self._child_last = dict(self._child_start)
+        self._child_seen = dict(self._child_start)
+        self._start_cores = psutil.cpu_times(percpu=True)
+        self._start_cpu = self._process.cpu_times()
+        self._start_wall = time.perf_counter()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cpu-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> CpuUsageReport:
+        """
+        Arrête la surveillance et calcule l'utilisation CPU du run.
+
+        Returns:
+            CpuUsageReport: Temps CPU, temps par worker et utilisation par cœur
+        """
+        wall_time = time.perf_counter() - self._start_wall
+        end_cpu = self._process.cpu_times()
+        end_cores = psutil.cpu_times(percpu=True)
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._sample()
+
+        # Threads du processus (sans le thread de surveillance lui-même)
+        worker_cpu_times = {}
+        sampler_time = 0.0
+        for thread_id, last in self._thread_last.items():
+            delta = last - self._thread_start.get(thread_id, 0.0)
+            if thread_id == self._sampler_thread_id:
+                sampler_time = delta
+            elif delta > 0:
+                worker_cpu_times[f"thread {thread_id}"] = delta
+
+        # Processus workers: seuls ceux encore vivants s'ajoutent au total
+        # (les autres sont déjà dans children_*)
+        children_time = sum(last - self._child_start.get(pid, 0.0)
+                            for pid, last in self._child_last.items())
+        for pid, last in self._child_seen.items():
+            delta = last - self._child_start.get(pid, 0.0)
+            if delta > 0:
+                worker_cpu_times[f"process {pid}"] = delta
+
+        own_time = (end_cpu.user - self._start_cpu.user) + (end_cpu.system - self._start_cpu.system)
+        reaped_time = ((end_cpu.children_user - self._start_cpu.children_user)
+                       + (end_cpu.children_system - self._start_cpu.children_system))
+
+        self.report = CpuUsageReport(
+            wall_time=wall_time,
+            cpu_time=max(own_time - sampler_time, 0.0) + reaped_time + children_time,
+            worker_cpu_times=worker_cpu_times,
+            core_utilization=[100.0 * _busy_fraction(start, end)
+                              for start, end in zip(self._start_cores, end_cores)],
+        )
+        return self.report
+
+    def __enter__(self) -> "CpuSampler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+if __name__ == "__main__":
+    # Test rapide du module
+    from src.monte_carlo_multi import calculate_pi_multi
+
+    print("=== Test de la mesure CPU ===\n")
+
+    for backend, kernel in (("thread", "python"), ("thread", "numpy"), ("process", "python")):
+        with CpuSampler() as sampler:
+            pi_value, exec_time = calculate_pi_multi(2_000_000, 4, backend, kernel=kernel, seed=42)
+        report = sampler.report
+
+        print(f"{backend:<8} {kernel:<7} Pi = {pi_value:.6f} en {exec_time:.4f}s")
+        print(f"  Parallélisme effectif: {report.effective_parallelism:.2f} "
+              f"({report.cpu_usage:.0f}% CPU)")
+        for name, cpu_time in sorted(report.worker_cpu_times.items()):
+            print(f"  {name:<18} {cpu_time:.3f}s CPU")
+        cores = " ".join(f"{usage:.0f}%" for usage in report.core_utilization)
+        print(f"  Cœurs: {cores}\n")
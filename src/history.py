@@ -0,0 +1,426 @@
+"""
+Historique persistant des benchmarks et détection de régressions
+
+run_benchmark renvoie des BenchmarkResults qui disparaissent à la fin du
+programme. Ce module les enregistre dans un fichier JSON Lines (une ligne par
+benchmark, ajout seulement, jamais de réécriture) avec les métadonnées de la
+machine et les paramètres du benchmark (backend, nombre d'échantillons, graine).
+
+On peut ensuite comparer un benchmark à une référence (baseline):
+
+    python -m src.history list
+    python -m src.history compare <id_référence> <id_candidat>
+    python -m src.history compare latest~1 latest
+
+Une configuration est signalée en régression si son temps moyen augmente
+(ou son speedup baisse) de façon statistiquement significative: test de
+permutation unilatéral sur les temps des runs, sans hypothèse de normalité,
+et variation relative d'au moins min_change (pour ignorer les écarts minimes).
+Avec n runs par configuration, la plus petite p-valeur possible est
+1 / C(2n, n): il faut au moins 4 runs pour descendre sous 5 %.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import secrets
+import socket
+import statistics
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import psutil
+
+from src.monte_carlo_multi import is_gil_enabled
+from src.performance_analyzer import BenchmarkResults
+
+
+# Fichier d'historique par défaut (à côté des graphiques générés)
+DEFAULT_HISTORY_PATH = os.path.join("results", "benchmark_history.jsonl")
+
+# Seuil de significativité du test de permutation
+DEFAULT_ALPHA = 0.05
+
+# Variation relative minimale pour signaler une régression (5 %)
+DEFAULT_MIN_CHANGE = 0.05
+
+# Au-delà de ce nombre de permutations, le test est fait par tirages aléatoires
+MAX_EXACT_PERMUTATIONS = 20_000
+
+
+@dataclass
+class Comparison:
+    """Comparaison d'une métrique entre la référence et le candidat."""
+    configuration: str           # Clé de la configuration (ex: "multi_4")
+    metric: str                  # "avg_time" ou "speedup"
+    baseline: float              # Valeur de référence
+    candidate: float             # Valeur du candidat
+    change: float                # Variation relative (positive = plus lent / moins rapide)
+    p_value: float               # p-valeur du test de permutation unilatéral
+    regression: bool             # True si la dégradation est significative
+
+
+def machine_metadata() -> dict:
+    """
+    Décrit la machine et l'interpréteur qui exécutent le benchmark.
+
+    Returns:
+        dict: Nom d'hôte, système, processeur, cœurs, mémoire, versions
+    """
+    return {
+        "hostname": socket.gethostname(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count() or 1,
+        "memory_bytes": psutil.virtual_memory().total,
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "gil_enabled": is_gil_enabled(),
+        "numpy_version": np.__version__,
+    }
+
+
+def record_benchmark(results: Dict[str, BenchmarkResults], num_samples: int,
+                     num_runs: int, backend: str = "thread",
+                     seed: Optional[int] = None,
+                     path: str = DEFAULT_HISTORY_PATH,
+                     label: Optional[str] = None, **parameters) -> str:
+    """
+    Ajoute un benchmark à la fin du fichier d'historique.
+
+    Args:
+        results: Résultats renvoyés par run_benchmark
+        num_samples: Nombre d'échantillons par simulation
+        num_runs: Nombre de runs par configuration
+        backend: Backend d'exécution multi-worker
+        seed: Graine maître du benchmark (None = non reproductible)
+        path: Fichier JSON Lines de l'historique
+        label: Nom libre (ex: numéro de version)
+        **parameters: Autres paramètres de run_benchmark à conserver
+
+    Returns:
+        str: Identifiant du benchmark enregistré
+    """
+    now = datetime.now(timezone.utc)
+    run_id = f"{now:%Y%m%d-%H%M%S}-{secrets.token_hex(3)}"
+
+    entry = {
+        "id": run_id,
+        "timestamp": now.isoformat(),
+        "label": label,
+        "machine": machine_metadata(),
+        "parameters": {
+            "num_samples": num_samples,
+            "num_runs": num_runs,
+            "backend": backend,
+            "seed": seed,
+            **parameters,
+        },
+        "results": {key: asdict(result) for key, result in results.items()},
+    }
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # Une ligne par benchmark, en mode ajout: l'historique n'est jamais réécrit
+    with open(path, "a", encoding="utf-8") as history_file:
+        history_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    return run_id
+
+
+def load_history(path: str = DEFAULT_HISTORY_PATH) -> List[dict]:
+    """
+    Lit tous les benchmarks enregistrés, du plus ancien au plus récent.
+
+    Args:
+        path: Fichier JSON Lines de l'historique
+
+    Returns:
+        list: Entrées de l'historique (liste vide si le fichier n'existe pas)
+    """
+    if not os.path.exists(path):
+        return []
+
+    with open(path, encoding="utf-8") as history_file:
+        return [json.loads(line) for line in history_file if line.strip()]
+
+
+def find_entry(history: List[dict], reference: str) -> dict:
+    """
+    Retrouve un benchmark par identifiant, label ou position.
+
+    Références acceptées: un identifiant (ou son début), un label,
+    "latest" (le plus récent) ou "latest~N" (N benchmarks avant le plus récent).
+
+    Args:
+        history: Entrées renvoyées par load_history
+        reference: Référence du benchmark
+
+    Returns:
+        dict: Entrée correspondante
+
+    Raises:
+        KeyError: Si aucun benchmark ne correspond
+    """
+    if reference == "latest" or reference.startswith("latest~"):
+        offset = int(reference.partition("~")[2] or 0)
+        if offset < len(history):
+            return history[-1 - offset]
+    else:
+        # Le plus récent d'abord: un label réutilisé désigne sa dernière occurrence
+        for entry in reversed(history):
+            if entry["id"].startswith(reference) or entry.get("label") == reference:
+                return entry
+
+    raise KeyError(f"Benchmark introuvable dans l'historique: {reference!r}")
+
+
+def permutation_p_value(baseline: Sequence[float], candidate: Sequence[float],
+                        seed: int = 0) -> float:
+    """
+    Test de permutation unilatéral: le candidat a-t-il une moyenne plus grande?
+
+    Sous l'hypothèse nulle (aucune différence), les étiquettes
+    référence/candidat sont interchangeables: la p-valeur est la proportion
+    des répartitions dont l'écart des moyennes est au moins celui observé.
+
+    Args:
+        baseline: Mesures de référence
+        candidate: Mesures du candidat
+        seed: Graine des tirages quand le test exact est trop coûteux
+
+    Returns:
+        float: p-valeur (petite = le candidat est significativement plus grand)
+    """
+    pooled = list(baseline) + list(candidate)
+    n_candidate = len(candidate)
+    observed = statistics.mean(candidate) - statistics.mean(baseline)
+    total = sum(pooled)
+
+    def difference(candidate_indices) -> float:
+        candidate_sum = sum(pooled[i] for i in candidate_indices)
+        return (candidate_sum / n_candidate
+                - (total - candidate_sum) / (len(pooled) - n_candidate))
+
+    indices = range(len(pooled))
+    num_combinations = _binomial(len(pooled), n_candidate)
+
+    if num_combinations <= MAX_EXACT_PERMUTATIONS:
+        # Test exact: toutes les répartitions possibles
+        splits = itertools.combinations(indices, n_candidate)
+        count = num_combinations
+    else:
+        rng = random.Random(seed)
+        splits = (rng.sample(indices, n_candidate) for _ in range(MAX_EXACT_PERMUTATIONS))
+        count = MAX_EXACT_PERMUTATIONS
+
+    # Petite tolérance: les écarts égaux à l'écart observé comptent
+    extreme = sum(1 for split in splits if difference(split) >= observed - 1e-12)
+    if num_combinations <= MAX_EXACT_PERMUTATIONS:
+        return extreme / count
+    # Tirages: la répartition observée compte aussi, sinon p peut valoir 0
+    return (extreme + 1) / (count + 1)
+
+
+def _binomial(n: int, k: int) -> int:
+    """Coefficient binomial C(n, k)."""
+    result = 1
+    for i in range(1, k + 1):
+        result = result * (n - k + i) // i
+    return result
+
+
+def _run_speedups(entry: dict, key: str) -> List[float]:
+    """
+    Speedup de chaque run d'une configuration.
+
+    Avec un nombre fixe de runs, le run i du mono et du multi utilise la
+    même graine: les temps sont appariés run par run. Avec une mesure
+    rigoureuse (time_ci_low renseigné), le nombre de runs est adaptatif et
+    remove_outliers a écarté des runs différents de chaque liste: les paires
+    ne correspondraient plus, et chaque run multi est alors rapporté au temps
+    médian du mono.
+
+    Args:
+        entry: Entrée de l'historique
+        key: Clé de la configuration multi-worker
+
+    Returns:
+        list: Speedup de chaque run multi (vide si pas de mono associé)
+    """
+    results = entry["results"]
+    mono_key = results[key].get("baseline")
+    if mono_key not in results:
+        return []
+
+    mono_result, multi_result = results[mono_key], results[key]
+    mono_times = mono_result["times"]
+    multi_times = multi_result["times"]
+
+    paired = (mono_result.get("time_ci_low") is None
+              and multi_result.get("time_ci_low") is None
+              and len(mono_times) == len(multi_times))
+    if paired:
+        return [mono / multi for mono, multi in zip(mono_times, multi_times) if multi > 0]
+
+    mono_median = statistics.median(mono_times)
+    return [mono_median / multi for multi in multi_times if multi > 0]
+
+
+def compare_entries(baseline: dict, candidate: dict, alpha: float = DEFAULT_ALPHA,
+                    min_change: float = DEFAULT_MIN_CHANGE) -> List[Comparison]:
+    """
+    Compare les configurations communes à deux benchmarks.
+
+    Pour chaque configuration: temps moyen (régression = plus lent) et, pour
+    les configurations multi-worker, speedup (régression = moins rapide).
+
+    Args:
+        baseline: Benchmark de référence
+        candidate: Benchmark à évaluer
+        alpha: Seuil de significativité du test de permutation
+        min_change: Variation relative minimale pour signaler une régression
+
+    Returns:
+        list: Une Comparison par configuration et par métrique
+    """
+    comparisons = []
+
+    for key, candidate_result in candidate["results"].items():
+        if key not in baseline["results"]:
+            continue
+        baseline_result = baseline["results"][key]
+
+        # Temps: une hausse est une dégradation
+        baseline_times = baseline_result["times"]
+        candidate_times = candidate_result["times"]
+        change = candidate_result["avg_time"] / baseline_result["avg_time"] - 1.0
+        p_value = permutation_p_value(baseline_times, candidate_times)
+        comparisons.append(Comparison(
+            configuration=key,
+            metric="avg_time",
+            baseline=baseline_result["avg_time"],
+            candidate=candidate_result["avg_time"],
+            change=change,
+            p_value=p_value,
+            regression=p_value < alpha and change >= min_change,
+        ))
+
+        if candidate_result.get("baseline") is None:
+            continue
+
+        # Speedup: une baisse est une dégradation (test sur les valeurs opposées)
+        baseline_speedups = _run_speedups(baseline, key)
+        candidate_speedups = _run_speedups(candidate, key)
+        if not baseline_speedups or not candidate_speedups:
+            continue
+
+        change = 1.0 - candidate_result["speedup"] / baseline_result["speedup"]
+        p_value = permutation_p_value([-s for s in baseline_speedups],
+                                      [-s for s in candidate_speedups])
+        comparisons.append(Comparison(
+            configuration=key,
+            metric="speedup",
+            baseline=baseline_result["speedup"],
+            candidate=candidate_result["speedup"],
+            change=change,
+            p_value=p_value,
+            regression=p_value < alpha and change >= min_change,
+        ))
+
+    return comparisons
+
+
+def display_comparison(baseline: dict, candidate: dict, comparisons: List[Comparison]):
+    """
+    Affiche un tableau de comparaison entre deux benchmarks.
+
+    Args:
+        baseline: Benchmark de référence
+        candidate: Benchmark évalué
+        comparisons: Résultat de compare_entries
+    """
+    print("\n" + "=" * 80)
+    print(f"🔍 COMPARAISON: {baseline['id']} → {candidate['id']}")
+    print("=" * 80)
+
+    print(f"{'Configuration':<22} {'Métrique':<10} {'Référence':>11} {'Candidat':>11} "
+          f"{'Variation':>10} {'p':>7}")
+    print("-" * 80)
+
+    for c in comparisons:
+        flag = "  ❌ RÉGRESSION" if c.regression else ""
+        print(f"{c.configuration:<22} {c.metric:<10} {c.baseline:>11.4f} {c.candidate:>11.4f} "
+              f"{c.change:>+10.1%} {c.p_value:>7.3f}{flag}")
+
+    print("=" * 80)
+
+    regressions = [c for c in comparisons if c.regression]
+    if regressions:
+        print(f"❌ {len(regressions)} régression(s) significative(s) détectée(s)\n")
+    else:
+        print("✅ Aucune régression significative\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Point d'entrée en ligne de commande (python -m src.history).
+
+    Returns:
+        int: Code de sortie (1 si une régression est détectée)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.history",
+        description="Historique des benchmarks et détection de régressions",
+    )
+    parser.add_argument("--path", default=DEFAULT_HISTORY_PATH,
+                        help="Fichier d'historique JSON Lines")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="Lister les benchmarks enregistrés")
+
+    compare = commands.add_parser("compare", help="Comparer un benchmark à une référence")
+    compare.add_argument("baseline", help="Référence: identifiant, label, latest~N")
+    compare.add_argument("candidate", nargs="?", default="latest",
+                         help="Benchmark à évaluer (défaut: latest)")
+    compare.add_argument("--alpha", type=float, default=DEFAULT_ALPHA,
+                         help="Seuil de significativité")
+    compare.add_argument("--min-change", type=float, default=DEFAULT_MIN_CHANGE,
+                         help="Variation relative minimale (0.05 = 5 %%)")
+
+    args = parser.parse_args(argv)
+    history = load_history(args.path)
+
+    if args.command == "list":
+        if not history:
+            print(f"Aucun benchmark dans {args.path}")
+        for entry in history:
+            params = entry["parameters"]
+            print(f"{entry['id']}  {entry.get('label') or '-':<12} "
+                  f"{params['backend']:<8} {params['num_samples']:>12,} éch. "
+                  f"× {params['num_runs']} runs  seed={params['seed']}  "
+                  f"({entry['machine']['hostname']})")
+        return 0
+
+    try:
+        baseline = find_entry(history, args.baseline)
+        candidate = find_entry(history, args.candidate)
+    except KeyError as error:
+        print(f"❌ {error.args[0]}")
+        return 2
+
+    comparisons = compare_entries(baseline, candidate, args.alpha, args.min_change)
+    display_comparison(baseline, candidate, comparisons)
+    return 1 if any(c.regression for c in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,352 @@
+"""
+Moteur générique d'intégration Monte Carlo
+
+Le calcul de Pi n'est qu'un cas particulier: la proportion de points du
+carré [-1, 1]² qui tombent dans le cercle est l'intégrale de l'indicatrice
+du disque, divisée par l'aire du carré. Ce module généralise la méthode à
+toute fonction vectorisée f sur une boîte de dimension d:
+
+    ∫ f(x) dx ≈ volume(boîte) × moyenne(f(x_i)),   x_i uniformes dans la boîte
+
+Exemples:
+- volume de la boule unité en dimension d (indicatrice de la boule)
+- intégrale d'une fonction fournie par l'utilisateur sur [a, b]^d
+
+Comme les noyaux de Pi, le moteur traite une plage d'échantillons
+[start, start + n) du flux de la graine maître, par blocs de taille bornée,
+et la réduit à des sommes (n, Σf, Σf²) qui s'additionnent entre workers:
+le résultat est le même en mono-thread, avec des threads ou des processus.
+
+L'intégrande doit accepter un tableau (n, d) et renvoyer un tableau (n,).
+Pour le backend "process", il doit aussi être picklable (fonction définie au
+niveau d'un module).
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.seeding import block_generator, iter_blocks, resolve_seed
+from src.worker_pool import WorkerPool
+
+
+# Taille par défaut d'un bloc de points.
+# 65 536 points × 2 coordonnées × 8 octets = 1 Mo par bloc en dimension 2: la
+# mémoire reste bornée par la taille du bloc, quel que soit le nombre total
+# d'échantillons.
+DEFAULT_CHUNK_SIZE = 65_536
+
+# Backends d'exécution du moteur: "mono" = thread courant
+ENGINE_BACKENDS = ("mono", "thread", "process")
+
+# Intégrande vectorisé: tableau (n, d) → tableau (n,)
+Integrand = Callable[[np.ndarray], np.ndarray]
+
+# Borne d'un domaine: une valeur pour tous les axes, ou une valeur par axe
+Bound = Union[float, Sequence[float]]
+
+
+@dataclass
+class IntegrationResult:
+    """Résultat d'une intégration Monte Carlo."""
+    value: float                 # Estimation de l'intégrale
+    std_error: float             # Erreur standard de l'estimation
+    num_samples: int             # Nombre de points utilisés
+    dimension: int               # Dimension du domaine
+    execution_time: float        # Temps en secondes
+
+
+def unit_ball_indicator(points: np.ndarray) -> np.ndarray:
+    """
+    Indicatrice de la boule unité: x₁² + ... + x_d² ≤ 1.
+
+    En dimension 2, c'est le test du cercle utilisé pour calculer Pi.
+
+    Args:
+        points: Tableau (n, d) de points
+
+    Returns:
+        ndarray: Tableau (n,) de booléens, True si le point est dans la boule
+    """
+    # Somme des carrés colonne par colonne: plus rapide que sum(axis=1)
+    # quand les lignes sont courtes (d = 2 ou 3)
+    squared_norm = points[:, 0] * points[:, 0]
+    for axis in range(1, points.shape[1]):
+        column = points[:, axis]
+        squared_norm += column * column
+    return squared_norm <= 1.0
+
+
+def ball_volume(dimension: int) -> float:
+    """
+    Volume exact de la boule unité en dimension d: π^(d/2) / Γ(d/2 + 1).
+
+    Args:
+        dimension: Dimension de l'espace
+
+    Returns:
+        float: Volume de la boule unité
+    """
+    return math.pi ** (dimension / 2) / math.gamma(dimension / 2 + 1)
+
+
+def box_bounds(dimension: int, lower: Bound = 0.0,
+               upper: Bound = 1.0) -> tuple:
+    """
+    Construit les bornes d'une boîte [lower, upper]^d.
+
+    Args:
+        dimension: Dimension du domaine
+        lower: Borne inférieure (commune ou par axe)
+        upper: Borne supérieure (commune ou par axe)
+
+    Returns:
+        tuple: (bornes_inférieures, bornes_supérieures), tableaux de taille d
+
+    Raises:
+        ValueError: Si dimension <= 0, si les tailles ne correspondent pas
+                    ou si une borne inférieure n'est pas < à la supérieure
+    """
+    if dimension <= 0:
+        raise ValueError(f"dimension doit être > 0, reçu: {dimension}")
+
+    low = np.asarray(lower, dtype=np.float64)
+    high = np.asarray(upper, dtype=np.float64)
+
+    # Une borne commune s'applique à tous les axes
+    if low.ndim == 0:
+        low = np.full(dimension, float(low))
+    if high.ndim == 0:
+        high = np.full(dimension, float(high))
+
+    if low.shape != (dimension,) or high.shape != (dimension,):
+        raise ValueError(f"les bornes doivent avoir {dimension} valeurs, "
+                         f"reçu: {low.size} et {high.size}")
+
+    if np.any(low >= high):
+        raise ValueError("chaque borne inférieure doit être < à la borne supérieure")
+
+    return low, high
+
+
+def iter_integrand_sums(integrand: Integrand, num_samples: int, lower: np.ndarray,
+                        upper: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        seed: Optional[int] = None,
+                        start: int = 0) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Évalue l'intégrande sur une plage de points, bloc de flux par bloc de flux.
+
+    Mêmes paramètres que integrand_sums, dont c'est le cœur: les sommes sont
+    produites séparément pour chaque bloc de flux (STREAM_BLOCK_SIZE points)
+    couvert par la plage, ce qui permet de les mémoriser par bloc (voir
+    src/block_cache.py) sans relancer un appel par bloc.
+
+    Yields:
+        tuple: (numéro_de_bloc, sommes [n, Σf, Σf²] de la partie du bloc
+               comprise dans la plage)
+    """
+    seed = resolve_seed(seed)
+    dimension = len(lower)
+    width = upper - lower
+
+    # Cube [a, b]^d: des scalaires évitent un broadcasting coûteux sur des
+    # lignes de d valeurs
+    if np.all(lower == lower[0]) and np.all(width == width[0]):
+        lower, width = float(lower[0]), float(width[0])
+
+    for block_index, lo, hi in iter_blocks(start, num_samples):
+        rng = block_generator(seed, block_index)
+        sums = np.zeros(3, dtype=np.float64)
+
+        # Sauter le début du bloc: chaque point consomme d tirages de 64 bits
+        if lo:
+            rng.bit_generator.advance(dimension * lo)
+
+        remaining = hi - lo
+        while remaining > 0:
+            n = min(chunk_size, remaining)
+
+            # Points uniformes dans la boîte: même calcul que rng.uniform,
+            # fait sur place
+            points = rng.random(size=(n, dimension))
+            points *= width
+            points += lower
+            values = integrand(points)
+
+            if values.dtype == np.bool_:
+                # Indicatrice: f² = f, un simple comptage suffit
+                hits = np.count_nonzero(values)
+                sums += (n, hits, hits)
+            else:
+                values = values.astype(np.float64, copy=False)
+                sums += (n, values.sum(), np.dot(values, values))
+            remaining -= n
+
+        yield block_index, sums
+
+
+def integrand_sums(integrand: Integrand, num_samples: int, lower: np.ndarray,
+                   upper: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   seed: Optional[int] = None, start: int = 0) -> np.ndarray:
+    """
+    Évalue l'intégrande sur une plage de points et renvoie ses sommes.
+
+    Les points [start, start + num_samples) sont tirés uniformément dans la
+    boîte [lower, upper], bloc par bloc (mémoire bornée par chunk_size). Le
+    point numéro i utilise d tirages de 64 bits du flux de son bloc: en
+    dimension 2 sur [-1, 1]², ce sont exactement les points du noyau "numpy".
+
+    Args:
+        integrand: Fonction vectorisée (n, d) → (n,)
+        num_samples: Nombre de points de la plage
+        lower: Bornes inférieures de la boîte (taille d)
+        upper: Bornes supérieures de la boîte (taille d)
+        chunk_size: Nombre maximal de points évalués en une seule fois
+        seed: Graine maître (aléatoire si None)
+        start: Indice global du premier point de la plage
+
+    Returns:
+        ndarray: Sommes [n, Σf, Σf²] (float64), additives entre plages
+    """
+    sums = np.zeros(3, dtype=np.float64)
+    for _, block_sums in iter_integrand_sums(integrand, num_samples, lower, upper,
+                                             chunk_size, seed, start):
+        sums += block_sums
+    return sums
+
+
+def integrate(integrand: Integrand, dimension: int, lower: Bound = 0.0,
+              upper: Bound = 1.0, num_samples: int = 1_000_000,
+              num_workers: int = 1, backend: str = "mono",
+              seed: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+              pool: Optional[WorkerPool] = None) -> IntegrationResult:
+    """
+    Estime l'intégrale d'une fonction sur une boîte par la méthode Monte Carlo.
+
+    Avec backend="mono", la plage est évaluée dans le thread courant. Avec
+    "thread" ou "process", elle est découpée entre num_workers workers comme
+    pour calculate_pi_multi, et leurs sommes sont additionnées: pour une
+    graine donnée, le résultat ne dépend ni du backend ni du nombre de workers.
+
+    Args:
+        integrand: Fonction vectorisée (n, d) → (n,)
+        dimension: Dimension du domaine
+        lower: Borne inférieure de la boîte (commune ou par axe)
+        upper: Borne supérieure de la boîte (commune ou par axe)
+        num_samples: Nombre de points aléatoires
+        num_workers: Nombre de workers pour les backends "thread" et "process"
+        backend: "mono", "thread" ou "process"
+        seed: Graine maître pour un résultat reproductible (aléatoire si None)
+        chunk_size: Nombre maximal de points évalués en une seule fois
+        pool: Pool de workers persistant (son backend remplace backend)
+
+    Returns:
+        IntegrationResult: Estimation, erreur standard et temps d'exécution
+
+    Raises:
+        ValueError: Si un paramètre est invalide
+    """
+    # Import local: monte_carlo_multi dépend lui-même de ce module (via les noyaux)
+    from src.monte_carlo_multi import share_starts, split_samples
+    from src.scheduler import wait_for_results
+
+    # Validation des entrées
+    if num_samples <= 0:
+        raise ValueError(f"num_samples doit être > 0, reçu: {num_samples}")
+
+    if num_workers <= 0:
+        raise ValueError(f"num_workers doit être > 0, reçu: {num_workers}")
+
+    if pool is not None:
+        backend = pool.backend
+
+    if backend not in ENGINE_BACKENDS:
+        raise ValueError(f"backend doit être parmi {ENGINE_BACKENDS}, reçu: {backend!r}")
+
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size doit être > 0, reçu: {chunk_size}")
+
+    lower, upper = box_bounds(dimension, lower, upper)
+    seed = resolve_seed(seed)
+    volume = float(np.prod(upper - lower))
+
+    start_time = time.perf_counter()
+
+    if backend == "mono":
+        sums = integrand_sums(integrand, num_samples, lower, upper, chunk_size, seed)
+    else:
+        shares = split_samples(num_samples, num_workers)
+        tasks = [(integrand, share, lower, upper, chunk_size, seed, share_start)
+                 for share, share_start in zip(shares, share_starts(shares))]
+
+        # Attente sans limite: une part de worker peut durer bien plus d'une minute
+        if pool is not None:
+            pool.resize(num_workers)
+            parts = wait_for_results([pool.submit(integrand_sums, *args) for args in tasks],
+                                     stall_timeout=None)
+        else:
+            with WorkerPool(backend, num_workers) as temporary_pool:
+                parts = wait_for_results([temporary_pool.submit(integrand_sums, *args)
+                                          for args in tasks], stall_timeout=None)
+
+        # Réduction: les sommes des workers s'additionnent
+        sums = np.sum(parts, axis=0)
+
+    n, sum_f, sum_f2 = sums
+    mean = sum_f / n
+    variance = max(sum_f2 / n - mean * mean, 0.0)
+
+    execution_time = time.perf_counter() - start_time
+
+    return IntegrationResult(
+        value=volume * mean,
+        std_error=volume * math.sqrt(variance / n),
+        num_samples=num_samples,
+        dimension=dimension,
+        execution_time=execution_time,
+    )
+
+
+def estimate_ball_volume(dimension: int, num_samples: int = 1_000_000,
+                         **options) -> IntegrationResult:
+    """
+    Estime le volume de la boule unité en dimension d.
+
+    La boule est contenue dans le cube [-1, 1]^d, de volume 2^d. En grande
+    dimension, la boule n'occupe plus qu'une infime fraction du cube: l'erreur
+    relative augmente vite à num_samples fixé.
+
+    Args:
+        dimension: Dimension de l'espace
+        num_samples: Nombre de points aléatoires
+        **options: Options de integrate (num_workers, backend, seed, ...)
+
+    Returns:
+        IntegrationResult: Estimation du volume (voir ball_volume pour la valeur exacte)
+    """
+    return integrate(unit_ball_indicator, dimension, -1.0, 1.0, num_samples, **options)
+
+
+if __name__ == "__main__":
+    # Test rapide du module
+    print("=== Test du moteur d'intégration Monte Carlo ===\n")
+
+    for d in [2, 3, 5, 8]:
+        result = estimate_ball_volume(d, 1_000_000, seed=42)
+        exact = ball_volume(d)
+
+        print(f"Boule unité en dimension {d}")
+        print(f"  Volume estimé: {result.value:.6f} ± {result.std_error:.6f}")
+        print(f"  Volume exact:  {exact:.6f}")
+        print(f"  Temps:         {result.execution_time:.4f} secondes")
+        print()
+
+    # Intégrande quelconque: ∫∫ exp(-(x² + y²)) sur [0, 1]²
+    result = integrate(lambda p: np.exp(-(p * p).sum(axis=1)), 2, 0.0, 1.0, seed=42)
+    exact = (math.sqrt(math.pi) / 2 * math.erf(1.0)) ** 2
+    print("∫∫ exp(-(x² + y²)) dx dy sur [0, 1]²")
+    print(f"  Estimation: {result.value:.6f} ± {result.std_error:.6f}")
+    print(f"  Exact:      {exact:.6f}")
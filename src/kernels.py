@@ -0,0 +1,248 @@
+"""
+Noyaux de calcul Monte Carlo pour le calcul de Pi
+
+Ce module regroupe les "noyaux" (kernels), c'est-à-dire les boucles qui génèrent
+les points aléatoires et comptent ceux qui tombent dans le cercle unitaire.
+Les simulateurs (mono-thread, multi-thread) choisissent un noyau et se chargent
+seulement du découpage du travail et du chronométrage.
+
+Noyaux disponibles:
+- "python": boucle Python pure, un point à la fois (version pédagogique)
+- "numpy":  génération vectorisée par blocs de taille fixe (chunks)
+- "integer": niveau de précision compact, coordonnées entières sur 32 bits
+             testées sans conversion en flottants (voir count_inside_integer)
+
+Le noyau "numpy" est un cas particulier du moteur d'intégration générique
+(src/integration.py): l'indicatrice du disque unité intégrée sur [-1, 1]².
+
+Chaque noyau traite une plage d'échantillons [start, start + num_samples) du
+flux aléatoire défini par une graine maître (voir src/seeding.py). Pour une
+graine donnée, le résultat ne dépend donc pas de la façon dont la plage totale
+est découpée entre les workers.
+"""
+
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from src.integration import DEFAULT_CHUNK_SIZE, iter_integrand_sums, unit_ball_indicator
+from src.seeding import block_generator, block_random, iter_blocks, resolve_seed
+
+
+# Noms des noyaux acceptés par les simulateurs
+KERNELS = ("python", "numpy", "integer")
+
+# Borne du biais du noyau "integer" sur l'estimation de Pi (voir count_inside_integer)
+INTEGER_KERNEL_BIAS_BOUND = 2.0 ** -29
+
+# Masque des 32 bits de poids faible d'un tirage de 64 bits
+_LOW_32_BITS = np.uint64(0xFFFF_FFFF)
+
+# Le carré [-1, 1] × [-1, 1] dans lequel les points sont tirés
+SQUARE_LOWER = np.array([-1.0, -1.0])
+SQUARE_UPPER = np.array([1.0, 1.0])
+
+
+def count_inside_python(num_samples: int, seed: Optional[int] = None,
+                        start: int = 0) -> int:
+    """
+    Compte les points dans le cercle avec une boucle Python pure.
+
+    Chaque point est généré avec deux appels à uniform, puis testé
+    individuellement. C'est la version la plus simple à lire, mais aussi la
+    plus lente (surcoût de l'interpréteur à chaque itération).
+
+    Args:
+        num_samples: Nombre de points aléatoires à générer
+        seed: Graine maître (tirée au hasard si None)
+        start: Indice global du premier échantillon de cette plage
+
+    Returns:
+        int: Nombre de points tombés dans le cercle unitaire
+    """
+    return sum(count for _, count in _python_block_counts(num_samples, seed, start))
+
+
+def _python_block_counts(num_samples: int, seed: Optional[int],
+                         start: int) -> Iterator[Tuple[int, int]]:
+    """Cœur de count_inside_python: points dans le cercle de chaque bloc de flux."""
+    seed = resolve_seed(seed)
+
+    for block_index, lo, hi in iter_blocks(start, num_samples):
+        inside_circle = 0
+
+        # Générateur propre au bloc (pas d'état partagé entre workers)
+        rng = block_random(seed, block_index)
+        uniform = rng.uniform
+
+        # Sauter les points du bloc qui appartiennent à une autre plage.
+        # Chaque appel à uniform consomme 2 mots de 32 bits du Mersenne Twister,
+        # donc un point = 128 bits: getrandbits les consomme en un seul appel C.
+        if lo:
+            rng.getrandbits(128 * lo)
+
+        for _ in range(hi - lo):
+            # Générer un point aléatoire (x, y) dans le carré [-1, 1] × [-1, 1]
+            x = uniform(-1, 1)
+            y = uniform(-1, 1)
+
+            # Un point est dans le cercle si: x² + y² ≤ 1
+            if x * x + y * y <= 1:
+                inside_circle += 1
+
+        yield block_index, inside_circle
+
+
+def count_inside_numpy(num_samples: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       seed: Optional[int] = None, start: int = 0) -> int:
+    """
+    Compte les points dans le cercle avec NumPy, bloc par bloc.
+
+    Au lieu de générer les points un par un, on génère un bloc entier de
+    coordonnées d'un coup et on fait le test x² + y² ≤ 1 sur tout le tableau.
+    Les blocs sont traités l'un après l'autre: la mémoire utilisée dépend
+    de chunk_size et non de num_samples.
+
+    Le flux est consommé dans le même ordre quel que soit chunk_size, donc le
+    résultat pour une graine donnée ne dépend pas non plus de chunk_size.
+
+    Args:
+        num_samples: Nombre de points aléatoires à générer
+        chunk_size: Nombre maximal de points générés en une seule fois
+        seed: Graine maître (tirée au hasard si None)
+        start: Indice global du premier échantillon de cette plage
+
+    Returns:
+        int: Nombre de points tombés dans le cercle unitaire
+    """
+    return sum(count for _, count in _numpy_block_counts(num_samples, chunk_size, seed, start))
+
+
+def _numpy_block_counts(num_samples: int, chunk_size: int, seed: Optional[int],
+                        start: int) -> Iterator[Tuple[int, int]]:
+    """Cœur de count_inside_numpy: points dans le cercle de chaque bloc de flux."""
+    # Intégrale de l'indicatrice du disque sur le carré: Σf = points dans le cercle
+    for block_index, sums in iter_integrand_sums(unit_ball_indicator, num_samples,
+                                                 SQUARE_LOWER, SQUARE_UPPER,
+                                                 chunk_size, seed, start):
+        yield block_index, int(sums[1])
+
+
+def count_inside_integer(num_samples: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         seed: Optional[int] = None, start: int = 0) -> int:
+    """
+    Compte les points dans le cercle en arithmétique entière (noyau compact).
+
+    Le noyau "numpy" passe l'essentiel de son temps à convertir des bits
+    aléatoires en float64 dans [-1, 1], et fait transiter 16 octets par point.
+    Ici, un seul tirage de 64 bits donne un point: ses 32 bits de poids faible
+    et de poids fort sont les coordonnées entières u et v dans [0, 2³²), soit
+    un point du quart de disque (u / 2³², v / 2³²). Le test
+
+        u² + v² < R²,  avec R = 2³²
+
+    se fait en entiers de 64 bits, sans débordement: u² ≤ (2⁶⁴ - 1) - v², où
+    (2⁶⁴ - 1) - v² est simplement l'inversion des bits de v². Les tableaux de
+    travail sont alloués une fois par appel puis réutilisés pour chaque bloc;
+    seul le tableau de tirages bruts est fourni par le générateur.
+
+    Biais: le point entier (u, v) représente la cellule [u, u+1) × [v, v+1).
+    Seules les cellules traversées par l'arc de cercle sont mal classées, et
+    il y en a au plus 2 × 2³². La proportion de points dans le cercle est donc
+    biaisée d'au plus 2³³ / 2⁶⁴ = 2⁻³¹, soit au plus 2⁻²⁹ ≈ 1,9e-9 sur Pi
+    (INTEGER_KERNEL_BIAS_BOUND). L'erreur statistique ne descend sous cette
+    borne qu'au-delà de 10¹⁷ échantillons environ.
+
+    Le flux est consommé dans le même ordre quel que soit chunk_size, mais
+    ce n'est pas celui du noyau "numpy": les comptes des deux noyaux diffèrent
+    pour une même graine.
+
+    Args:
+        num_samples: Nombre de points aléatoires à générer
+        chunk_size: Nombre maximal de points générés en une seule fois
+        seed: Graine maître (tirée au hasard si None)
+        start: Indice global du premier échantillon de cette plage
+
+    Returns:
+        int: Nombre de points tombés dans le cercle unitaire
+    """
+    return sum(count for _, count in _integer_block_counts(num_samples, chunk_size,
+                                                           seed, start))
+
+
+def _integer_block_counts(num_samples: int, chunk_size: int, seed: Optional[int],
+                          start: int) -> Iterator[Tuple[int, int]]:
+    """Cœur de count_inside_integer: points dans le cercle de chaque bloc de flux."""
+    seed = resolve_seed(seed)
+
+    # Tableaux de travail réutilisés d'un bloc à l'autre
+    buffer_size = min(chunk_size, num_samples)
+    u_squared = np.empty(buffer_size, dtype=np.uint64)
+    v_squared = np.empty(buffer_size, dtype=np.uint64)
+    inside = np.empty(buffer_size, dtype=np.bool_)
+
+    for block_index, lo, hi in iter_blocks(start, num_samples):
+        inside_circle = 0
+        bit_generator = block_generator(seed, block_index).bit_generator
+
+        # Sauter le début du bloc: chaque point consomme un seul tirage de 64 bits
+        if lo:
+            bit_generator.advance(lo)
+
+        remaining = hi - lo
+        while remaining > 0:
+            n = min(chunk_size, remaining)
+            raw = bit_generator.random_raw(n)
+            u2, v2, hits = u_squared[:n], v_squared[:n], inside[:n]
+
+            # u = 32 bits de poids faible, v = 32 bits de poids fort
+            np.bitwise_and(raw, _LOW_32_BITS, out=u2)
+            np.right_shift(raw, np.uint64(32), out=v2)
+            np.multiply(u2, u2, out=u2)
+            np.multiply(v2, v2, out=v2)
+
+            # u² ≤ (2⁶⁴ - 1) - v²  ⇔  u² + v² < 2⁶⁴
+            np.invert(v2, out=v2)
+            np.less_equal(u2, v2, out=hits)
+
+            inside_circle += int(np.count_nonzero(hits))
+            remaining -= n
+
+        yield block_index, inside_circle
+
+
+def iter_block_counts(num_samples: int, kernel: str = "python",
+                      chunk_size: int = DEFAULT_CHUNK_SIZE, seed: Optional[int] = None,
+                      start: int = 0) -> Iterator[Tuple[int, int]]:
+    """
+    Compte les points dans le cercle séparément pour chaque bloc de flux.
+
+    Même travail qu'un seul appel à count_inside_python, count_inside_numpy ou
+    count_inside_integer sur la plage (mêmes tableaux de travail, mêmes
+    générateurs), mais le compte de chaque bloc de STREAM_BLOCK_SIZE points
+    est produit séparément: c'est ce qu'un cache par bloc mémorise.
+
+    Args:
+        num_samples: Nombre de points aléatoires à générer
+        kernel: Noyau effectif ("python", "numpy" ou "integer")
+        chunk_size: Nombre maximal de points générés en une seule fois
+        seed: Graine maître (tirée au hasard si None)
+        start: Indice global du premier échantillon de cette plage
+
+    Yields:
+        tuple: (numéro_de_bloc, points dans le cercle de la partie du bloc
+               comprise dans la plage)
+
+    Raises:
+        ValueError: Si le noyau est inconnu
+    """
+    if kernel == "numpy":
+        return _numpy_block_counts(num_samples, chunk_size, seed, start)
+
+    if kernel == "integer":
+        return _integer_block_counts(num_samples, chunk_size, seed, start)
+
+    if kernel == "python":
+        return _python_block_counts(num_samples, seed, start)
+
+    raise ValueError(f"kernel doit être parmi {KERNELS}, reçu: {kernel!r}")
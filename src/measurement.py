@@ -0,0 +1,291 @@
+"""
+Mesure rigoureuse des temps d'exécution
+
+Quelques runs bruts, une moyenne ± écart-type et un speedup égal au rapport
+des moyennes ne disent pas si une différence de temps est réelle. Ce module
+fournit un mode de mesure plus rigoureux:
+
+- runs d'échauffement (caches, pages mémoire, JIT de NumPy...) non comptés
+- répétition automatique jusqu'à ce que l'intervalle de confiance relatif de
+  la médiane soit assez étroit (ou max_runs atteint)
+- épinglage optionnel du processus sur des cœurs (os.sched_setaffinity)
+- mise à l'écart des runs aberrants (clôtures de Tukey: Q1 - k×IQR, Q3 + k×IQR)
+- médiane et intervalles de confiance bootstrap (percentiles) pour les temps
+  et pour le speedup
+
+Le bootstrap ne suppose aucune loi pour les temps: on rééchantillonne les runs
+avec remise, on recalcule la statistique, et les percentiles de ces valeurs
+forment l'intervalle.
+"""
+
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Nombre de rééchantillonnages bootstrap par défaut
+DEFAULT_BOOTSTRAP_RESAMPLES = 2000
+
+# Niveau de confiance par défaut des intervalles
+DEFAULT_CONFIDENCE = 0.95
+
+# Coefficient des clôtures de Tukey pour les runs aberrants
+DEFAULT_OUTLIER_FENCE = 1.5
+
+# Graine du générateur bootstrap: intervalles reproductibles pour les mêmes temps
+BOOTSTRAP_SEED = 0
+
+
+@dataclass
+class MeasurementPolicy:
+    """
+    Paramètres du mode de mesure rigoureux.
+
+    Exemple:
+        policy = MeasurementPolicy(warmup_runs=2, min_runs=5, max_runs=30,
+                                   target_relative_ci=0.02, pin_cpus=[0, 1, 2, 3])
+    """
+    warmup_runs: int = 1                   # Runs d'échauffement non comptés
+    min_runs: int = 5                      # Runs mesurés au minimum
+    max_runs: int = 30                     # Runs mesurés au maximum
+    target_relative_ci: float = 0.05       # Demi-largeur relative visée pour la médiane
+    confidence: float = DEFAULT_CONFIDENCE
+    outlier_fence: Optional[float] = DEFAULT_OUTLIER_FENCE  # None = garder tous les runs
+    pin_cpus: Optional[Sequence[int]] = None                # None = pas d'épinglage
+    bootstrap_resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES
+
+    def validate(self):
+        """
+        Vérifie la cohérence des paramètres.
+
+        Raises:
+            ValueError: Si un paramètre est invalide
+        """
+        if self.warmup_runs < 0:
+            raise ValueError(f"warmup_runs doit être >= 0, reçu: {self.warmup_runs}")
+
+        if self.min_runs <= 0:
+            raise ValueError(f"min_runs doit être > 0, reçu: {self.min_runs}")
+
+        if self.max_runs < self.min_runs:
+            raise ValueError(f"max_runs doit être >= min_runs ({self.min_runs}), "
+                             f"reçu: {self.max_runs}")
+
+        if self.target_relative_ci <= 0:
+            raise ValueError(f"target_relative_ci doit être > 0, "
+                             f"reçu: {self.target_relative_ci}")
+
+        if not 0 < self.confidence < 1:
+            raise ValueError(f"confidence doit être entre 0 et 1, reçu: {self.confidence}")
+
+        if self.bootstrap_resamples <= 0:
+            raise ValueError(f"bootstrap_resamples doit être > 0, "
+                             f"reçu: {self.bootstrap_resamples}")
+
+
+@dataclass
+class TimingMeasurement:
+    """Temps retenus d'une configuration et leurs statistiques robustes."""
+    times: List[float]           # Temps retenus (hors runs aberrants)
+    pi_values: List[float]       # Valeur de Pi de chaque run mesuré
+    median_time: float           # Médiane des temps retenus
+    ci_low: float                # Borne basse de l'intervalle de la médiane
+    ci_high: float               # Borne haute de l'intervalle de la médiane
+    num_outliers: int = 0        # Runs aberrants écartés
+    converged: bool = True       # False si max_runs a été atteint avant la cible
+
+
+def bootstrap_ci(samples: Sequence[float], statistic: Callable = np.median,
+                 confidence: float = DEFAULT_CONFIDENCE,
+                 resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES) -> Tuple[float, float]:
+    """
+    Intervalle de confiance bootstrap (percentiles) d'une statistique.
+
+    Args:
+        samples: Observations (ex: temps des runs)
+        statistic: Statistique vectorisée acceptant axis=1 (np.median, np.mean, ...)
+        confidence: Niveau de confiance
+        resamples: Nombre de rééchantillonnages
+
+    Returns:
+        tuple: (borne_basse, borne_haute)
+    """
+    values = np.asarray(samples, dtype=np.float64)
+    rng = np.random.default_rng(BOOTSTRAP_SEED)
+    indices = rng.integers(0, len(values), size=(resamples, len(values)))
+    estimates = statistic(values[indices], axis=1)
+
+    alpha = (1.0 - confidence) / 2
+    low, high = np.quantile(estimates, [alpha, 1.0 - alpha])
+    return float(low), float(high)
+
+
+def bootstrap_speedup_ci(mono_times: Sequence[float], multi_times: Sequence[float],
+                         confidence: float = DEFAULT_CONFIDENCE,
+                         resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES
+                         ) -> Tuple[float, float, float]:
+    """
+    Speedup des médianes et son intervalle de confiance bootstrap.
+
+    Les temps mono et multi sont rééchantillonnés indépendamment; chaque
+    rééchantillonnage donne calculate_speedup(médiane_mono, médiane_multi).
+
+    Args:
+        mono_times: Temps des runs mono-thread
+        multi_times: Temps des runs multi-worker
+        confidence: Niveau de confiance
+        resamples: Nombre de rééchantillonnages
+
+    Returns:
+        tuple: (speedup_des_médianes, borne_basse, borne_haute)
+    """
+    # Import local: performance_analyzer dépend lui-même de ce module
+    from src.performance_analyzer import calculate_speedup
+
+    mono = np.asarray(mono_times, dtype=np.float64)
+    multi = np.asarray(multi_times, dtype=np.float64)
+    rng = np.random.default_rng(BOOTSTRAP_SEED)
+
+    mono_medians = np.median(mono[rng.integers(0, len(mono), size=(resamples, len(mono)))],
+                             axis=1)
+    multi_medians = np.median(multi[rng.integers(0, len(multi), size=(resamples, len(multi)))],
+                              axis=1)
+    speedups = [calculate_speedup(m, t) for m, t in zip(mono_medians, multi_medians)]
+
+    alpha = (1.0 - confidence) / 2
+    low, high = np.quantile(speedups, [alpha, 1.0 - alpha])
+    speedup = calculate_speedup(float(np.median(mono)), float(np.median(multi)))
+    return speedup, float(low), float(high)
+
+
+def remove_outliers(times: Sequence[float],
+                    fence: float = DEFAULT_OUTLIER_FENCE) -> Tuple[List[float], int]:
+    """
+    Écarte les temps hors des clôtures de Tukey [Q1 - k×IQR, Q3 + k×IQR].
+
+    Args:
+        times: Temps des runs
+        fence: Coefficient k des clôtures
+
+    Returns:
+        tuple: (temps_retenus, nombre_de_temps_écartés)
+    """
+    if len(times) < 4:
+        # Trop peu de runs pour estimer les quartiles
+        return list(times), 0
+
+    q1, q3 = np.quantile(times, [0.25, 0.75])
+    low, high = q1 - fence * (q3 - q1), q3 + fence * (q3 - q1)
+    kept = [t for t in times if low <= t <= high]
+    return kept, len(times) - len(kept)
+
+
+@contextmanager
+def pinned_cpus(cpus: Optional[Sequence[int]]) -> Iterator[None]:
+    """
+    Épingle le processus courant (et les workers créés ensuite) sur des cœurs.
+
+    L'affinité d'origine est restaurée à la sortie. Sans os.sched_setaffinity
+    (macOS, Windows), l'épinglage est ignoré avec un avertissement.
+
+    Args:
+        cpus: Numéros des cœurs autorisés (None = pas d'épinglage)
+    """
+    if cpus is None:
+        yield
+        return
+
+    if not hasattr(os, "sched_setaffinity"):
+        print("⚠️  Attention: épinglage CPU indisponible sur ce système, ignoré.")
+        yield
+        return
+
+    original = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, set(cpus))
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, original)
+
+
+def measure_runs(simulate: Callable[[int], Tuple[float, float]],
+                 policy: MeasurementPolicy) -> TimingMeasurement:
+    """
+    Mesure une configuration selon une politique de mesure rigoureuse.
+
+    Les runs d'échauffement sont lancés puis ignorés. Ensuite, des runs sont
+    mesurés tant que moins de min_runs runs sont retenus (hors runs aberrants)
+    ou que la demi-largeur relative de l'intervalle de la médiane dépasse
+    target_relative_ci, jusqu'à max_runs.
+
+    Args:
+        simulate: Fonction (numéro_de_run) -> (valeur_de_pi, temps)
+        policy: Politique de mesure
+
+    Returns:
+        TimingMeasurement: Temps retenus, médiane et intervalle de confiance
+    """
+    policy.validate()
+
+    for _ in range(policy.warmup_runs):
+        simulate(0)
+
+    times = []
+    pi_values = []
+
+    while True:
+        run = len(times)
+        pi_value, exec_time = simulate(run)
+        times.append(exec_time)
+        pi_values.append(pi_value)
+        print(f"  Run {run + 1}: {exec_time:.4f}s, Pi = {pi_value:.6f}")
+
+        if len(times) < policy.min_runs:
+            continue
+
+        kept, num_outliers = (remove_outliers(times, policy.outlier_fence)
+                              if policy.outlier_fence is not None else (times, 0))
+        median_time = float(np.median(kept))
+        ci_low, ci_high = bootstrap_ci(kept, np.median, policy.confidence,
+                                       policy.bootstrap_resamples)
+        relative_half_width = (ci_high - ci_low) / 2 / median_time if median_time > 0 else 0.0
+
+        # Les runs aberrants ne comptent pas dans le minimum de runs
+        converged = (len(kept) >= policy.min_runs
+                     and relative_half_width <= policy.target_relative_ci)
+        if converged or len(times) >= policy.max_runs:
+            return TimingMeasurement(
+                times=list(kept),
+                pi_values=pi_values,
+                median_time=median_time,
+                ci_low=ci_low,
+                ci_high=ci_high,
+                num_outliers=num_outliers,
+                converged=converged,
+            )
+
+
+if __name__ == "__main__":
+    # Test rapide du module
+    from src.monte_carlo_multi import calculate_pi_multi
+
+    print("=== Test de la mesure rigoureuse ===\n")
+
+    policy = MeasurementPolicy(warmup_runs=1, min_runs=5, max_runs=20,
+                               target_relative_ci=0.03)
+
+    mono = measure_runs(lambda run: calculate_pi_multi(2_000_000, 1, kernel="numpy",
+                                                       seed=run), policy)
+    multi = measure_runs(lambda run: calculate_pi_multi(2_000_000, 2, kernel="numpy",
+                                                        seed=run), policy)
+
+    for name, m in (("1 thread", mono), ("2 threads", multi)):
+        print(f"{name}: médiane {m.median_time:.4f}s "
+              f"[{m.ci_low:.4f}, {m.ci_high:.4f}] sur {len(m.times)} runs "
+              f"({m.num_outliers} aberrant(s), convergé: {m.converged})")
+
+    speedup, low, high = bootstrap_speedup_ci(mono.times, multi.times)
+    print(f"Speedup: {speedup:.2f}x [{low:.2f}, {high:.2f}]")
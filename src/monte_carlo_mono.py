@@ -4,13 +4,141 @@ Simulateur Monte Carlo Mono-Thread pour le calcul de Pi
 Ce module implémente la méthode Monte Carlo en mode séquentiel (un seul thread).
 La méthode consiste à générer des points aléatoires dans un carré et compter
 combien tombent dans un cercle inscrit pour estimer la valeur de Pi.
+
+Trois noyaux de calcul sont disponibles (voir src/kernels.py):
+- "python":  boucle point par point (version pédagogique)
+- "numpy":   génération et test vectorisés par blocs de taille fixe
+- "integer": coordonnées entières sur 32 bits, test sans flottants (compact)
 """
 
-import random
 import time
+from typing import Optional, Sequence
+
+from src.kernels import (
+    DEFAULT_CHUNK_SIZE,
+    KERNELS,
+    count_inside_integer,
+    count_inside_numpy,
+    count_inside_python,
+)
+from src.qmc import SAMPLINGS, count_inside_halton
+from src.result_slots import ResultSlots
+from src.seeding import iter_segments, resolve_seed
+from src.telemetry import (
+    DEFAULT_PROGRESS_INTERVAL,
+    DEFAULT_TELEMETRY_INTERVAL,
+    TelemetryCallback,
+    TelemetryMonitor,
+)
 
 
-def calculate_pi_mono(num_samples: int) -> tuple[float, float]:
+def count_inside_mono(num_samples: int, kernel: str = "python",
+                      chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      seed: Optional[int] = None, start: int = 0,
+                      sampling: str = "pseudo") -> int:
+    """
+    Compte les points dans le cercle sur une plage d'échantillons (mono-thread).
+    
+    C'est le cœur de calculate_pi_mono, sans chronométrage: il traite les
+    échantillons [start, start + num_samples) du flux de la graine maître.
+    Deux appels sur des plages consécutives donnent donc le même total qu'un
+    seul appel sur la plage complète.
+    
+    Avec sampling="halton", les points sont ceux de la suite de Halton
+    brouillée (quasi-Monte Carlo, voir src/qmc.py), toujours calculés par
+    blocs vectorisés: le noyau n'est alors pas utilisé.
+    
+    Args:
+        num_samples: Nombre de points aléatoires à générer
+        kernel: Noyau de calcul, "python" (point par point), "numpy" (par blocs)
+                ou "integer" (par blocs, en entiers)
+        chunk_size: Taille des blocs des noyaux vectorisés (borne la mémoire)
+        seed: Graine maître (aléatoire si None)
+        start: Indice global du premier échantillon de la plage
+        sampling: "pseudo" (pseudo-aléatoire) ou "halton" (quasi-Monte Carlo)
+        
+    Returns:
+        int: Nombre de points tombés dans le cercle unitaire
+        
+    Raises:
+        ValueError: Si num_samples <= 0, chunk_size <= 0, seed < 0, noyau ou
+                    échantillonnage inconnu
+    """
+    # Validation de l'entrée
+    if num_samples <= 0:
+        raise ValueError(f"num_samples doit être > 0, reçu: {num_samples}")
+    
+    if kernel not in KERNELS:
+        raise ValueError(f"kernel doit être parmi {KERNELS}, reçu: {kernel!r}")
+    
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size doit être > 0, reçu: {chunk_size}")
+    
+    if sampling not in SAMPLINGS:
+        raise ValueError(f"sampling doit être parmi {SAMPLINGS}, reçu: {sampling!r}")
+    
+    seed = resolve_seed(seed)
+    
+    if sampling == "halton":
+        # Segment [start, start + num_samples) de la suite de Halton brouillée
+        return count_inside_halton(num_samples, chunk_size, seed, start)
+    
+    # Compter les points qui tombent dans le cercle avec le noyau choisi
+    if kernel == "numpy":
+        # Blocs vectorisés: mémoire bornée par chunk_size
+        return count_inside_numpy(num_samples, chunk_size, seed, start)
+    
+    if kernel == "integer":
+        # Blocs de tirages bruts de 64 bits, test en arithmétique entière
+        return count_inside_integer(num_samples, chunk_size, seed, start)
+    
+    # Points générés un par un (séquentiel)
+    return count_inside_python(num_samples, seed, start)
+
+
+def _count_inside_monitored(num_samples: int, kernel: str, chunk_size: int,
+                            seed: Optional[int], sampling: str,
+                            callbacks: Sequence[TelemetryCallback],
+                            telemetry_interval: float) -> int:
+    """
+    Compte les points dans le cercle par segments, sous surveillance.
+    
+    Args:
+        num_samples: Nombre de points aléatoires à générer
+        kernel: Noyau de calcul
+        chunk_size: Taille des blocs des noyaux vectorisés
+        seed: Graine maître (aléatoire si None)
+        sampling: Mode d'échantillonnage
+        callbacks: Rappels de télémétrie
+        telemetry_interval: Temps entre deux instantanés, en secondes
+        
+    Returns:
+        int: Nombre de points tombés dans le cercle unitaire
+    """
+    seed = resolve_seed(seed)
+    inside_circle = 0
+    samples_done = 0
+    
+    # Une seule case: celle du thread courant
+    with ResultSlots(1) as slots, \
+            TelemetryMonitor(slots, num_samples, callbacks, telemetry_interval):
+        for segment_start, segment_samples in iter_segments(0, num_samples,
+                                                            DEFAULT_PROGRESS_INTERVAL):
+            inside_circle += count_inside_mono(segment_samples, kernel, chunk_size, seed,
+                                               segment_start, sampling)
+            samples_done += segment_samples
+            slots.record(0, inside_circle, samples_done)
+    
+    return inside_circle
+
+
+def calculate_pi_mono(num_samples: int, kernel: str = "python",
+                      chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      seed: Optional[int] = None,
+                      sampling: str = "pseudo",
+                      callbacks: Sequence[TelemetryCallback] = (),
+                      telemetry_interval: float = DEFAULT_TELEMETRY_INTERVAL
+                      ) -> tuple[float, float]:
     """
     Calcule Pi en utilisant la méthode Monte Carlo (mono-thread).
     
@@ -20,14 +148,28 @@ def calculate_pi_mono(num_samples: int) -> tuple[float, float]:
     - Le ratio (points dans cercle / points totaux) ≈ (aire cercle / aire carré) = π/4
     - Donc: Pi ≈ 4 × (points_dans_cercle / points_totaux)
     
+    Avec des rappels de télémétrie (callbacks), le calcul est fait par
+    segments de DEFAULT_PROGRESS_INTERVAL échantillons: la progression est
+    écrite après chaque segment et lue par un thread de surveillance (voir
+    src/telemetry.py). Le résultat est le même qu'en un seul appel.
+    
     Args:
         num_samples: Nombre de points aléatoires à générer
+        kernel: Noyau de calcul, "python" (point par point), "numpy" (par blocs)
+                ou "integer" (par blocs, en entiers)
+        chunk_size: Taille des blocs des noyaux vectorisés (borne la mémoire)
+        seed: Graine maître pour un résultat reproductible (aléatoire si None)
+        sampling: "pseudo" (pseudo-aléatoire) ou "halton" (quasi-Monte Carlo)
+        callbacks: Rappels de télémétrie (ex: ProgressRenderer), appelés
+                   avec chaque TelemetrySnapshot pendant le calcul
+        telemetry_interval: Temps entre deux instantanés, en secondes
         
     Returns:
         tuple: (valeur_de_pi, temps_execution_en_secondes)
         
     Raises:
-        ValueError: Si num_samples <= 0
+        ValueError: Si num_samples <= 0, chunk_size <= 0, seed < 0, noyau ou
+                    échantillonnage inconnu
     """
     # Validation de l'entrée
     if num_samples <= 0:
@@ -36,21 +178,13 @@ def calculate_pi_mono(num_samples: int) -> tuple[float, float]:
     # Démarrer le chronomètre
     start_time = time.perf_counter()
     
-    # Compteur pour les points qui tombent dans le cercle
-    inside_circle = 0
-    
-    # Générer les points aléatoires un par un (séquentiel)
-    for _ in range(num_samples):
-        # Générer un point aléatoire (x, y) dans le carré [-1, 1] × [-1, 1]
-        x = random.uniform(-1, 1)
-        y = random.uniform(-1, 1)
-        
-        # Vérifier si le point est dans le cercle unitaire
-        # Un point est dans le cercle si: x² + y² ≤ 1
-        distance_squared = x * x + y * y
-        
-        if distance_squared <= 1:
-            inside_circle += 1
+    # Compter les points qui tombent dans le cercle
+    if callbacks:
+        inside_circle = _count_inside_monitored(num_samples, kernel, chunk_size, seed,
+                                                sampling, callbacks, telemetry_interval)
+    else:
+        inside_circle = count_inside_mono(num_samples, kernel, chunk_size, seed,
+                                          sampling=sampling)
     
     # Calculer Pi en utilisant la formule: Pi ≈ 4 × (inside / total)
     # Explication: aire_cercle/aire_carré = πr²/(2r)² = π/4
@@ -71,11 +205,12 @@ if __name__ == "__main__":
     test_samples = [50000000]
     
     for samples in test_samples:
-        pi_value, exec_time = calculate_pi_mono(samples)
-        error = abs(pi_value - 3.14159265359)
+        for kernel in KERNELS:
+            pi_value, exec_time = calculate_pi_mono(samples, kernel=kernel)
+            error = abs(pi_value - 3.14159265359)
         
-        print(f"Échantillons: {samples:>10,}")
-        print(f"  Pi calculé: {pi_value:.8f}")
-        print(f"  Erreur:     {error:.8f}")
-        print(f"  Temps:      {exec_time:.4f} secondes")
-        print()
+            print(f"Échantillons: {samples:>10,} | Noyau: {kernel}")
+            print(f"  Pi calculé: {pi_value:.8f}")
+            print(f"  Erreur:     {error:.8f}")
+            print(f"  Temps:      {exec_time:.4f} secondes")
+            print()
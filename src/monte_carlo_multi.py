@@ -4,15 +4,118 @@ Simulateur Monte Carlo Multi-Thread pour le calcul de Pi
 Ce module implémente la méthode Monte Carlo en mode parallèle (plusieurs threads).
 Le travail est divisé entre plusieurs threads qui s'exécutent en parallèle,
 avec synchronisation pour éviter les race conditions.
+
+Deux backends d'exécution sont disponibles:
+- "thread":  threads Python (module threading), limités par le GIL de CPython
+- "process": processus séparés (concurrent.futures), chacun avec son propre GIL
+
+Avec le noyau "numpy" (ou "integer"), chaque thread calcule par blocs
+vectorisés: NumPy relâche le GIL pendant la génération et le test des points,
+donc les threads s'exécutent réellement en parallèle. Sur un CPython sans GIL (3.13t), le noyau
+"python" suffit: le choix kernel="auto" s'adapte à l'interpréteur.
 """
 
-import random
+import sys
+import sysconfig
 import time
 import threading
-from typing import List
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import List, Optional, Sequence
+
+from src.kernels import DEFAULT_CHUNK_SIZE, KERNELS
+from src.monte_carlo_mono import count_inside_mono
+from src.result_slots import ResultSlots
+from src.scheduler import DEFAULT_TASK_SIZE, SCHEDULES, run_dynamic
+from src.seeding import iter_segments, resolve_seed
+from src.telemetry import (
+    DEFAULT_PROGRESS_INTERVAL,
+    DEFAULT_TELEMETRY_INTERVAL,
+    TelemetryCallback,
+    TelemetryMonitor,
+)
+from src.worker_pool import WorkerPool
+
+
+# Backends d'exécution acceptés par calculate_pi_multi
+BACKENDS = ("thread", "process")
+
+# Modes d'agrégation des résultats des workers:
+# - "lock":  compteur partagé protégé par un threading.Lock (threads uniquement)
+# - "slots": une case par worker, sans lock (voir src/result_slots.py)
+AGGREGATIONS = ("lock", "slots")
+
+
+def is_gil_enabled() -> bool:
+    """
+    Indique si l'interpréteur courant s'exécute avec le GIL.
+    
+    Sur un build "free-threaded" de CPython (3.13t et suivants), le GIL peut
+    être désactivé: les threads Python purs tournent alors en parallèle.
+    
+    Returns:
+        bool: True si le GIL est actif (CPython classique)
+    """
+    # sys._is_gil_enabled() n'existe qu'à partir de Python 3.13
+    check = getattr(sys, "_is_gil_enabled", None)
+    if check is not None:
+        return check()
+    return not sysconfig.get_config_var("Py_GIL_DISABLED")
 
 
-def worker(samples_per_thread: int, lock: threading.Lock, shared_counter: dict):
+def resolve_kernel(kernel: str) -> str:
+    """
+    Choisit le noyau effectif d'un worker.
+    
+    "auto" donne "numpy" (qui relâche le GIL) sur un CPython classique, et
+    "python" sur un CPython sans GIL où les threads purs passent déjà à l'échelle.
+    
+    Args:
+        kernel: "python", "numpy", "integer" ou "auto"
+        
+    Returns:
+        str: "python", "numpy" ou "integer"
+        
+    Raises:
+        ValueError: Si le noyau est inconnu
+    """
+    if kernel == "auto":
+        return "numpy" if is_gil_enabled() else "python"
+    
+    if kernel not in KERNELS:
+        raise ValueError(f"kernel doit être parmi {KERNELS + ('auto',)}, reçu: {kernel!r}")
+    
+    return kernel
+
+
+def _count_share(samples: int, seed: Optional[int], start: int,
+                 kernel: str, chunk_size: int, sampling: str = "pseudo") -> int:
+    """
+    Compte les points dans le cercle pour la part d'un worker.
+    
+    Chaque worker exécute le simulateur mono-thread sur sa plage
+    d'échantillons: les générateurs de chaque bloc sont propres au worker.
+    
+    Args:
+        samples: Nombre de points de la part
+        seed: Graine maître de la simulation
+        start: Indice global du premier échantillon de la part
+        kernel: Noyau effectif ("python", "numpy" ou "integer")
+        chunk_size: Taille des blocs des noyaux vectorisés
+        sampling: "pseudo" ou "halton" (segment disjoint de la suite de Halton)
+        
+    Returns:
+        int: Nombre de points tombés dans le cercle
+    """
+    # Part vide: moins d'échantillons que de workers (split_samples)
+    if samples <= 0:
+        return 0
+    
+    return count_inside_mono(samples, kernel, chunk_size, seed, start, sampling)
+
+
+def worker(samples_per_thread: int, lock: threading.Lock, shared_counter: dict,
+           seed: Optional[int] = None, start: int = 0, kernel: str = "python",
+           chunk_size: int = DEFAULT_CHUNK_SIZE, sampling: str = "pseudo"):
     """
     Fonction exécutée par chaque thread pour calculer sa part du travail.
     
@@ -21,25 +124,22 @@ def worker(samples_per_thread: int, lock: threading.Lock, shared_counter: dict):
     2. Compte combien tombent dans le cercle (localement)
     3. Ajoute son résultat au compteur partagé (avec synchronisation)
     
+    Les points viennent de flux aléatoires propres au thread, dérivés de la
+    graine maître (pas d'état partagé avec les autres threads).
+    
     Args:
         samples_per_thread: Nombre de points à générer par ce thread
         lock: Verrou pour protéger l'accès au compteur partagé
         shared_counter: Dictionnaire partagé contenant le compteur total
+        seed: Graine maître de la simulation
+        start: Indice global du premier échantillon de ce thread
+        kernel: Noyau de calcul ("python", "numpy" ou "integer")
+        chunk_size: Taille des blocs des noyaux vectorisés
+        sampling: Mode d'échantillonnage ("pseudo" ou "halton")
     """
     # Compteur local (pas besoin de synchronisation ici)
-    local_inside = 0
-    
-    # Générer les points aléatoires pour ce thread
-    for _ in range(samples_per_thread):
-        # Générer un point aléatoire (x, y) dans [-1, 1] × [-1, 1]
-        x = random.uniform(-1, 1)
-        y = random.uniform(-1, 1)
-        
-        # Vérifier si le point est dans le cercle unitaire
-        distance_squared = x * x + y * y
-        
-        if distance_squared <= 1:
-            local_inside += 1
+    local_inside = _count_share(samples_per_thread, seed, start, kernel, chunk_size,
+                                sampling)
     
     # SECTION CRITIQUE: Ajouter le résultat local au compteur partagé
     # On utilise un lock pour éviter les race conditions
@@ -48,25 +148,196 @@ def worker(samples_per_thread: int, lock: threading.Lock, shared_counter: dict):
         shared_counter['inside_circle'] += local_inside
 
 
-def calculate_pi_multi(num_samples: int, num_threads: int) -> tuple[float, float]:
+def slot_worker(samples_per_worker: int, slots: ResultSlots, worker_index: int,
+                seed: Optional[int] = None, start: int = 0, kernel: str = "python",
+                chunk_size: int = DEFAULT_CHUNK_SIZE, sampling: str = "pseudo",
+                progress_interval: int = DEFAULT_PROGRESS_INTERVAL):
     """
-    Calcule Pi en utilisant la méthode Monte Carlo (multi-thread).
+    Fonction exécutée par chaque worker (thread ou processus) sans lock.
     
-    Principe:
-    - Diviser le travail total en chunks égaux pour chaque thread
-    - Chaque thread génère ses points et compte localement
-    - Les résultats sont agrégés de manière thread-safe avec un lock
-    - Le calcul final de Pi utilise le total agrégé
+    Au lieu d'ajouter son compte à un compteur partagé, le worker écrit dans
+    sa propre case de ResultSlots: aucune synchronisation n'est nécessaire.
+    Pour le backend "process", les cases sont en mémoire partagée: seul le
+    nom du segment est envoyé au processus, et rien n'est renvoyé.
+    
+    La part est traitée par segments de progress_interval échantillons; après
+    chaque segment, le worker met à jour sa case (points comptés et
+    échantillons traités), ce qui permet de suivre sa progression.
+    
+    Args:
+        samples_per_worker: Nombre de points à générer par ce worker
+        slots: Cases de résultats (une par worker)
+        worker_index: Numéro de la case de ce worker
+        seed: Graine maître de la simulation
+        start: Indice global du premier échantillon de ce worker
+        kernel: Noyau de calcul ("python", "numpy" ou "integer")
+        chunk_size: Taille des blocs des noyaux vectorisés
+        sampling: Mode d'échantillonnage ("pseudo" ou "halton")
+        progress_interval: Nombre d'échantillons entre deux mises à jour de la case
+    """
+    local_inside = 0
+    samples_done = 0
+    
+    try:
+        for segment_start, segment_samples in iter_segments(start, samples_per_worker,
+                                                            progress_interval):
+            local_inside += _count_share(segment_samples, seed, segment_start,
+                                         kernel, chunk_size, sampling)
+            samples_done += segment_samples
+            
+            # Écriture dans la case du worker: pas de lock, personne d'autre n'y écrit
+            slots.record(worker_index, local_inside, samples_done)
+    finally:
+        slots.detach()
+
+
+def split_samples(num_samples: int, num_workers: int) -> List[int]:
+    """
+    Répartit les échantillons entre les workers (threads ou processus).
+    
+    Chaque worker reçoit la même part, le dernier prend en plus le reste
+    de la division entière.
+    
+    Args:
+        num_samples: Nombre total d'échantillons
+        num_workers: Nombre de workers
+        
+    Returns:
+        list: Nombre d'échantillons pour chaque worker
+    """
+    samples_per_worker = num_samples // num_workers
+    remaining_samples = num_samples % num_workers
+    
+    shares = [samples_per_worker] * num_workers
+    shares[-1] += remaining_samples
+    return shares
+
+
+def share_starts(shares: List[int]) -> List[int]:
+    """
+    Calcule l'indice global du premier échantillon de chaque part.
+    
+    Args:
+        shares: Nombre d'échantillons pour chaque worker
+        
+    Returns:
+        list: Indice de départ de chaque part dans l'espace des échantillons
+    """
+    starts = []
+    position = 0
+    for share in shares:
+        starts.append(position)
+        position += share
+    return starts
+
+
+def _wait_for(futures) -> list:
+    """
+    Attend la fin de toutes les tâches soumises à un pool.
+    
+    Args:
+        futures: Liste de Future
+        
+    Returns:
+        list: Résultats des tâches, dans l'ordre de soumission
+    """
+    try:
+        return [future.result(timeout=60) for future in futures]  # Timeout de 60 secondes
+    except FuturesTimeoutError:
+        raise RuntimeError("Worker bloqué - possible deadlock détecté")
+
+
+def _make_tasks(aggregation: str, shares: List[int], starts: List[int], seed: int,
+                kernel: str, chunk_size: int, sampling: str, lock: Optional[threading.Lock],
+                shared_counter: Optional[dict], slots: Optional[ResultSlots]) -> list:
+    """
+    Prépare la fonction et les arguments de chaque worker.
+    
+    Args:
+        aggregation: "lock" (compteur partagé) ou "slots" (une case par worker)
+        shares: Nombre d'échantillons pour chaque worker
+        starts: Indice global du premier échantillon de chaque part
+        seed: Graine maître de la simulation
+        kernel: Noyau de calcul ("python", "numpy" ou "integer")
+        chunk_size: Taille des blocs des noyaux vectorisés
+        sampling: Mode d'échantillonnage ("pseudo" ou "halton")
+        lock: Verrou du compteur partagé (mode "lock")
+        shared_counter: Compteur partagé (mode "lock")
+        slots: Cases de résultats (mode "slots")
+        
+    Returns:
+        list: Couples (fonction, arguments), un par worker
+    """
+    if aggregation == "slots":
+        return [(slot_worker, (share, slots, index, seed, start, kernel, chunk_size,
+                             sampling))
+                for index, (share, start) in enumerate(zip(shares, starts))]
+    
+    return [(worker, (share, lock, shared_counter, seed, start, kernel, chunk_size,
+                        sampling))
+            for share, start in zip(shares, starts)]
+
+
+def count_inside_multi(num_samples: int, num_threads: int,
+                       backend: str = "thread",
+                       seed: Optional[int] = None, kernel: str = "python",
+                       chunk_size: int = DEFAULT_CHUNK_SIZE, start: int = 0,
+                       pool: Optional[WorkerPool] = None,
+                       aggregation: Optional[str] = None,
+                       sampling: str = "pseudo", schedule: str = "static",
+                       task_size: int = DEFAULT_TASK_SIZE,
+                       callbacks: Sequence[TelemetryCallback] = (),
+                       telemetry_interval: float = DEFAULT_TELEMETRY_INTERVAL) -> int:
+    """
+    Compte les points dans le cercle sur une plage d'échantillons (multi-thread).
+    
+    C'est le cœur de calculate_pi_multi, sans chronométrage: la plage
+    [start, start + num_samples) est découpée entre les workers, qui comptent
+    chacun leur part avant que les comptes soient additionnés.
+    
+    Si un pool persistant est fourni, les parts lui sont soumises (il est
+    redimensionné à num_threads si besoin) et son backend remplace backend.
+    
+    L'agrégation "lock" additionne les comptes dans un dictionnaire protégé
+    par un lock (threads uniquement). L'agrégation "slots" donne une case à
+    chaque worker, sans lock; c'est la seule possible pour les processus, dont
+    les cases vivent en mémoire partagée.
+    
+    Avec schedule="dynamic", la plage est découpée en tâches de task_size
+    échantillons que les workers libres prennent dans une file partagée
+    (voir src/scheduler.py): un worker lent ne retarde plus les autres. Les
+    comptes reviennent alors par les résultats des tâches (aggregation n'a
+    pas d'effet).
+    
+    Avec des rappels de télémétrie (callbacks), un thread de surveillance lit
+    les cases des workers toutes les telemetry_interval secondes et envoie un
+    instantané à chaque rappel (voir src/telemetry.py). La télémétrie utilise
+    les cases: l'agrégation par défaut devient alors "slots".
     
     Args:
         num_samples: Nombre total de points aléatoires à générer
-        num_threads: Nombre de threads à utiliser pour le calcul parallèle
+        num_threads: Nombre de threads (ou de processus) pour le calcul parallèle
+        backend: Backend d'exécution, "thread" ou "process"
+        seed: Graine maître (aléatoire si None)
+        kernel: Noyau de calcul, "python", "numpy", "integer" ou "auto" (voir resolve_kernel)
+        chunk_size: Taille des blocs des noyaux vectorisés (borne la mémoire)
+        start: Indice global du premier échantillon de la plage
+        pool: Pool de workers persistant à réutiliser (None = workers créés pour l'appel)
+        aggregation: "lock" ou "slots" (None = "lock" pour les threads,
+                     "slots" pour les processus)
+        sampling: "pseudo" ou "halton" (chaque worker reçoit un segment
+                  disjoint de la suite de Halton)
+        schedule: "static" (une part fixe par worker) ou "dynamic" (file de tâches)
+        task_size: Nombre d'échantillons par tâche pour schedule="dynamic"
+        callbacks: Rappels de télémétrie, appelés avec chaque TelemetrySnapshot
+        telemetry_interval: Temps entre deux instantanés, en secondes
         
     Returns:
-        tuple: (valeur_de_pi, temps_execution_en_secondes)
+        int: Nombre total de points tombés dans le cercle
         
     Raises:
-        ValueError: Si num_samples <= 0 ou num_threads <= 0
+        ValueError: Si num_samples <= 0, num_threads <= 0, chunk_size <= 0,
+                    seed < 0, backend, noyau, agrégation ou ordonnancement inconnus
     """
     # Validation des entrées
     if num_samples <= 0:
@@ -75,19 +346,43 @@ def calculate_pi_multi(num_samples: int, num_threads: int) -> tuple[float, float
     if num_threads <= 0:
         raise ValueError(f"num_threads doit être > 0, reçu: {num_threads}")
     
-    # Avertissement si trop de threads
-    import os
-    cpu_count = os.cpu_count() or 1
-    if num_threads > cpu_count:
-        print(f"⚠️  Attention: {num_threads} threads demandés, mais seulement "
-              f"{cpu_count} cœurs disponibles.")
+    if pool is not None:
+        backend = pool.backend
     
-    # Démarrer le chronomètre
-    start_time = time.perf_counter()
+    if backend not in BACKENDS:
+        raise ValueError(f"backend doit être parmi {BACKENDS}, reçu: {backend!r}")
+    
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size doit être > 0, reçu: {chunk_size}")
     
-    # Diviser le travail entre les threads
-    samples_per_thread = num_samples // num_threads
-    remaining_samples = num_samples % num_threads
+    if aggregation is None:
+        aggregation = "slots" if backend == "process" or callbacks else "lock"
+    
+    if aggregation not in AGGREGATIONS:
+        raise ValueError(f"aggregation doit être parmi {AGGREGATIONS}, reçu: {aggregation!r}")
+    
+    if backend == "process" and aggregation == "lock":
+        raise ValueError("aggregation='lock' impossible avec le backend 'process' "
+                         "(les processus ne partagent pas de lock)")
+    
+    if schedule not in SCHEDULES:
+        raise ValueError(f"schedule doit être parmi {SCHEDULES}, reçu: {schedule!r}")
+    
+    if callbacks and (aggregation != "slots" or schedule != "static"):
+        raise ValueError("la télémétrie (callbacks) nécessite aggregation='slots' "
+                         "et schedule='static'")
+    
+    kernel = resolve_kernel(kernel)
+    seed = resolve_seed(seed)
+    
+    if schedule == "dynamic":
+        # File de petites tâches partagée par les workers du pool
+        return run_dynamic(num_samples, num_threads, backend, seed, kernel, chunk_size,
+                           start, pool, sampling, task_size).inside
+    
+    # Diviser le travail entre les threads (le dernier prend le reste)
+    shares = split_samples(num_samples, num_threads)
+    starts = [start + offset for offset in share_starts(shares)]
     
     # Créer le lock pour protéger le compteur partagé
     lock = threading.Lock()
@@ -95,19 +390,72 @@ def calculate_pi_multi(num_samples: int, num_threads: int) -> tuple[float, float
     # Créer le compteur partagé (dictionnaire pour pouvoir le modifier dans les threads)
     shared_counter = {'inside_circle': 0}
     
+    # Ou bien: une case par worker (en mémoire partagée pour les processus)
+    slots = None
+    if aggregation == "slots":
+        slots = ResultSlots(num_threads, shared=(backend == "process"))
+    
+    # Surveillance des cases pendant le calcul (si des rappels sont fournis)
+    monitor = None
+    if callbacks:
+        monitor = TelemetryMonitor(slots, num_samples, callbacks, telemetry_interval,
+                                   shares)
+        monitor.start()
+    
+    try:
+        tasks = _make_tasks(aggregation, shares, starts, seed, kernel, chunk_size,
+                            sampling, lock, shared_counter, slots)
+        
+        if pool is not None:
+            # Réutiliser les workers déjà démarrés du pool persistant
+            pool.resize(num_threads)
+            _wait_for([pool.submit(target, *args) for target, args in tasks])
+        elif backend == "process":
+            # Pool de processus créé pour ce seul appel
+            with WorkerPool("process", num_threads) as process_pool:
+                _wait_for([process_pool.submit(target, *args) for target, args in tasks])
+        else:
+            _run_threads(tasks)
+        
+        # Réduction: somme des cases (sans lock) ou lecture du compteur partagé
+        if slots is not None:
+            return slots.total_hits()
+        return shared_counter['inside_circle']
+    finally:
+        if monitor is not None:
+            monitor.stop()
+        if slots is not None:
+            slots.close()
+
+
+def _run_threads(tasks: list):
+    """
+    Crée un thread par tâche, les démarre puis attend leur fin.
+    
+    Args:
+        tasks: Couples (fonction, arguments), un par thread
+        
+    Raises:
+        RuntimeError: Si un thread ne termine pas avant le timeout
+        Exception: La première exception levée par un thread (son compte
+                   manquerait sinon au total)
+    """
     # Créer et démarrer tous les threads
     threads: List[threading.Thread] = []
+    errors: List[BaseException] = []
     
-    for i in range(num_threads):
-        # Le dernier thread prend les échantillons restants
-        samples_for_this_thread = samples_per_thread
-        if i == num_threads - 1:
-            samples_for_this_thread += remaining_samples
-        
-        # Créer le thread avec la fonction worker
+    def run_task(target, args):
+        """Exécute la tâche d'un thread et conserve son exception éventuelle."""
+        try:
+            target(*args)
+        except BaseException as error:
+            errors.append(error)
+    
+    for target, args in tasks:
+        # Créer le thread avec la fonction du worker
         thread = threading.Thread(
-            target=worker,
-            args=(samples_for_this_thread, lock, shared_counter)
+            target=run_task,
+            args=(target, args)
         )
         
         # Démarrer le thread (il commence à s'exécuter en parallèle)
@@ -124,8 +472,92 @@ def calculate_pi_multi(num_samples: int, num_threads: int) -> tuple[float, float
         if thread.is_alive():
             raise RuntimeError("Thread bloqué - possible deadlock détecté")
     
-    # Tous les threads ont terminé, on peut maintenant calculer Pi
-    total_inside = shared_counter['inside_circle']
+    # Propager l'erreur d'un thread plutôt que renvoyer une somme partielle
+    if errors:
+        raise errors[0]
+
+
+def calculate_pi_multi(num_samples: int, num_threads: int,
+                       backend: str = "thread",
+                       seed: Optional[int] = None, kernel: str = "python",
+                       chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       pool: Optional[WorkerPool] = None,
+                       aggregation: Optional[str] = None,
+                       sampling: str = "pseudo", schedule: str = "static",
+                       task_size: int = DEFAULT_TASK_SIZE,
+                       callbacks: Sequence[TelemetryCallback] = (),
+                       telemetry_interval: float = DEFAULT_TELEMETRY_INTERVAL
+                       ) -> tuple[float, float]:
+    """
+    Calcule Pi en utilisant la méthode Monte Carlo (multi-thread).
+    
+    Principe:
+    - Diviser le travail total en chunks égaux pour chaque thread
+    - Chaque thread génère ses points et compte localement
+    - Les résultats sont agrégés de manière thread-safe avec un lock
+    - Le calcul final de Pi utilise le total agrégé
+    
+    Avec backend="process", chaque part est calculée dans un processus séparé:
+    le GIL n'est plus un goulot d'étranglement et les comptes sont simplement
+    additionnés à la fin (pas de lock nécessaire).
+    
+    Avec kernel="numpy", chaque thread travaille par blocs vectorisés qui
+    relâchent le GIL: le backend "thread" accélère alors réellement.
+    
+    Pour une même graine et un même noyau, le nombre de points dans le cercle
+    est identique quel que soit le nombre de threads ou le backend (et
+    identique à calculate_pi_mono avec ce noyau).
+    
+    Avec un pool persistant (WorkerPool), le temps mesuré n'inclut plus la
+    création des threads ou des processus.
+    
+    Args:
+        num_samples: Nombre total de points aléatoires à générer
+        num_threads: Nombre de threads (ou de processus) pour le calcul parallèle
+        backend: Backend d'exécution, "thread" ou "process"
+        seed: Graine maître pour un résultat reproductible (aléatoire si None)
+        kernel: Noyau de calcul, "python", "numpy", "integer" ou "auto" (voir resolve_kernel)
+        chunk_size: Taille des blocs des noyaux vectorisés (borne la mémoire)
+        pool: Pool de workers persistant à réutiliser (None = workers créés pour l'appel)
+        aggregation: "lock" (compteur + lock) ou "slots" (une case par worker, sans lock)
+        sampling: "pseudo" (pseudo-aléatoire) ou "halton" (quasi-Monte Carlo)
+        schedule: "static" (une part fixe par worker) ou "dynamic" (file de tâches)
+        task_size: Nombre d'échantillons par tâche pour schedule="dynamic"
+        callbacks: Rappels de télémétrie (ex: ProgressRenderer), appelés
+                   avec chaque TelemetrySnapshot pendant le calcul
+        telemetry_interval: Temps entre deux instantanés, en secondes
+        
+    Returns:
+        tuple: (valeur_de_pi, temps_execution_en_secondes)
+        
+    Raises:
+        ValueError: Si num_samples <= 0, num_threads <= 0, chunk_size <= 0,
+                    seed < 0, backend, noyau, agrégation ou ordonnancement inconnus
+    """
+    # Validation des entrées
+    if num_samples <= 0:
+        raise ValueError(f"num_samples doit être > 0, reçu: {num_samples}")
+    
+    if num_threads <= 0:
+        raise ValueError(f"num_threads doit être > 0, reçu: {num_threads}")
+    
+    # Avertissement si trop de threads
+    import os
+    cpu_count = os.cpu_count() or 1
+    if num_threads > cpu_count:
+        print(f"⚠️  Attention: {num_threads} threads demandés, mais seulement "
+              f"{cpu_count} cœurs disponibles.")
+    
+    # Démarrer le chronomètre
+    start_time = time.perf_counter()
+    
+    # Tous les workers ont terminé, on peut maintenant calculer Pi
+    total_inside = count_inside_multi(num_samples, num_threads, backend,
+                                      seed, kernel, chunk_size, pool=pool,
+                                      aggregation=aggregation, sampling=sampling,
+                                      schedule=schedule, task_size=task_size,
+                                      callbacks=callbacks,
+                                      telemetry_interval=telemetry_interval)
     pi_estimate = 4.0 * total_inside / num_samples
     
     # Arrêter le chronomètre
@@ -148,11 +580,22 @@ if __name__ == "__main__":
     ]
     
     for samples, threads in test_configs:
-        pi_value, exec_time = calculate_pi_multi(samples, threads)
-        error = abs(pi_value - 3.14159265359)
-        
-        print(f"Échantillons: {samples:>10,} | Threads: {threads}")
-        print(f"  Pi calculé: {pi_value:.8f}")
-        print(f"  Erreur:     {error:.8f}")
-        print(f"  Temps:      {exec_time:.4f} secondes")
-        print()
+        for backend in BACKENDS:
+            pi_value, exec_time = calculate_pi_multi(samples, threads, backend=backend)
+            error = abs(pi_value - 3.14159265359)
+            
+            print(f"Échantillons: {samples:>10,} | Threads: {threads} | Backend: {backend}")
+            print(f"  Pi calculé: {pi_value:.8f}")
+            print(f"  Erreur:     {error:.8f}")
+            print(f"  Temps:      {exec_time:.4f} secondes")
+            print()
+    
+    # Moins d'échantillons que de workers: parts vides, même total qu'en mono-thread
+    from src.monte_carlo_mono import calculate_pi_mono
+    
+    for kernel in KERNELS:
+        expected, _ = calculate_pi_mono(3, kernel, seed=1)
+        for backend in BACKENDS:
+            pi_value, _ = calculate_pi_multi(3, 4, backend=backend, seed=1, kernel=kernel)
+            assert pi_value == expected, (kernel, backend, pi_value, expected)
+    print("Parts vides (3 échantillons, 4 workers): OK")
@@ -5,14 +5,31 @@ Ce module mesure et analyse les performances des simulateurs mono-thread et mult
 Il calcule des statistiques (moyenne, écart-type, min, max) et le facteur d'accélération (speedup).
 """
 
+import math
 import statistics
-from dataclasses import dataclass
-from typing import List, Dict
-import psutil
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Sequence
 import os
 
+from src.measurement import MeasurementPolicy, bootstrap_speedup_ci, measure_runs, pinned_cpus
 from src.monte_carlo_mono import calculate_pi_mono
-from src.monte_carlo_multi import calculate_pi_multi
+from src.monte_carlo_multi import BACKENDS, calculate_pi_multi, is_gil_enabled, resolve_kernel
+from src.qmc import SAMPLINGS
+from src.scaling_models import DEFAULT_MIN_EFFICIENCY, ScalingFit, fit_scaling_models
+from src.telemetry import TelemetryCallback
+from src.worker_pool import WorkerPool
+
+
+# Libellés des noyaux dans les noms de configuration
+KERNEL_LABELS = {"python": "Python", "numpy": "NumPy", "integer": "Entier"}
+
+# Libellés des modes d'échantillonnage dans les noms de configuration
+SAMPLING_LABELS = {"pseudo": "Pseudo-aléatoire", "halton": "Halton"}
+
+# Modes de scalabilité:
+# - "strong": nombre total d'échantillons fixe quand le nombre de workers augmente
+# - "weak":   nombre d'échantillons par worker fixe (travail total proportionnel)
+SCALINGS = ("strong", "weak")
 
 
 @dataclass
@@ -28,7 +45,7 @@ class SimulationResult:
 @dataclass
 class BenchmarkResults:
     """Résultats agrégés de plusieurs runs."""
-    configuration: str           # "mono" ou "multi_N"
+    configuration: str           # Nom lisible (ex: "Multi-thread (4 threads)")
     times: List[float]           # Liste des temps de tous les runs
     avg_time: float              # Temps moyen
     std_time: float              # Écart-type
@@ -37,6 +54,101 @@ class BenchmarkResults:
     avg_pi: float                # Valeur moyenne de Pi
     pi_error: float              # Erreur par rapport à math.pi
     speedup: float = 1.0         # Facteur d'accélération (vs mono)
+    cold_start_time: Optional[float] = None  # Temps d'un run avec workers neufs (pool froid)
+    rms_error: float = 0.0       # Erreur quadratique moyenne des runs vs math.pi
+    throughput: float = 0.0      # Débit moyen en échantillons par seconde
+    num_workers: int = 1         # Nombre de workers (1 pour mono)
+    backend: str = "mono"        # "mono", "thread" ou "process"
+    kernel: str = "python"       # Noyau de calcul
+    sampling: str = "pseudo"     # Mode d'échantillonnage
+    num_samples: int = 0         # Échantillons par run
+    baseline: Optional[str] = None  # Clé du mono-thread de référence (None pour mono)
+    median_time: float = 0.0     # Temps médian
+    # Intervalles de confiance bootstrap (mode de mesure rigoureux uniquement)
+    time_ci_low: Optional[float] = None      # Borne basse de la médiane des temps
+    time_ci_high: Optional[float] = None     # Borne haute de la médiane des temps
+    speedup_ci_low: Optional[float] = None   # Borne basse du speedup des médianes
+    speedup_ci_high: Optional[float] = None  # Borne haute du speedup des médianes
+    num_outliers: int = 0        # Runs aberrants écartés des statistiques
+    cpu_usage: float = 0.0       # Utilisation CPU moyenne des runs (% d'un cœur)
+    effective_parallelism: float = 0.0  # Secondes CPU ÷ secondes réelles (moyenne des runs)
+    core_utilization: List[float] = field(default_factory=list)  # % moyen par cœur (système)
+    scaling: str = "strong"      # "strong" ou "weak" (voir SCALINGS)
+    efficiency: float = 1.0      # Efficacité parallèle: speedup / num_workers
+
+
+def default_worker_counts() -> List[int]:
+    """
+    Nombres de workers mesurés par défaut: puissances de deux jusqu'au nombre de cœurs.
+    
+    Le nombre de cœurs lui-même est ajouté s'il n'est pas une puissance de
+    deux (ex: 6 cœurs -> [2, 4, 6]); au moins 2 workers sont toujours mesurés.
+    
+    Returns:
+        list: Nombres de workers croissants
+    """
+    cpu_count = max(os.cpu_count() or 1, 2)
+    counts = []
+    num_workers = 2
+    while num_workers <= cpu_count:
+        counts.append(num_workers)
+        num_workers *= 2
+    if counts[-1] != cpu_count:
+        counts.append(cpu_count)
+    return counts
+
+
+@dataclass
+class BenchmarkMatrix:
+    """
+    Axes d'un benchmark: chaque combinaison est mesurée.
+    
+    En scalabilité faible (scaling="weak"), sample_sizes est le nombre
+    d'échantillons par worker: une configuration à N workers traite
+    N × taille échantillons, et son speedup est le speedup de Gustafson
+    N × temps_mono / temps_multi.
+    
+    Exemple:
+        matrix = BenchmarkMatrix(worker_counts=[2, 4], sample_sizes=[10**6, 10**7],
+                                 backends=["thread", "process"], kernels=["numpy"])
+        results = run_benchmark_matrix(matrix, num_runs=3)
+    """
+    worker_counts: Sequence[int] = field(default_factory=default_worker_counts)
+    sample_sizes: Sequence[int] = (1_000_000,)
+    backends: Sequence[str] = ("thread",)
+    kernels: Sequence[str] = ("python",)
+    samplings: Sequence[str] = ("pseudo",)
+    scaling: str = "strong"
+    
+    def validate(self):
+        """
+        Vérifie les valeurs de chaque axe.
+        
+        Raises:
+            ValueError: Si un axe est vide ou contient une valeur invalide
+        """
+        for name in ("worker_counts", "sample_sizes", "backends", "kernels", "samplings"):
+            if not getattr(self, name):
+                raise ValueError(f"{name} ne doit pas être vide")
+        
+        for num_workers in self.worker_counts:
+            if num_workers <= 0:
+                raise ValueError(f"worker_counts doit contenir des valeurs > 0, reçu: {num_workers}")
+        
+        for num_samples in self.sample_sizes:
+            if num_samples <= 0:
+                raise ValueError(f"num_samples doit être > 0, reçu: {num_samples}")
+        
+        for backend in self.backends:
+            if backend not in BACKENDS:
+                raise ValueError(f"backend doit être parmi {BACKENDS}, reçu: {backend!r}")
+        
+        for sampling in self.samplings:
+            if sampling not in SAMPLINGS:
+                raise ValueError(f"sampling doit être parmi {SAMPLINGS}, reçu: {sampling!r}")
+        
+        if self.scaling not in SCALINGS:
+            raise ValueError(f"scaling doit être parmi {SCALINGS}, reçu: {self.scaling!r}")
 
 
 def calculate_speedup(mono_time: float, multi_time: float) -> float:
@@ -67,114 +179,481 @@ def measure_cpu_usage() -> float:
     """
     Mesure l'utilisation CPU actuelle du système.
     
+    Instantané pris hors de toute simulation: pour l'utilisation pendant un
+    run, voir CpuSampler (src/cpu_sampler.py).
+    
     Returns:
         float: Pourcentage d'utilisation CPU (0-100)
     """
+    # Import local: psutil n'est chargé que si une mesure CPU est demandée
+    import psutil
+
     return psutil.cpu_percent(interval=0.1)
 
 
-def run_benchmark(num_samples: int, num_runs: int = 5) -> Dict[str, BenchmarkResults]:
+def run_seed(seed: Optional[int], run: int) -> Optional[int]:
     """
-    Exécute un benchmark complet avec plusieurs runs pour obtenir des statistiques fiables.
+    Calcule la graine d'un run à partir de la graine maître du benchmark.
+    
+    Toutes les configurations utilisent la même graine pour un run donné:
+    elles calculent donc exactement la même valeur de Pi, et seules les
+    différences de temps restent à comparer.
+    
+    Args:
+        seed: Graine maître du benchmark (None = non reproductible)
+        run: Numéro du run (0, 1, 2, ...)
+        
+    Returns:
+        int ou None: Graine à passer aux simulateurs
+    """
+    if seed is None:
+        return None
+    return seed + run
+
+
+def _benchmark_configuration(label: str, simulate, num_samples: int, num_runs: int,
+                             seed: Optional[int],
+                             measurement: Optional[MeasurementPolicy] = None,
+                             num_workers: int = 1) -> BenchmarkResults:
+    """
+    Exécute une configuration num_runs fois et calcule ses statistiques.
+    
+    Avec une politique de mesure, les runs suivent measure_runs (échauffement,
+    répétition jusqu'à un intervalle stable, runs aberrants écartés) et
+    l'intervalle de confiance bootstrap de la médiane est calculé.
+    
+    Chaque run est accompagné d'un CpuSampler: l'utilisation CPU et le
+    parallélisme effectif de la configuration sont les moyennes des runs.
+    
+    Args:
+        label: Nom lisible de la configuration (ex: "Multi-thread (4 threads)")
+        simulate: Fonction (graine) -> (valeur_de_pi, temps) qui lance un run
+        num_samples: Nombre d'échantillons d'un run (pour le débit)
+        num_runs: Nombre de répétitions (ignoré avec une politique de mesure)
+        seed: Graine maître du benchmark (None = non reproductible)
+        measurement: Politique de mesure rigoureuse (None = num_runs runs bruts)
+        num_workers: Nombre de workers de la configuration
+        
+    Returns:
+        BenchmarkResults: Statistiques de la configuration (speedup = 1.0)
+    """
+    # Import local: psutil n'est chargé que pour un benchmark (pas par un
+    # simple import de ce module, ex: BenchmarkResults dans src.visualization)
+    from src.cpu_sampler import CpuSampler, CpuUsageReport
+    
+    times = []
+    pi_values = []
+    measured = None
+    runs: List[SimulationResult] = []
+    cpu_reports: List[CpuUsageReport] = []
+    
+    def sampled_run(seed_: Optional[int]):
+        # Un run accompagné de la mesure de son utilisation CPU
+        with CpuSampler() as sampler:
+            pi_value, exec_time = simulate(seed_)
+        cpu_reports.append(sampler.report)
+        runs.append(SimulationResult(pi_value, exec_time, num_samples, num_workers,
+                                     cpu_usage=sampler.report.cpu_usage))
+        return pi_value, exec_time
+    
+    if measurement is not None:
+        measured = measure_runs(lambda run: sampled_run(run_seed(seed, run)), measurement)
+        times, pi_values = measured.times, measured.pi_values
+    else:
+        for run in range(num_runs):
+            pi_value, exec_time = sampled_run(run_seed(seed, run))
+            times.append(exec_time)
+            pi_values.append(pi_value)
+            print(f"  Run {run + 1}/{num_runs}: {exec_time:.4f}s, Pi = {pi_value:.6f}")
+    
+    # Calculer les statistiques pour cette configuration
+    avg_time = statistics.mean(times)
+    std_time = statistics.stdev(times) if len(times) > 1 else 0.0
+    avg_pi = statistics.mean(pi_values)
+    rms_error = math.sqrt(statistics.mean((p - math.pi) ** 2 for p in pi_values))
+    
+    throughput = num_samples / avg_time if avg_time > 0 else 0.0
+    
+    # Utilisation CPU des runs mesurés (les runs d'échauffement sont les premiers)
+    runs, cpu_reports = runs[-len(pi_values):], cpu_reports[-len(pi_values):]
+    
+    print(f"  ✓ Moyenne: {avg_time:.4f}s ± {std_time:.4f}s ({throughput:,.0f} éch/s)")
+    
+    result = BenchmarkResults(
+        configuration=label,
+        times=times,
+        avg_time=avg_time,
+        std_time=std_time,
+        min_time=min(times),
+        max_time=max(times),
+        avg_pi=avg_pi,
+        pi_error=abs(avg_pi - math.pi),
+        rms_error=rms_error,
+        throughput=throughput,
+        median_time=statistics.median(times),
+        cpu_usage=statistics.mean(run.cpu_usage for run in runs),
+        effective_parallelism=statistics.mean(r.effective_parallelism for r in cpu_reports),
+        core_utilization=[statistics.mean(cores)
+                          for cores in zip(*(r.core_utilization for r in cpu_reports))],
+    )
+    
+    if measured is not None:
+        result.time_ci_low, result.time_ci_high = measured.ci_low, measured.ci_high
+        result.num_outliers = measured.num_outliers
+        print(f"  ✓ Médiane: {measured.median_time:.4f}s "
+              f"[{measured.ci_low:.4f}, {measured.ci_high:.4f}] sur {len(times)} runs"
+              f"{'' if measured.converged else ' (intervalle cible non atteint)'}")
+    
+    return result
+
+
+def _result_key(num_workers: int, backend: str, kernel: str, sampling: str,
+                num_samples: int, multiple_sizes: bool, scaling: str = "strong") -> str:
+    """
+    Construit la clé d'une configuration dans le dictionnaire de résultats.
+    
+    Forme: 'mono' ou 'multi_<N>', suivie d'un suffixe par axe qui n'a pas sa
+    valeur par défaut: '_<noyau>' (sauf "python"), '_halton', '_<backend>'
+    (sauf "thread"), '_n<échantillons>' si la matrice a plusieurs tailles et
+    '_weak' en scalabilité faible.
+    Exemples: 'mono', 'multi_4', 'multi_4_numpy', 'multi_8_process_n1000000'.
+    
+    Args:
+        num_workers: Nombre de workers (1 et backend "mono" pour le mono-thread)
+        backend: "mono", "thread" ou "process"
+        kernel: Noyau effectif
+        sampling: Mode d'échantillonnage
+        num_samples: Nombre d'échantillons d'un run
+        multiple_sizes: True si la matrice mesure plusieurs tailles
+        scaling: "strong" ou "weak"
+        
+    Returns:
+        str: Clé de la configuration
+    """
+    key = "mono" if backend == "mono" else f"multi_{num_workers}"
+    if sampling == "halton":
+        key += "_halton"
+    elif kernel != "python":
+        key += f"_{kernel}"
+    if backend not in ("mono", "thread"):
+        key += f"_{backend}"
+    if multiple_sizes:
+        key += f"_n{num_samples}"
+    if scaling == "weak":
+        key += "_weak"
+    return key
+
+
+def run_benchmark_matrix(matrix: BenchmarkMatrix, num_runs: int = 5,
+                         seed: Optional[int] = None,
+                         use_pool: bool = True,
+                         aggregation: Optional[str] = None,
+                         callbacks: Sequence[TelemetryCallback] = (),
+                         measurement: Optional[MeasurementPolicy] = None
+                         ) -> Dict[str, BenchmarkResults]:
+    """
+    Exécute toutes les configurations d'une matrice de benchmark.
+    
+    Pour chaque taille d'échantillon et chaque variante (noyau, échantillonnage):
+    1. Mono-thread (num_runs fois), référence du speedup
+    2. Pour chaque backend et chaque nombre de workers: multi-worker
+       (num_runs fois), speedup par rapport au mono-thread de la même variante
     
-    Le benchmark exécute:
+    Le noyau n'a pas d'effet en mode "halton" (toujours vectorisé): ce mode
+    n'est mesuré qu'une fois par taille.
+    
+    En scalabilité faible (matrix.scaling="weak"), chaque worker garde le
+    même nombre d'échantillons: le speedup est N × temps_mono / temps_multi
+    (Gustafson). Dans les deux modes, efficiency = speedup / N.
+    
+    Avec use_pool=True, un WorkerPool par backend est réutilisé d'un run et
+    d'une configuration à l'autre (pool "chaud"); un run supplémentaire avec
+    des workers neufs mesure le coût de démarrage (cold_start_time).
+    
+    Avec une politique de mesure (MeasurementPolicy), chaque configuration est
+    mesurée de façon rigoureuse (échauffement, répétition jusqu'à un
+    intervalle stable, runs aberrants écartés, épinglage CPU optionnel):
+    speedup devient le rapport des médianes et les résultats portent les
+    intervalles de confiance bootstrap des temps et du speedup.
+    
+    Args:
+        matrix: Axes du benchmark
+        num_runs: Nombre de répétitions pour calculer les statistiques
+        seed: Graine maître pour des runs reproductibles (aléatoire si None)
+        use_pool: Réutiliser un pool de workers persistant entre les runs
+        aggregation: Agrégation des comptes, "lock" ou "slots" (None = selon le backend)
+        callbacks: Rappels de télémétrie passés à chaque simulation mesurée
+        measurement: Politique de mesure rigoureuse (None = num_runs runs bruts)
+        
+    Returns:
+        dict: Résultats de chaque configuration, dans l'ordre d'exécution
+              (clés construites par _result_key; les champs de chaque
+              BenchmarkResults décrivent sa configuration)
+        
+    Raises:
+        ValueError: Si la matrice ou num_runs est invalide
+    """
+    matrix.validate()
+    
+    if num_runs <= 0:
+        raise ValueError(f"num_runs doit être > 0, reçu: {num_runs}")
+    
+    if measurement is not None:
+        measurement.validate()
+        num_runs = measurement.min_runs
+    
+    print(f"📊 Benchmark: {len(matrix.sample_sizes)} taille(s), "
+          f"{len(matrix.backends)} backend(s), workers {list(matrix.worker_counts)}, "
+          f"{num_runs} runs par configuration\n")
+    
+    # Variantes mesurées: (noyau, échantillonnage, libellé)
+    variants = []
+    if "pseudo" in matrix.samplings:
+        for kernel in dict.fromkeys(resolve_kernel(k) for k in matrix.kernels):
+            label = "" if kernel == "python" else f" {KERNEL_LABELS[kernel]}"
+            variants.append((kernel, "pseudo", label))
+    if "halton" in matrix.samplings:
+        variants.append(("numpy", "halton", f" {SAMPLING_LABELS['halton']}"))
+    
+    # Épinglage CPU avant de créer les pools: les workers héritent de l'affinité
+    with pinned_cpus(measurement.pin_cpus if measurement is not None else None):
+        return _run_matrix(matrix, variants, num_runs, seed, use_pool, aggregation,
+                           callbacks, measurement)
+
+
+def _run_matrix(matrix: BenchmarkMatrix, variants: list, num_runs: int,
+                seed: Optional[int], use_pool: bool, aggregation: Optional[str],
+                callbacks: Sequence[TelemetryCallback],
+                measurement: Optional[MeasurementPolicy]) -> Dict[str, BenchmarkResults]:
+    """Boucle de mesure de run_benchmark_matrix (paramètres déjà validés)."""
+    multiple_sizes = len(matrix.sample_sizes) > 1
+    weak = matrix.scaling == "weak"
+    results = {}
+    pools = {backend: WorkerPool(backend) for backend in matrix.backends} if use_pool else {}
+    
+    try:
+        for num_samples in matrix.sample_sizes:
+            size_label = f" [{num_samples:,} éch.]" if multiple_sizes else ""
+            if weak:
+                size_label = f" [{num_samples:,} éch./worker]"
+            
+            for kernel, sampling, kernel_label in variants:
+                
+                # ========== MONO-THREAD ==========
+                print(f"🔄 Exécution mono-thread{kernel_label}{size_label}...")
+                
+                mono_key = _result_key(1, "mono", kernel, sampling, num_samples, multiple_sizes,
+                                       matrix.scaling)
+                mono = _benchmark_configuration(
+                    f'Mono-thread{kernel_label}{size_label}',
+                    lambda run_seed_: calculate_pi_mono(num_samples, kernel=kernel,
+                                                       seed=run_seed_, sampling=sampling,
+                                                       callbacks=callbacks),
+                    num_samples, num_runs, seed, measurement
+                )
+                mono.speedup = 1.0  # Référence
+                mono.kernel, mono.sampling, mono.num_samples = kernel, sampling, num_samples
+                mono.scaling = matrix.scaling
+                results[mono_key] = mono
+                print()
+                
+                # ========== MULTI-WORKER pour chaque backend et nombre de workers ==========
+                for backend in matrix.backends:
+                    worker_label = "thread" if backend == "thread" else "process"
+                    worker_unit = "threads" if backend == "thread" else "processus"
+                    pool = pools.get(backend)
+                    
+                    for num_workers in matrix.worker_counts:
+                        # Scalabilité faible: travail total proportionnel aux workers
+                        run_samples = num_samples * num_workers if weak else num_samples
+                        
+                        print(f"🔄 Exécution multi-{worker_label}{kernel_label}{size_label} "
+                              f"({num_workers} {worker_unit})...")
+                        
+                        cold_start_time = None
+                        if pool is not None:
+                            # Démarrage à froid: workers créés pour ce seul run
+                            _, cold_start_time = calculate_pi_multi(
+                                run_samples, num_workers, backend, seed=run_seed(seed, 0),
+                                kernel=kernel, aggregation=aggregation, sampling=sampling
+                            )
+                            print(f"  Démarrage à froid: {cold_start_time:.4f}s")
+                            
+                            # Pool chaud: dimensionné et démarré avant les runs mesurés
+                            pool.resize(num_workers)
+                            pool.warm_up()
+                        
+                        multi = _benchmark_configuration(
+                            f'Multi-{worker_label}{kernel_label} '
+                            f'({num_workers} {worker_unit}){size_label}',
+                            lambda run_seed_: calculate_pi_multi(run_samples, num_workers, backend,
+                                                                 seed=run_seed_, kernel=kernel,
+                                                                 pool=pool,
+                                                                 aggregation=aggregation,
+                                                                 sampling=sampling,
+                                                                 callbacks=callbacks),
+                            run_samples, num_runs, seed, measurement, num_workers
+                        )
+                        if measurement is None:
+                            multi.speedup = calculate_speedup(mono.avg_time, multi.avg_time)
+                        else:
+                            (multi.speedup, multi.speedup_ci_low,
+                             multi.speedup_ci_high) = bootstrap_speedup_ci(
+                                mono.times, multi.times, measurement.confidence,
+                                measurement.bootstrap_resamples)
+                        if weak:
+                            # Speedup de Gustafson: N fois plus de travail dans le même temps = N
+                            multi.speedup *= num_workers
+                            if multi.speedup_ci_low is not None:
+                                multi.speedup_ci_low *= num_workers
+                                multi.speedup_ci_high *= num_workers
+                        multi.efficiency = multi.speedup / num_workers
+                        multi.cold_start_time = cold_start_time
+                        multi.num_workers, multi.backend = num_workers, backend
+                        multi.kernel, multi.sampling = kernel, sampling
+                        multi.num_samples, multi.baseline = run_samples, mono_key
+                        multi.scaling = matrix.scaling
+                        results[_result_key(num_workers, backend, kernel, sampling,
+                                            num_samples, multiple_sizes, matrix.scaling)] = multi
+                        
+                        if multi.speedup_ci_low is not None:
+                            print(f"  ✓ Speedup: {multi.speedup:.2f}x "
+                                  f"[{multi.speedup_ci_low:.2f}, {multi.speedup_ci_high:.2f}]\n")
+                        else:
+                            print(f"  ✓ Speedup: {multi.speedup:.2f}x\n")
+    finally:
+        for pool in pools.values():
+            pool.shutdown()
+    
+    return results
+
+
+def run_benchmark(num_samples: int, num_runs: int = 5,
+                  seed: Optional[int] = None,
+                  thread_kernels: Sequence[str] = ("python",),
+                  backend: str = "thread",
+                  use_pool: bool = True,
+                  aggregation: Optional[str] = None,
+                  samplings: Sequence[str] = ("pseudo",),
+                  callbacks: Sequence[TelemetryCallback] = (),
+                  worker_counts: Optional[Sequence[int]] = None,
+                  measurement: Optional[MeasurementPolicy] = None,
+                  scaling: str = "strong") -> Dict[str, BenchmarkResults]:
+    """
+    Exécute un benchmark complet pour une taille d'échantillon et un backend.
+    
+    Raccourci de run_benchmark_matrix pour une matrice à une seule taille et
+    un seul backend. Le benchmark exécute:
     1. Mono-thread (num_runs fois)
-    2. Multi-thread avec 2 threads (num_runs fois)
-    3. Multi-thread avec 4 threads (num_runs fois)
-    4. Multi-thread avec 8 threads (num_runs fois)
+    2. Multi-worker pour chaque nombre de workers de worker_counts
+       (par défaut les puissances de deux jusqu'au nombre de cœurs)
     
     Pour chaque configuration, on calcule:
     - Temps moyen, min, max, écart-type
     - Valeur moyenne de Pi et erreur
     - Speedup par rapport au mono-thread
     
+    Ces étapes sont répétées pour chaque noyau de thread_kernels. Avec
+    ("python", "numpy"), on obtient côte à côte les threads bloqués par le GIL
+    (boucle Python pure) et les threads qui le relâchent (blocs NumPy).
+    Chaque speedup est calculé par rapport au mono-thread du même noyau.
+    
+    Avec samplings=("pseudo", "halton"), les mêmes configurations sont aussi
+    mesurées en quasi-Monte Carlo (suite de Halton brouillée): l'erreur
+    quadratique moyenne (rms_error) de chaque configuration permet alors de
+    comparer la précision obtenue pour un même temps de calcul.
+    
     Args:
         num_samples: Nombre d'échantillons pour chaque simulation
         num_runs: Nombre de répétitions pour calculer les statistiques
+        seed: Graine maître pour des runs reproductibles (aléatoire si None)
+        thread_kernels: Noyaux à mesurer ("python", "numpy", "integer" ou "auto")
+        backend: Backend d'exécution multi-worker, "thread" ou "process"
+        use_pool: Réutiliser un pool de workers persistant entre les runs
+        aggregation: Agrégation des comptes, "lock" ou "slots" (None = selon le backend)
+        samplings: Modes d'échantillonnage à mesurer ("pseudo", "halton")
+        callbacks: Rappels de télémétrie passés à chaque simulation mesurée
+                   (ex: [ProgressRenderer()] pour une barre de progression)
+        worker_counts: Nombres de workers à mesurer (None = default_worker_counts())
+        measurement: Politique de mesure rigoureuse (None = num_runs runs bruts)
+        scaling: "strong" (num_samples au total) ou "weak" (num_samples par worker)
         
     Returns:
         dict: Dictionnaire avec les résultats pour chaque configuration
-              Clés: 'mono', 'multi_2', 'multi_4', 'multi_8'
+              Clés: 'mono', 'multi_<N>' pour le noyau "python", suffixées
+              par '_<noyau>' pour les autres noyaux (ex: 'mono_numpy',
+              'multi_4_numpy'), par '_halton' pour le quasi-Monte Carlo et
+              par '_process' pour le backend "process"
     """
-    import math
-    
     # Validation des entrées
     if num_samples <= 0:
         raise ValueError(f"num_samples doit être > 0, reçu: {num_samples}")
     
-    if num_runs <= 0:
-        raise ValueError(f"num_runs doit être > 0, reçu: {num_runs}")
+    matrix = BenchmarkMatrix(
+        worker_counts=default_worker_counts() if worker_counts is None else worker_counts,
+        sample_sizes=(num_samples,),
+        backends=(backend,),
+        kernels=thread_kernels,
+        samplings=samplings,
+        scaling=scaling,
+    )
+    return run_benchmark_matrix(matrix, num_runs, seed, use_pool, aggregation, callbacks,
+                                measurement)
+
+
+def group_series(results: Dict[str, BenchmarkResults]) -> Dict[str, List[BenchmarkResults]]:
+    """
+    Regroupe les résultats en séries de scalabilité.
     
-    print(f"📊 Benchmark avec {num_samples:,} échantillons, {num_runs} runs par configuration\n")
+    Une série réunit les configurations multi-worker d'un même backend, noyau,
+    échantillonnage, mode de scalabilité et mono-thread de référence, triées
+    par nombre de workers et précédées de ce mono-thread (1 worker).
     
-    results = {}
+    Args:
+        results: Dictionnaire des résultats du benchmark
+        
+    Returns:
+        dict: Libellé de la série -> résultats triés par nombre de workers
+    """
+    sizes = {r.num_samples for r in results.values() if r.baseline is None}
+    series: Dict[str, List[BenchmarkResults]] = {}
     
-    # ========== MONO-THREAD ==========
-    print("🔄 Exécution mono-thread...")
-    mono_times = []
-    mono_pi_values = []
-    
-    for run in range(num_runs):
-        pi_value, exec_time = calculate_pi_mono(num_samples)
-        mono_times.append(exec_time)
-        mono_pi_values.append(pi_value)
-        print(f"  Run {run + 1}/{num_runs}: {exec_time:.4f}s, Pi = {pi_value:.6f}")
-    
-    # Calculer les statistiques pour mono-thread
-    mono_avg = statistics.mean(mono_times)
-    mono_std = statistics.stdev(mono_times) if len(mono_times) > 1 else 0.0
-    mono_pi_avg = statistics.mean(mono_pi_values)
-    
-    results['mono'] = BenchmarkResults(
-        configuration='Mono-thread',
-        times=mono_times,
-        avg_time=mono_avg,
-        std_time=mono_std,
-        min_time=min(mono_times),
-        max_time=max(mono_times),
-        avg_pi=mono_pi_avg,
-        pi_error=abs(mono_pi_avg - math.pi),
-        speedup=1.0  # Référence
-    )
+    for r in results.values():
+        if r.baseline is None:
+            continue
+        label = ("Thread" if r.backend == "thread" else "Process")
+        label += f" {KERNEL_LABELS[r.kernel]}" if r.sampling == "pseudo" else \
+            f" {SAMPLING_LABELS[r.sampling]}"
+        if len(sizes) > 1 and r.baseline in results:
+            label += f" [{results[r.baseline].num_samples:,} éch.]"
+        if r.scaling == "weak":
+            label += " (faible)"
+        
+        if label not in series:
+            series[label] = [results[r.baseline]] if r.baseline in results else []
+        series[label].append(r)
     
-    print(f"  ✓ Moyenne: {mono_avg:.4f}s ± {mono_std:.4f}s\n")
+    for label, members in series.items():
+        members.sort(key=lambda r: r.num_workers)
     
-    # ========== MULTI-THREAD avec différentes configurations ==========
-    thread_configs = [2, 4, 8]
+    return series
+
+
+def fit_series_models(results: Dict[str, BenchmarkResults]) -> Dict[str, Dict[str, ScalingFit]]:
+    """
+    Ajuste les lois d'Amdahl et de Gustafson sur chaque série de scalabilité.
     
-    for num_threads in thread_configs:
-        print(f"🔄 Exécution multi-thread ({num_threads} threads)...")
-        multi_times = []
-        multi_pi_values = []
-        
-        for run in range(num_runs):
-            pi_value, exec_time = calculate_pi_multi(num_samples, num_threads)
-            multi_times.append(exec_time)
-            multi_pi_values.append(pi_value)
-            print(f"  Run {run + 1}/{num_runs}: {exec_time:.4f}s, Pi = {pi_value:.6f}")
+    Args:
+        results: Dictionnaire des résultats du benchmark
         
-        # Calculer les statistiques pour cette configuration multi-thread
-        multi_avg = statistics.mean(multi_times)
-        multi_std = statistics.stdev(multi_times) if len(multi_times) > 1 else 0.0
-        multi_pi_avg = statistics.mean(multi_pi_values)
-        speedup = calculate_speedup(mono_avg, multi_avg)
-        
-        results[f'multi_{num_threads}'] = BenchmarkResults(
-            configuration=f'Multi-thread ({num_threads} threads)',
-            times=multi_times,
-            avg_time=multi_avg,
-            std_time=multi_std,
-            min_time=min(multi_times),
-            max_time=max(multi_times),
-            avg_pi=multi_pi_avg,
-            pi_error=abs(multi_pi_avg - math.pi),
-            speedup=speedup
-        )
-        
-        print(f"  ✓ Moyenne: {multi_avg:.4f}s ± {multi_std:.4f}s")
-        print(f"  ✓ Speedup: {speedup:.2f}x\n")
-    
-    return results
+    Returns:
+        dict: Libellé de la série -> {"amdahl": ScalingFit, "gustafson": ScalingFit}
+    """
+    return {
+        label: fit_scaling_models([r.num_workers for r in members],
+                                  [r.speedup for r in members])
+        for label, members in group_series(results).items()
+    }
 
 
 def display_results_table(results: Dict[str, BenchmarkResults]):
@@ -184,30 +663,91 @@ def display_results_table(results: Dict[str, BenchmarkResults]):
     Args:
         results: Dictionnaire des résultats du benchmark
     """
-    print("\n" + "="*80)
+    # Largeur de la première colonne: s'adapte aux noms de la matrice mesurée
+    name_width = max([34] + [len(r.configuration) + 1 for r in results.values()])
+    line_width = name_width + 46
+    
+    print("\n" + "="*line_width)
     print("📊 RÉSULTATS DU BENCHMARK")
-    print("="*80)
+    print("="*line_width)
     
     # En-tête du tableau
-    print(f"{'Configuration':<25} {'Temps (s)':<15} {'Speedup':<12} {'Pi calculé':<15}")
-    print("-"*80)
-    
-    # Lignes du tableau
-    for key in ['mono', 'multi_2', 'multi_4', 'multi_8']:
-        if key in results:
-            r = results[key]
-            time_str = f"{r.avg_time:.4f} ± {r.std_time:.4f}"
-            speedup_str = f"{r.speedup:.2f}x" if r.speedup > 1 else "-"
-            pi_str = f"{r.avg_pi:.8f}"
-            
-            print(f"{r.configuration:<25} {time_str:<15} {speedup_str:<12} {pi_str:<15}")
+    print(f"{'Configuration':<{name_width}} {'Temps (s)':<17} {'Speedup':<12} {'Pi calculé':<12}")
+    print("-"*line_width)
     
-    print("="*80)
+    # Lignes du tableau (dans l'ordre d'exécution du benchmark)
+    for r in results.values():
+        time_str = f"{r.avg_time:.4f} ± {r.std_time:.4f}"
+        speedup_str = f"{r.speedup:.2f}x" if r.speedup > 1 else "-"
+        pi_str = f"{r.avg_pi:.8f}"
+        
+        print(f"{r.configuration:<{name_width}} {time_str:<17} {speedup_str:<12} {pi_str:<12}")
+    
+    print("="*line_width)
+    
+    # Débit: comparable entre noyaux de coûts par point différents
+    print("\n🚀 Débit (échantillons par seconde)")
+    for r in results.values():
+        print(f"   {r.configuration:<{name_width}} {r.throughput:>16,.0f} éch/s")
+    
+    # Coût de démarrage des workers (pool froid vs pool chaud)
+    cold_results = [r for r in results.values() if r.cold_start_time is not None]
+    if cold_results:
+        print("\n⏱️  Démarrage à froid vs pool chaud")
+        for r in cold_results:
+            print(f"   {r.configuration:<{name_width}} froid: {r.cold_start_time:.4f}s | "
+                  f"chaud: {r.avg_time:.4f}s")
+    
+    # Précision vs temps: utile quand plusieurs modes d'échantillonnage sont mesurés
+    if any(r.sampling == "halton" for r in results.values()):
+        print("\n🎯 Précision vs temps (erreur quadratique moyenne des runs)")
+        for r in results.values():
+            print(f"   {r.configuration:<{name_width}} erreur: {r.rms_error:.2e} | "
+                  f"temps: {r.avg_time:.4f}s")
+    
+    # Médianes et intervalles de confiance (mode de mesure rigoureux)
+    if any(r.time_ci_low is not None for r in results.values()):
+        print("\n📏 Médiane et intervalles de confiance bootstrap")
+        for r in results.values():
+            line = (f"   {r.configuration:<{name_width}} médiane: {r.median_time:.4f}s "
+                    f"[{r.time_ci_low:.4f}, {r.time_ci_high:.4f}]")
+            if r.speedup_ci_low is not None:
+                line += (f" | speedup: {r.speedup:.2f}x "
+                         f"[{r.speedup_ci_low:.2f}, {r.speedup_ci_high:.2f}]")
+            if r.num_outliers:
+                line += f" | {r.num_outliers} run(s) aberrant(s) écarté(s)"
+            print(line)
+    
+    # Parallélisme effectif mesuré pendant les runs: proche de 1 quand le GIL
+    # sérialise les threads, proche du nombre de workers sinon
+    print("\n🧮 Parallélisme effectif (secondes CPU ÷ secondes réelles, pendant les runs)")
+    for r in results.values():
+        busiest = max(r.core_utilization, default=0.0)
+        print(f"   {r.configuration:<{name_width}} {r.effective_parallelism:>5.2f} cœurs "
+              f"| CPU: {r.cpu_usage:>6.1f}% | cœur le plus chargé: {busiest:.0f}%")
+    
+    # Efficacité parallèle et modèles de scalabilité ajustés
+    fits = fit_series_models(results)
+    if fits:
+        print("\n📐 Efficacité parallèle (speedup ÷ workers)")
+        for r in results.values():
+            if r.baseline is not None:
+                print(f"   {r.configuration:<{name_width}} {r.efficiency:>6.1%}")
+        
+        print(f"\n📈 Modèles de scalabilité (workers utiles: efficacité prédite "
+              f"≥ {DEFAULT_MIN_EFFICIENCY:.0%})")
+        for label, series_fits in fits.items():
+            for model, fit in series_fits.items():
+                useful = fit.max_useful_workers()
+                useful_str = "illimité" if math.isinf(useful) else f"{useful:.0f}"
+                print(f"   {label:<{name_width}} {model.capitalize():<10} "
+                      f"s = {fit.serial_fraction:.3f} | R² = {fit.r_squared:>6.3f} "
+                      f"| workers utiles: {useful_str}")
     
     # Informations système
     cpu_count = os.cpu_count() or 1
-    cpu_usage = measure_cpu_usage()
-    print(f"\n💻 Système: {cpu_count} cœurs CPU, utilisation actuelle: {cpu_usage:.1f}%")
+    print(f"\n💻 Système: {cpu_count} cœurs CPU")
+    print(f"   GIL: {'actif' if is_gil_enabled() else 'désactivé (CPython free-threaded)'}")
     print()
 
 
@@ -216,7 +756,9 @@ if __name__ == "__main__":
     print("=== Test de l'analyseur de performance ===\n")
     
     # Benchmark avec un petit nombre d'échantillons pour le test
-    results = run_benchmark(num_samples=100000, num_runs=3)
+    results = run_benchmark(num_samples=100000, num_runs=3,
+                            thread_kernels=("python", "numpy", "integer"),
+                            samplings=("pseudo", "halton"))
     
     # Afficher les résultats
     display_results_table(results)
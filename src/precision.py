@@ -0,0 +1,222 @@
+"""
+Estimation de Pi à précision cible (arrêt anticipé)
+
+Au lieu de fixer num_samples à l'avance, on fixe l'erreur absolue acceptable
+et un niveau de confiance. Les points sont tirés par lots; après chaque lot on
+met à jour l'erreur standard de la proportion de points dans le cercle, et on
+s'arrête dès que la demi-largeur de l'intervalle de confiance atteint la cible.
+
+Statistique utilisée:
+- p = points_dans_cercle / points_totaux (proportion binomiale)
+- erreur standard de Pi: se = 4 × √(p(1 - p) / n)
+- intervalle de confiance: Pi ± z × se, avec z le quantile de la loi normale
+
+L'approximation normale n'est valable qu'avec assez de points dans et hors du
+cercle: si tous les points d'un petit lot tombent dans le cercle, p = 1 et
+se = 0, ce qui arrêterait la simulation à tort. Le test d'arrêt n'est donc
+appliqué qu'à partir de MIN_CLASS_COUNT points de chaque côté (n·p ≥ 10 et
+n·(1 - p) ≥ 10).
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Optional
+
+from src.block_cache import BlockCache, count_inside_cached
+from src.kernels import DEFAULT_CHUNK_SIZE
+from src.monte_carlo_mono import count_inside_mono
+from src.monte_carlo_multi import count_inside_multi
+from src.seeding import resolve_seed
+from src.worker_pool import WorkerPool
+
+
+# Taille par défaut d'un lot entre deux tests d'arrêt
+DEFAULT_BATCH_SIZE = 100_000
+
+# Nombre minimal de points dans et hors du cercle avant le test d'arrêt
+# (condition usuelle de validité de l'approximation normale)
+MIN_CLASS_COUNT = 10
+
+# Simulateurs acceptés par estimate_pi_to_precision
+SIMULATORS = ("mono", "multi")
+
+
+@dataclass
+class PrecisionEstimate:
+    """Résultat d'une estimation de Pi à précision cible."""
+    pi_value: float              # Valeur de Pi estimée
+    ci_low: float                # Borne basse de l'intervalle de confiance
+    ci_high: float               # Borne haute de l'intervalle de confiance
+    half_width: float            # Demi-largeur de l'intervalle (erreur atteinte)
+    std_error: float             # Erreur standard de l'estimation
+    confidence: float            # Niveau de confiance (ex: 0.95)
+    num_samples: int             # Nombre d'échantillons réellement utilisés
+    execution_time: float        # Temps en secondes
+    converged: bool = True       # False si max_samples a été atteint avant la cible
+
+
+def confidence_z(confidence: float) -> float:
+    """
+    Quantile de la loi normale pour un intervalle bilatéral.
+
+    Exemple: confidence = 0.95 → z ≈ 1.96
+
+    Args:
+        confidence: Niveau de confiance, strictement entre 0 et 1
+
+    Returns:
+        float: Quantile z tel que P(|Z| ≤ z) = confidence
+    """
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+def pi_standard_error(inside: int, num_samples: int) -> float:
+    """
+    Erreur standard de l'estimation Pi = 4 × inside / num_samples.
+
+    Args:
+        inside: Nombre de points dans le cercle
+        num_samples: Nombre total de points
+
+    Returns:
+        float: Erreur standard de l'estimation de Pi
+    """
+    p = inside / num_samples
+    return 4.0 * math.sqrt(p * (1 - p) / num_samples)
+
+
+def estimate_pi_to_precision(target_error: float, confidence: float = 0.95,
+                             simulator: str = "mono", num_threads: int = 4,
+                             backend: str = "thread", kernel: str = "numpy",
+                             batch_size: int = DEFAULT_BATCH_SIZE,
+                             max_samples: Optional[int] = None,
+                             seed: Optional[int] = None,
+                             chunk_size: int = DEFAULT_CHUNK_SIZE,
+                             pool: Optional[WorkerPool] = None,
+                             cache: Optional[BlockCache] = None) -> PrecisionEstimate:
+    """
+    Estime Pi jusqu'à atteindre une erreur absolue cible avec une confiance donnée.
+
+    Les lots successifs couvrent des plages consécutives du flux aléatoire:
+    pour une graine donnée, le résultat est identique à celui d'une simulation
+    directe avec le même nombre d'échantillons.
+
+    Avec un cache (BlockCache), les blocs déjà comptés pour cette graine ne
+    sont pas recalculés: une estimation plus précise prolonge les précédentes.
+    Seuls les blocs complets sont mis en cache: un batch_size multiple de
+    STREAM_BLOCK_SIZE évite de recompter les blocs à cheval sur deux lots.
+
+    Args:
+        target_error: Demi-largeur maximale de l'intervalle de confiance
+        confidence: Niveau de confiance de l'intervalle (entre 0 et 1)
+        simulator: "mono" (un seul thread) ou "multi" (plusieurs workers)
+        num_threads: Nombre de workers pour le simulateur "multi"
+        backend: Backend d'exécution du simulateur "multi" ("thread" ou "process")
+        kernel: Noyau de calcul ("python", "numpy", "integer", ou "auto" pour "multi")
+        batch_size: Nombre de points tirés entre deux tests d'arrêt
+        max_samples: Nombre maximal de points (None = pas de limite)
+        seed: Graine maître pour un résultat reproductible (aléatoire si None)
+        chunk_size: Taille des blocs des noyaux vectorisés
+        pool: Pool persistant pour le simulateur "multi" (évite de recréer
+              les workers à chaque lot)
+        cache: Cache des comptes par bloc (None = tout est recalculé)
+
+    Le test d'arrêt n'est appliqué qu'avec au moins MIN_CLASS_COUNT points
+    dans et hors du cercle (validité de l'approximation normale).
+
+    Returns:
+        PrecisionEstimate: Estimation, intervalle de confiance et échantillons utilisés
+
+    Raises:
+        ValueError: Si un paramètre est invalide
+    """
+    # Validation des entrées
+    if target_error <= 0:
+        raise ValueError(f"target_error doit être > 0, reçu: {target_error}")
+
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence doit être entre 0 et 1, reçu: {confidence}")
+
+    if simulator not in SIMULATORS:
+        raise ValueError(f"simulator doit être parmi {SIMULATORS}, reçu: {simulator!r}")
+
+    if batch_size <= 0:
+        raise ValueError(f"batch_size doit être > 0, reçu: {batch_size}")
+
+    if max_samples is not None and max_samples <= 0:
+        raise ValueError(f"max_samples doit être > 0, reçu: {max_samples}")
+
+    seed = resolve_seed(seed)
+    z = confidence_z(confidence)
+
+    start_time = time.perf_counter()
+
+    inside = 0
+    num_samples = 0
+    half_width = math.inf
+    std_error = math.inf
+    normal_ok = False
+
+    while half_width > target_error or not normal_ok:
+        if max_samples is not None and num_samples >= max_samples:
+            break
+
+        # Taille du prochain lot (sans dépasser max_samples)
+        batch = batch_size
+        if max_samples is not None:
+            batch = min(batch, max_samples - num_samples)
+
+        # Le lot couvre les échantillons [num_samples, num_samples + batch)
+        if cache is not None:
+            inside += count_inside_cached(batch, num_threads if simulator == "multi" else 1,
+                                          backend, seed, kernel, chunk_size,
+                                          start=num_samples, cache=cache, pool=pool)
+        elif simulator == "mono":
+            inside += count_inside_mono(batch, kernel, chunk_size, seed, start=num_samples)
+        else:
+            inside += count_inside_multi(batch, num_threads, backend, seed, kernel,
+                                         chunk_size, start=num_samples, pool=pool)
+        num_samples += batch
+
+        # Mise à jour de l'erreur standard et de l'intervalle de confiance
+        std_error = pi_standard_error(inside, num_samples)
+        half_width = z * std_error
+        normal_ok = min(inside, num_samples - inside) >= MIN_CLASS_COUNT
+
+    pi_estimate = 4.0 * inside / num_samples
+    execution_time = time.perf_counter() - start_time
+
+    return PrecisionEstimate(
+        pi_value=pi_estimate,
+        ci_low=pi_estimate - half_width,
+        ci_high=pi_estimate + half_width,
+        half_width=half_width,
+        std_error=std_error,
+        confidence=confidence,
+        num_samples=num_samples,
+        execution_time=execution_time,
+        converged=normal_ok and half_width <= target_error,
+    )
+
+
+if __name__ == "__main__":
+    # Test rapide du module
+    print("=== Test de l'estimation à précision cible ===\n")
+
+    for target in [1e-2, 1e-3, 2e-4]:
+        result = estimate_pi_to_precision(target, confidence=0.95, seed=42)
+
+        print(f"Erreur cible: ±{target} (confiance {result.confidence:.0%})")
+        print(f"  Pi estimé:    {result.pi_value:.8f}")
+        print(f"  Intervalle:   [{result.ci_low:.6f}, {result.ci_high:.6f}]")
+        print(f"  Échantillons: {result.num_samples:,}")
+        print(f"  Temps:        {result.execution_time:.4f} secondes")
+        print()
+
+    # Cas dégénéré: premier lot entièrement dans le cercle (se = 0)
+    result = estimate_pi_to_precision(1e-3, batch_size=1, max_samples=10_000, seed=3)
+    assert result.num_samples >= 2 * MIN_CLASS_COUNT and result.ci_low < result.ci_high
+    print(f"Lots de 1 point: {result.num_samples:,} échantillons, "
+          f"convergé: {result.converged}")
@@ -0,0 +1,251 @@
+"""
+Échantillonnage quasi-Monte Carlo (suite de Halton brouillée)
+
+Les points pseudo-aléatoires forment des amas et des trous: l'erreur de la
+méthode Monte Carlo décroît en O(1/√N). Une suite "à faible discrépance"
+comme celle de Halton couvre le carré de façon beaucoup plus régulière, et
+l'erreur décroît plus vite.
+
+Suite de Halton en 2D:
+- le point numéro i a pour coordonnées (φ₂(i), φ₃(i))
+- φ_b(i) est "l'inverse radical" de i en base b: on écrit i en base b et on
+  renverse ses chiffres derrière la virgule (ex: i = 6 = 110₂ → 0,011₂ = 0,375)
+
+Brouillage aléatoire (random digit permutation):
+Chaque position de chiffre reçoit une permutation aléatoire des chiffres
+{0, ..., b-1}, tirée à partir de la graine. Les points restent bien répartis,
+mais chaque graine donne une suite différente et sans biais: en répétant
+l'estimation avec plusieurs graines, on obtient une erreur standard.
+
+Le point numéro i ne dépend que de i et de la graine: chaque worker traite un
+segment disjoint [start, start + n) de la suite, calculé par blocs vectorisés.
+"""
+
+import math
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.integration import DEFAULT_CHUNK_SIZE, unit_ball_indicator
+from src.seeding import resolve_seed
+
+
+# Modes d'échantillonnage acceptés par les simulateurs:
+# - "pseudo": points pseudo-aléatoires (Monte Carlo classique)
+# - "halton": suite de Halton brouillée (quasi-Monte Carlo)
+SAMPLINGS = ("pseudo", "halton")
+
+
+# Bases de la suite de Halton pour les coordonnées x et y
+HALTON_BASES = (2, 3)
+
+# Les chiffres sont traités par groupes: un groupe de g chiffres en base b
+# est lu d'un coup (indice modulo b^g) et sa contribution brouillée est lue
+# dans une table de b^g valeurs. 4 groupes par base donnent 48 chiffres en
+# base 2 et 28 en base 3 (précision < 2^-44), en seulement 4 passes vectorisées.
+HALTON_DIGIT_GROUPS = {2: 12, 3: 7}
+HALTON_NUM_GROUPS = 4
+
+# Clé de dérivation des permutations de brouillage (distincte des blocs de flux)
+SCRAMBLE_SPAWN_KEY = (2**32, 0)
+
+
+def scramble_permutations(seed: int, base: int) -> np.ndarray:
+    """
+    Tire les permutations de chiffres d'une base, à partir de la graine.
+
+    Args:
+        seed: Graine maître
+        base: Base de la coordonnée (2 ou 3)
+
+    Returns:
+        ndarray: Tableau (nombre_de_chiffres, base); la ligne k est la
+                 permutation appliquée au k-ième chiffre après la virgule
+    """
+    rng = np.random.default_rng(
+        np.random.SeedSequence(seed, spawn_key=SCRAMBLE_SPAWN_KEY + (base,))
+    )
+    num_digits = HALTON_DIGIT_GROUPS[base] * HALTON_NUM_GROUPS
+    return np.array([rng.permutation(base) for _ in range(num_digits)])
+
+
+def scramble_tables(seed: int, base: int) -> np.ndarray:
+    """
+    Précalcule les contributions brouillées de chaque groupe de chiffres.
+
+    La table du groupe j associe à chaque valeur v (0 ≤ v < b^g) la somme des
+    chiffres permutés de v, placés aux positions j·g+1 à j·g+g après la virgule.
+
+    Args:
+        seed: Graine maître
+        base: Base de la coordonnée (2 ou 3)
+
+    Returns:
+        ndarray: Tableau (HALTON_NUM_GROUPS, base^g) de contributions
+    """
+    permutations = scramble_permutations(seed, base)
+    group = HALTON_DIGIT_GROUPS[base]
+    values = np.arange(base ** group)
+
+    tables = np.zeros((HALTON_NUM_GROUPS, base ** group), dtype=np.float64)
+    for j in range(HALTON_NUM_GROUPS):
+        remaining = values.copy()
+        for t in range(group):
+            position = j * group + t
+            digit = remaining % base
+            tables[j] += permutations[position][digit] * float(base) ** -(position + 1)
+            remaining //= base
+
+    return tables
+
+
+def scrambled_radical_inverse(indices: np.ndarray, base: int,
+                              tables: np.ndarray) -> np.ndarray:
+    """
+    Calcule l'inverse radical brouillé d'un tableau d'indices (vectorisé).
+
+    Args:
+        indices: Indices des points (entiers >= 0)
+        base: Base de l'inverse radical
+        tables: Contributions par groupe de chiffres (voir scramble_tables)
+
+    Returns:
+        ndarray: Coordonnées dans [0, 1)
+    """
+    modulus = base ** HALTON_DIGIT_GROUPS[base]
+    remaining = indices.copy()
+    result = np.zeros(indices.shape, dtype=np.float64)
+
+    for table in tables:
+        # Groupe de chiffres de poids faible → contribution brouillée
+        result += table[remaining % modulus]
+        remaining //= modulus
+
+    return result
+
+
+def halton_points(start: int, num_points: int, seed: Optional[int] = None,
+                  tables: Optional[list] = None) -> np.ndarray:
+    """
+    Génère les points [start, start + num_points) de la suite de Halton brouillée.
+
+    Args:
+        start: Indice du premier point
+        num_points: Nombre de points
+        seed: Graine maître (choisit le brouillage)
+        tables: Tables de brouillage déjà calculées pour chaque base (évite
+                de les recalculer à chaque bloc)
+
+    Returns:
+        ndarray: Tableau (num_points, 2) de points dans [-1, 1] × [-1, 1]
+    """
+    if tables is None:
+        seed = resolve_seed(seed)
+        tables = [scramble_tables(seed, base) for base in HALTON_BASES]
+
+    indices = np.arange(start, start + num_points, dtype=np.int64)
+    points = np.empty((num_points, 2), dtype=np.float64)
+
+    for axis, base in enumerate(HALTON_BASES):
+        points[:, axis] = scrambled_radical_inverse(indices, base, tables[axis])
+
+    # Passer de [0, 1) à [-1, 1)
+    return 2.0 * points - 1.0
+
+
+def count_inside_halton(num_samples: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        seed: Optional[int] = None, start: int = 0) -> int:
+    """
+    Compte les points de Halton brouillés qui tombent dans le cercle.
+
+    Args:
+        num_samples: Nombre de points de la plage
+        chunk_size: Nombre maximal de points générés en une seule fois
+        seed: Graine maître (choisit le brouillage, aléatoire si None)
+        start: Indice du premier point de la plage dans la suite
+
+    Returns:
+        int: Nombre de points tombés dans le cercle unitaire
+    """
+    seed = resolve_seed(seed)
+
+    # Les tables de brouillage ne dépendent que de la graine: calculées une fois
+    tables = [scramble_tables(seed, base) for base in HALTON_BASES]
+
+    inside_circle = 0
+    position = start
+    stop = start + num_samples
+
+    while position < stop:
+        n = min(chunk_size, stop - position)
+
+        points = halton_points(position, n, tables=tables)
+        inside_circle += int(np.count_nonzero(unit_ball_indicator(points)))
+        position += n
+
+    return inside_circle
+
+
+def estimate_pi_rqmc(num_samples: int, num_replicates: int = 8,
+                     seed: Optional[int] = None, count=None) -> Tuple[float, float, float]:
+    """
+    Estime Pi par quasi-Monte Carlo randomisé, avec une erreur standard.
+
+    Les num_samples points sont répartis entre num_replicates brouillages
+    indépendants de la suite de Halton. Chaque brouillage donne une estimation
+    sans biais; leur dispersion donne l'erreur standard de la moyenne.
+
+    Args:
+        num_samples: Nombre total de points (tous brouillages confondus)
+        num_replicates: Nombre de brouillages indépendants (>= 2)
+        seed: Graine maître (aléatoire si None)
+        count: Fonction (n, graine) -> points dans le cercle, pour exécuter
+               chaque brouillage sur un simulateur (mono par défaut)
+
+    Returns:
+        tuple: (valeur_de_pi, erreur_standard, temps_execution_en_secondes)
+
+    Raises:
+        ValueError: Si num_replicates < 2 ou num_samples < num_replicates
+    """
+    if num_replicates < 2:
+        raise ValueError(f"num_replicates doit être >= 2, reçu: {num_replicates}")
+
+    if num_samples < num_replicates:
+        raise ValueError(f"num_samples doit être >= num_replicates, reçu: {num_samples}")
+
+    if count is None:
+        count = lambda n, replicate_seed: count_inside_halton(n, seed=replicate_seed)
+
+    seed = resolve_seed(seed)
+    per_replicate = num_samples // num_replicates
+
+    start_time = time.perf_counter()
+
+    # Une graine dérivée (donc un brouillage) par répétition
+    replicate_seeds = [int(child.generate_state(1, np.uint64)[0])
+                       for child in np.random.SeedSequence(seed).spawn(num_replicates)]
+    estimates = [4.0 * count(per_replicate, replicate_seed) / per_replicate
+                 for replicate_seed in replicate_seeds]
+
+    pi_estimate = float(np.mean(estimates))
+    std_error = float(np.std(estimates, ddof=1)) / math.sqrt(num_replicates)
+    execution_time = time.perf_counter() - start_time
+
+    return pi_estimate, std_error, execution_time
+
+
+if __name__ == "__main__":
+    # Test rapide du module
+    print("=== Test du quasi-Monte Carlo (Halton brouillé) ===\n")
+
+    for samples in [10_000, 100_000, 1_000_000]:
+        pi_value, std_error, exec_time = estimate_pi_rqmc(samples, seed=42)
+
+        print(f"Échantillons: {samples:>10,}")
+        print(f"  Pi calculé:      {pi_value:.8f}")
+        print(f"  Erreur réelle:   {abs(pi_value - math.pi):.8f}")
+        print(f"  Erreur standard: {std_error:.8f}")
+        print(f"  Temps:           {exec_time:.4f} secondes")
+        print()
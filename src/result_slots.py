@@ -0,0 +1,179 @@
+"""
+Cases de résultats par worker, sans lock (mémoire partagée)
+
+Au lieu d'ajouter son compte à un dictionnaire partagé protégé par un lock,
+chaque worker écrit dans SA propre case d'un tableau. Comme deux workers
+n'écrivent jamais dans la même case, aucune synchronisation n'est nécessaire:
+le coordinateur additionne simplement les cases une fois les workers terminés.
+
+Pour le backend "process", le tableau vit dans un segment
+multiprocessing.shared_memory: les processus y écrivent directement, sans
+renvoyer (ni pickler) leurs résultats. Pour le backend "thread", un simple
+tableau NumPy en mémoire suffit.
+
+Chaque case contient:
+- le nombre de points dans le cercle (hits)
+- le nombre d'échantillons déjà traités (progression)
+- un numéro de séquence (verrou de séquence, "seqlock"): impair pendant une
+  écriture, il permet de lire une paire (hits, progression) cohérente pendant
+  que le worker écrit, sans lock (voir counts)
+"""
+
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+# Colonnes d'une case
+HITS = 0
+SAMPLES_DONE = 1
+SEQUENCE = 2
+
+# Largeur d'une case en entiers de 64 bits: 8 × 8 octets = 64 octets, soit une
+# ligne de cache. Deux workers n'écrivent donc jamais dans la même ligne de
+# cache (pas de "false sharing" entre cœurs).
+SLOT_WIDTH = 8
+
+
+class ResultSlots:
+    """
+    Tableau de cases de résultats, une case par worker.
+
+    Les écritures se font sans lock: chaque worker n'écrit que dans sa case.
+    """
+
+    def __init__(self, num_workers: int, shared: bool = False):
+        """
+        Args:
+            num_workers: Nombre de cases (une par worker)
+            shared: True pour un segment de mémoire partagée entre processus
+
+        Raises:
+            ValueError: Si num_workers <= 0
+        """
+        if num_workers <= 0:
+            raise ValueError(f"num_workers doit être > 0, reçu: {num_workers}")
+
+        self.num_workers = num_workers
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._owner = True
+
+        shape = (num_workers, SLOT_WIDTH)
+        if shared:
+            size = num_workers * SLOT_WIDTH * np.dtype(np.int64).itemsize
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self._array = np.ndarray(shape, dtype=np.int64, buffer=self._shm.buf)
+            self._array[:] = 0
+        else:
+            self._array = np.zeros(shape, dtype=np.int64)
+
+    @classmethod
+    def attach(cls, name: str, num_workers: int) -> "ResultSlots":
+        """
+        Se rattache (depuis un processus worker) à un segment existant.
+
+        Args:
+            name: Nom du segment de mémoire partagée
+            num_workers: Nombre de cases du segment
+
+        Returns:
+            ResultSlots: Vue sur les cases partagées (sans en être propriétaire)
+        """
+        slots = cls.__new__(cls)
+        slots.num_workers = num_workers
+        slots._owner = False
+        # Les workers partagent le resource_tracker du créateur: le segment
+        # n'y est enregistré qu'une fois, et seul le créateur le supprime.
+        slots._shm = shared_memory.SharedMemory(name=name)
+        slots._array = np.ndarray((num_workers, SLOT_WIDTH), dtype=np.int64,
+                                  buffer=slots._shm.buf)
+        return slots
+
+    def __reduce__(self):
+        # Envoyé à un processus, un ResultSlots partagé ne transporte que le nom
+        # du segment: les processus écrivent ensuite directement en mémoire.
+        if self._shm is None:
+            raise TypeError("Seuls les ResultSlots partagés (shared=True) "
+                            "peuvent être envoyés à un autre processus")
+        return ResultSlots.attach, (self._shm.name, self.num_workers)
+
+    @property
+    def shared(self) -> bool:
+        """True si les cases vivent en mémoire partagée entre processus."""
+        return self._shm is not None
+
+    def record(self, worker_index: int, hits: int, samples_done: int):
+        """
+        Écrit le résultat (partiel ou final) d'un worker dans sa case.
+
+        Args:
+            worker_index: Numéro du worker (sa case)
+            hits: Nombre de points dans le cercle comptés jusqu'ici
+            samples_done: Nombre d'échantillons traités jusqu'ici
+        """
+        slot = self._array[worker_index]
+        slot[SEQUENCE] += 1          # Impair: écriture en cours
+        slot[HITS] = hits
+        slot[SAMPLES_DONE] = samples_done
+        slot[SEQUENCE] += 1          # Pair: case cohérente
+
+    def hits(self) -> np.ndarray:
+        """Nombre de points dans le cercle de chaque worker (copie)."""
+        return self._array[:, HITS].copy()
+
+    def samples_done(self) -> np.ndarray:
+        """Nombre d'échantillons traités par chaque worker (copie)."""
+        return self._array[:, SAMPLES_DONE].copy()
+
+    def counts(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Lit les points dans le cercle et la progression de chaque worker, de façon cohérente.
+
+        hits() puis samples_done() peuvent tomber au milieu d'une écriture
+        (points d'un segment comptés, mais pas encore ses échantillons). Ici,
+        la lecture est recommencée tant qu'une case est en cours d'écriture ou
+        a changé pendant la lecture: chaque paire vient d'un même record.
+
+        Returns:
+            tuple: (hits, samples_done), copies des deux colonnes
+        """
+        while True:
+            before = self._array[:, SEQUENCE].copy()
+            hits = self._array[:, HITS].copy()
+            samples_done = self._array[:, SAMPLES_DONE].copy()
+            if not np.any(before & 1) and np.array_equal(before, self._array[:, SEQUENCE]):
+                return hits, samples_done
+
+    def total_hits(self) -> int:
+        """Réduction: somme des points dans le cercle de toutes les cases."""
+        return int(self._array[:, HITS].sum())
+
+    def total_samples_done(self) -> int:
+        """Réduction: somme des échantillons traités de toutes les cases."""
+        return int(self._array[:, SAMPLES_DONE].sum())
+
+    def detach(self):
+        """
+        Détache un worker des cases partagées (sans effet pour le créateur).
+        """
+        if not self._owner:
+            self.close()
+
+    def close(self):
+        """
+        Libère les cases. Le créateur d'un segment partagé le supprime aussi.
+        """
+        if self._shm is not None:
+            # Ne plus référencer le buffer avant de fermer le segment
+            self._array = self._array.copy()
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> "ResultSlots":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
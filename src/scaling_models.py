@@ -0,0 +1,209 @@
+"""
+Modèles de scalabilité: lois d'Amdahl et de Gustafson
+
+Deux façons de faire grandir un calcul parallèle:
+
+- Scalabilité forte (strong scaling): le nombre total d'échantillons est fixe,
+  on ajoute des workers. Loi d'Amdahl, avec s la fraction séquentielle:
+      S(n) = 1 / (s + (1 - s) / n)        →  plafonne à 1/s
+- Scalabilité faible (weak scaling): le nombre d'échantillons par worker est
+  fixe, le travail total grandit avec n. Loi de Gustafson:
+      S(n) = n - s × (n - 1)              →  linéaire, de pente 1 - s
+
+Efficacité parallèle: E(n) = S(n) / n (1.0 = aucun cœur gaspillé).
+
+Les deux modèles sont ajustés par moindres carrés sur les speedups mesurés
+(s entre 0 et 1, recherche par section dorée); la qualité de l'ajustement est
+donnée par le R² et l'erreur quadratique moyenne (RMSE). Le modèle ajusté
+indique combien de workers valent la peine: au-delà de max_useful_workers,
+l'efficacité tombe sous le seuil choisi.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, Sequence
+
+
+# Modèles de scalabilité disponibles
+MODELS = ("amdahl", "gustafson")
+
+# Efficacité minimale par défaut pour qu'un worker de plus vaille la peine
+DEFAULT_MIN_EFFICIENCY = 0.5
+
+# Itérations de la recherche par section dorée (précision ~1e-13 sur s)
+GOLDEN_SECTION_ITERATIONS = 60
+
+
+def amdahl_speedup(num_workers: float, serial_fraction: float) -> float:
+    """
+    Speedup prédit par la loi d'Amdahl (scalabilité forte).
+
+    Args:
+        num_workers: Nombre de workers
+        serial_fraction: Fraction séquentielle s (entre 0 et 1)
+
+    Returns:
+        float: 1 / (s + (1 - s) / n)
+    """
+    return 1.0 / (serial_fraction + (1.0 - serial_fraction) / num_workers)
+
+
+def gustafson_speedup(num_workers: float, serial_fraction: float) -> float:
+    """
+    Speedup prédit par la loi de Gustafson (scalabilité faible).
+
+    Args:
+        num_workers: Nombre de workers
+        serial_fraction: Fraction séquentielle s (entre 0 et 1)
+
+    Returns:
+        float: n - s × (n - 1)
+    """
+    return num_workers - serial_fraction * (num_workers - 1)
+
+
+SPEEDUP_MODELS: Dict[str, Callable[[float, float], float]] = {
+    "amdahl": amdahl_speedup,
+    "gustafson": gustafson_speedup,
+}
+
+
+@dataclass
+class ScalingFit:
+    """Modèle de scalabilité ajusté sur des speedups mesurés."""
+    model: str                   # "amdahl" ou "gustafson"
+    serial_fraction: float       # Fraction séquentielle s ajustée
+    r_squared: float             # Coefficient de détermination R²
+    rmse: float                  # Erreur quadratique moyenne sur le speedup
+    num_points: int              # Nombre de configurations utilisées
+
+    def speedup(self, num_workers: float) -> float:
+        """Speedup prédit par le modèle pour num_workers workers."""
+        return SPEEDUP_MODELS[self.model](num_workers, self.serial_fraction)
+
+    def efficiency(self, num_workers: float) -> float:
+        """Efficacité parallèle prédite: speedup / num_workers."""
+        return self.speedup(num_workers) / num_workers
+
+    def max_useful_workers(self, min_efficiency: float = DEFAULT_MIN_EFFICIENCY) -> float:
+        """
+        Plus grand nombre de workers dont l'efficacité prédite reste ≥ min_efficiency.
+
+        Amdahl: E(n) = 1 / (s×n + 1 - s)  →  n ≤ (1/E - 1 + s) / s
+        Gustafson: E(n) = 1 - s + s/n, toujours ≥ 1 - s
+
+        Args:
+            min_efficiency: Efficacité minimale acceptée (entre 0 et 1)
+
+        Returns:
+            float: Nombre de workers (math.inf si le seuil n'est jamais franchi)
+
+        Raises:
+            ValueError: Si min_efficiency n'est pas dans ]0, 1]
+        """
+        if not 0 < min_efficiency <= 1:
+            raise ValueError(f"min_efficiency doit être dans ]0, 1], reçu: {min_efficiency}")
+
+        s = self.serial_fraction
+        if self.model == "amdahl":
+            if s <= 0:
+                return math.inf
+            return max(1.0, (1.0 / min_efficiency - 1.0 + s) / s)
+
+        if 1.0 - s >= min_efficiency:
+            return math.inf
+        # E(n) = 1 - s + s/n ≥ E  →  n ≤ s / (E - 1 + s)
+        return max(1.0, s / (min_efficiency - 1.0 + s))
+
+
+def _sum_squared_errors(model: str, serial_fraction: float,
+                        workers: Sequence[float], speedups: Sequence[float]) -> float:
+    """Somme des carrés des écarts entre speedups mesurés et prédits."""
+    predict = SPEEDUP_MODELS[model]
+    return sum((predict(n, serial_fraction) - measured) ** 2
+               for n, measured in zip(workers, speedups))
+
+
+def fit_scaling_model(model: str, workers: Sequence[float],
+                      speedups: Sequence[float]) -> ScalingFit:
+    """
+    Ajuste la fraction séquentielle d'un modèle sur des speedups mesurés.
+
+    Exemple:
+        fit = fit_scaling_model("amdahl", [1, 2, 4, 8], [1.0, 1.9, 3.4, 5.5])
+        print(fit.serial_fraction, fit.r_squared)
+
+    Args:
+        model: "amdahl" ou "gustafson"
+        workers: Nombre de workers de chaque configuration (1 pour mono)
+        speedups: Speedup mesuré de chaque configuration
+
+    Returns:
+        ScalingFit: Fraction séquentielle ajustée et qualité de l'ajustement
+
+    Raises:
+        ValueError: Si le modèle est inconnu ou les mesures sont incohérentes
+    """
+    if model not in MODELS:
+        raise ValueError(f"model doit être parmi {MODELS}, reçu: {model!r}")
+
+    if len(workers) != len(speedups) or not workers:
+        raise ValueError(f"workers et speedups doivent avoir la même longueur non nulle, "
+                         f"reçu: {len(workers)} et {len(speedups)}")
+
+    # Section dorée sur s ∈ [0, 1]: l'erreur de chaque modèle y est unimodale
+    ratio = (math.sqrt(5) - 1) / 2
+    low, high = 0.0, 1.0
+    for _ in range(GOLDEN_SECTION_ITERATIONS):
+        left = high - ratio * (high - low)
+        right = low + ratio * (high - low)
+        if (_sum_squared_errors(model, left, workers, speedups)
+                <= _sum_squared_errors(model, right, workers, speedups)):
+            high = right
+        else:
+            low = left
+    serial_fraction = (low + high) / 2
+
+    sse = _sum_squared_errors(model, serial_fraction, workers, speedups)
+    mean = sum(speedups) / len(speedups)
+    sst = sum((measured - mean) ** 2 for measured in speedups)
+    if sst > 0:
+        r_squared = 1.0 - sse / sst
+    else:
+        r_squared = 1.0 if sse == 0 else 0.0
+
+    return ScalingFit(
+        model=model,
+        serial_fraction=serial_fraction,
+        r_squared=r_squared,
+        rmse=math.sqrt(sse / len(speedups)),
+        num_points=len(speedups),
+    )
+
+
+def fit_scaling_models(workers: Sequence[float],
+                       speedups: Sequence[float]) -> Dict[str, ScalingFit]:
+    """
+    Ajuste les deux modèles (Amdahl et Gustafson) sur les mêmes mesures.
+
+    Args:
+        workers: Nombre de workers de chaque configuration (1 pour mono)
+        speedups: Speedup mesuré de chaque configuration
+
+    Returns:
+        dict: Nom du modèle -> ScalingFit
+    """
+    return {model: fit_scaling_model(model, workers, speedups) for model in MODELS}
+
+
+if __name__ == "__main__":
+    # Test rapide du module
+    print("=== Test des modèles de scalabilité ===\n")
+
+    workers = [1, 2, 4, 8, 16]
+    speedups = [amdahl_speedup(n, 0.05) for n in workers]
+
+    for model, fit in fit_scaling_models(workers, speedups).items():
+        print(f"{model:<10} s = {fit.serial_fraction:.4f} | R² = {fit.r_squared:.4f} "
+              f"| RMSE = {fit.rmse:.4f} | workers utiles (E ≥ 50%): "
+              f"{fit.max_useful_workers():.1f}")
@@ -0,0 +1,242 @@
+"""
+Ordonnancement dynamique des échantillons entre workers
+
+Le découpage statique de calculate_pi_multi donne à chaque worker une part
+fixe (et tout le reste au dernier). Si un worker est lent ou préempté (voisins
+bruyants sur une machine partagée), tous les autres l'attendent.
+
+Ici, la plage d'échantillons est découpée en nombreuses petites tâches
+placées dans la file partagée d'un pool (WorkerPool): chaque worker qui
+termine une tâche prend la suivante. Un worker lent traite simplement moins
+de tâches, et les workers libres "volent" le travail restant.
+
+Les tâches couvrent des plages [start, start + n) du flux de la graine
+maître, alignées sur les blocs de flux: pour une graine donnée, le total de
+points dans le cercle ne dépend pas de l'ordonnancement.
+"""
+
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.kernels import DEFAULT_CHUNK_SIZE
+from src.monte_carlo_mono import count_inside_mono
+from src.seeding import STREAM_BLOCK_SIZE, iter_segments, resolve_seed
+from src.worker_pool import WorkerPool
+
+
+# Modes de répartition du travail entre workers:
+# - "static":  une part fixe par worker (split_samples)
+# - "dynamic": petites tâches dans une file partagée
+SCHEDULES = ("static", "dynamic")
+
+# Taille par défaut d'une tâche (multiple de STREAM_BLOCK_SIZE: aucune tâche
+# ne commence au milieu d'un bloc de flux)
+DEFAULT_TASK_SIZE = 4 * STREAM_BLOCK_SIZE
+
+# Temps maximal sans qu'aucune tâche ne se termine avant de conclure à un
+# blocage, en secondes (la durée totale, elle, n'est pas limitée)
+DEFAULT_STALL_TIMEOUT = 60.0
+
+
+@dataclass
+class ScheduleReport:
+    """Résultat d'une exécution à ordonnancement dynamique."""
+    inside: int                                   # Points dans le cercle (total)
+    num_tasks: int                                # Nombre de tâches créées
+    tasks_per_worker: Dict[str, int] = field(default_factory=dict)    # Tâches traitées par worker
+    samples_per_worker: Dict[str, int] = field(default_factory=dict)  # Échantillons par worker
+
+
+def current_worker_name() -> str:
+    """
+    Nom du worker (thread ou processus) qui exécute la tâche courante.
+
+    Returns:
+        str: Nom du thread, suivi du PID pour un processus worker
+    """
+    name = threading.current_thread().name
+    if name == "MainThread":
+        return f"process-{os.getpid()}"
+    return name
+
+
+def iter_completed(futures, stall_timeout: Optional[float] = DEFAULT_STALL_TIMEOUT
+                   ) -> Iterator[Future]:
+    """
+    Produit les tâches au fur et à mesure qu'elles se terminent.
+
+    Le timeout porte sur l'attente de la prochaine tâche terminée, pas sur
+    la durée totale: une longue simulation qui progresse n'est jamais
+    interrompue.
+
+    Args:
+        futures: Tâches soumises à un pool
+        stall_timeout: Temps maximal sans tâche terminée, en secondes (None = sans limite)
+
+    Yields:
+        Future: Chaque tâche terminée
+
+    Raises:
+        RuntimeError: Si aucune tâche ne se termine pendant stall_timeout secondes
+                      (les tâches restantes sont annulées)
+    """
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, timeout=stall_timeout, return_when=FIRST_COMPLETED)
+        if not done:
+            for future in pending:
+                future.cancel()
+            raise RuntimeError(f"Worker bloqué - aucune tâche terminée depuis "
+                               f"{stall_timeout}s, possible deadlock détecté")
+        yield from done
+
+
+def wait_for_results(futures, stall_timeout: Optional[float] = DEFAULT_STALL_TIMEOUT) -> List:
+    """
+    Attend toutes les tâches et renvoie leurs résultats dans l'ordre de soumission.
+
+    Args:
+        futures: Tâches soumises à un pool
+        stall_timeout: Temps maximal sans tâche terminée, en secondes (None = sans limite)
+
+    Returns:
+        list: Résultats des tâches
+
+    Raises:
+        RuntimeError: Si aucune tâche ne se termine pendant stall_timeout secondes
+    """
+    futures = list(futures)
+    for _ in iter_completed(futures, stall_timeout):
+        pass
+    return [future.result() for future in futures]
+
+
+def count_task(samples: int, seed: int, start: int, kernel: str, chunk_size: int,
+               sampling: str = "pseudo") -> Tuple[int, int, str]:
+    """
+    Exécute une tâche: compte les points dans le cercle d'une petite plage.
+
+    Args:
+        samples: Nombre d'échantillons de la tâche
+        seed: Graine maître de la simulation
+        start: Indice global du premier échantillon de la tâche
+        kernel: Noyau effectif ("python", "numpy" ou "integer")
+        chunk_size: Taille des blocs des noyaux vectorisés
+        sampling: Mode d'échantillonnage ("pseudo" ou "halton")
+
+    Returns:
+        tuple: (points_dans_le_cercle, échantillons, nom_du_worker)
+    """
+    inside = count_inside_mono(samples, kernel, chunk_size, seed, start, sampling)
+    return inside, samples, current_worker_name()
+
+
+def run_dynamic(num_samples: int, num_workers: int, backend: str = "thread",
+                seed: Optional[int] = None, kernel: str = "numpy",
+                chunk_size: int = DEFAULT_CHUNK_SIZE, start: int = 0,
+                pool: Optional[WorkerPool] = None, sampling: str = "pseudo",
+                task_size: int = DEFAULT_TASK_SIZE,
+                stall_timeout: Optional[float] = DEFAULT_STALL_TIMEOUT) -> ScheduleReport:
+    """
+    Compte les points dans le cercle avec un ordonnancement dynamique.
+
+    La plage [start, start + num_samples) est découpée en tâches de
+    task_size échantillons, toutes soumises au pool: les workers libres
+    prennent la tâche suivante dans la file. Les comptes arrivent dans
+    l'ordre où les tâches se terminent et sont additionnés au fur et à mesure.
+
+    Args:
+        num_samples: Nombre total d'échantillons
+        num_workers: Nombre de workers (threads ou processus)
+        backend: "thread" ou "process" (ignoré si un pool est fourni)
+        seed: Graine maître (aléatoire si None)
+        kernel: Noyau effectif ("python", "numpy" ou "integer")
+        chunk_size: Taille des blocs des noyaux vectorisés
+        start: Indice global du premier échantillon de la plage
+        pool: Pool persistant à réutiliser (None = pool créé pour l'appel)
+        sampling: Mode d'échantillonnage ("pseudo" ou "halton")
+        task_size: Nombre d'échantillons par tâche
+        stall_timeout: Temps maximal sans tâche terminée, en secondes (None = sans limite)
+
+    Returns:
+        ScheduleReport: Total et répartition des tâches entre les workers
+
+    Raises:
+        ValueError: Si task_size <= 0 ou stall_timeout <= 0
+        RuntimeError: Si aucune tâche ne se termine pendant stall_timeout secondes
+    """
+    if task_size <= 0:
+        raise ValueError(f"task_size doit être > 0, reçu: {task_size}")
+
+    if stall_timeout is not None and stall_timeout <= 0:
+        raise ValueError(f"stall_timeout doit être > 0, reçu: {stall_timeout}")
+
+    seed = resolve_seed(seed)
+    tasks = list(iter_segments(start, num_samples, task_size))
+
+    if pool is not None:
+        pool.resize(num_workers)
+        report = _collect(pool, tasks, seed, kernel, chunk_size, sampling, stall_timeout)
+    else:
+        with WorkerPool(backend, num_workers) as temporary_pool:
+            report = _collect(temporary_pool, tasks, seed, kernel, chunk_size, sampling,
+                              stall_timeout)
+
+    return report
+
+
+def _collect(pool: WorkerPool, tasks: list, seed: int, kernel: str,
+             chunk_size: int, sampling: str,
+             stall_timeout: Optional[float] = DEFAULT_STALL_TIMEOUT) -> ScheduleReport:
+    """
+    Soumet les tâches au pool et agrège leurs résultats dès qu'ils arrivent
+    (voir iter_completed pour le timeout).
+
+    Args:
+        pool: Pool de workers
+        tasks: Couples (indice_de_début, nombre_d_échantillons)
+        seed: Graine maître
+        kernel: Noyau effectif
+        chunk_size: Taille des blocs des noyaux vectorisés
+        sampling: Mode d'échantillonnage
+        stall_timeout: Temps maximal sans tâche terminée, en secondes (None = sans limite)
+
+    Returns:
+        ScheduleReport: Total et répartition des tâches entre les workers
+
+    Raises:
+        RuntimeError: Si aucune tâche ne se termine pendant stall_timeout secondes
+    """
+    futures = [pool.submit(count_task, samples, seed, task_start, kernel, chunk_size,
+                           sampling)
+               for task_start, samples in tasks]
+
+    report = ScheduleReport(inside=0, num_tasks=len(futures))
+
+    for future in iter_completed(futures, stall_timeout):
+        inside, samples, worker_name = future.result()
+        report.inside += inside
+        report.tasks_per_worker[worker_name] = report.tasks_per_worker.get(worker_name, 0) + 1
+        report.samples_per_worker[worker_name] = (
+            report.samples_per_worker.get(worker_name, 0) + samples
+        )
+
+    return report
+
+
+if __name__ == "__main__":
+    # Test rapide du module
+    print("=== Test de l'ordonnancement dynamique ===\n")
+
+    for backend in ("thread", "process"):
+        report = run_dynamic(5_000_000, 4, backend, seed=42)
+
+        print(f"Backend: {backend} | Tâches: {report.num_tasks}")
+        print(f"  Pi calculé: {4.0 * report.inside / 5_000_000:.8f}")
+        for worker_name, count in sorted(report.tasks_per_worker.items()):
+            print(f"  {worker_name:<20} {count:>3} tâches, "
+                  f"{report.samples_per_worker[worker_name]:>10,} échantillons")
+        print()
@@ -0,0 +1,149 @@
+"""
+Graines et flux aléatoires reproductibles pour les simulateurs Monte Carlo
+
+Ce module transforme une graine maître (un entier) en flux aléatoires
+statistiquement indépendants, grâce à numpy.random.SeedSequence.
+
+Principe:
+- L'espace des échantillons est découpé en blocs de STREAM_BLOCK_SIZE points
+- Le bloc numéro b utilise son propre flux, dérivé de (graine maître, b)
+- Un worker qui traite les échantillons [start, start + n) parcourt les blocs
+  correspondants, sans partager d'état aléatoire avec les autres workers
+
+Comme les flux sont attachés aux blocs d'échantillons (et non aux workers),
+le nombre total de points dans le cercle pour une graine donnée est le même
+quel que soit le nombre de workers ou le backend d'exécution.
+"""
+
+import random
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+
+# Nombre de points par bloc de flux aléatoire.
+# Un worker dont la part commence au milieu d'un bloc doit sauter le début
+# de ce bloc: la taille du bloc borne donc ce travail perdu.
+STREAM_BLOCK_SIZE = 65_536
+
+
+def resolve_seed(seed: Optional[int] = None) -> int:
+    """
+    Retourne la graine maître à utiliser pour une simulation.
+
+    Si seed vaut None, une graine est tirée au hasard (entropie du système):
+    la simulation n'est alors pas reproductible, mais tous les workers d'un
+    même appel partagent tout de même cette graine maître.
+
+    Args:
+        seed: Graine maître (entier >= 0) ou None
+
+    Returns:
+        int: Graine maître
+
+    Raises:
+        ValueError: Si seed est négative
+    """
+    if seed is None:
+        return np.random.SeedSequence().entropy
+
+    if seed < 0:
+        raise ValueError(f"seed doit être >= 0, reçu: {seed}")
+
+    return int(seed)
+
+
+def iter_blocks(start: int, num_samples: int) -> Iterator[Tuple[int, int, int]]:
+    """
+    Parcourt les blocs de flux qui couvrent les échantillons [start, start + num_samples).
+
+    Args:
+        start: Indice global du premier échantillon
+        num_samples: Nombre d'échantillons à couvrir
+
+    Yields:
+        tuple: (numéro_de_bloc, début_dans_le_bloc, fin_dans_le_bloc)
+    """
+    stop = start + num_samples
+    position = start
+
+    while position < stop:
+        block_index = position // STREAM_BLOCK_SIZE
+        block_start = block_index * STREAM_BLOCK_SIZE
+        lo = position - block_start
+        hi = min(stop - block_start, STREAM_BLOCK_SIZE)
+        yield block_index, lo, hi
+        position = block_start + hi
+
+
+def iter_segments(start: int, num_samples: int,
+                  segment_size: int) -> Iterator[Tuple[int, int]]:
+    """
+    Découpe la plage [start, start + num_samples) en segments alignés.
+
+    Les frontières des segments tombent sur des multiples de segment_size
+    (indices globaux). Si segment_size est un multiple de STREAM_BLOCK_SIZE,
+    un segment ne commence jamais au milieu d'un bloc de flux (sauf le premier
+    si start lui-même n'est pas aligné): aucun tirage n'est gaspillé.
+
+    Args:
+        start: Indice global du premier échantillon
+        num_samples: Nombre d'échantillons à couvrir
+        segment_size: Taille maximale d'un segment
+
+    Yields:
+        tuple: (indice_de_début, nombre_d_échantillons) de chaque segment
+    """
+    stop = start + num_samples
+    position = start
+
+    while position < stop:
+        segment_end = min((position // segment_size + 1) * segment_size, stop)
+        yield position, segment_end - position
+        position = segment_end
+
+
+def block_seed_sequence(seed: int, block_index: int) -> np.random.SeedSequence:
+    """
+    Dérive la SeedSequence d'un bloc à partir de la graine maître.
+
+    Args:
+        seed: Graine maître
+        block_index: Numéro du bloc
+
+    Returns:
+        SeedSequence: Séquence de graine indépendante pour ce bloc
+    """
+    return np.random.SeedSequence(seed, spawn_key=(block_index,))
+
+
+def block_generator(seed: int, block_index: int) -> np.random.Generator:
+    """
+    Crée le générateur NumPy (PCG64) d'un bloc.
+
+    Args:
+        seed: Graine maître
+        block_index: Numéro du bloc
+
+    Returns:
+        Generator: Générateur NumPy propre à ce bloc
+    """
+    return np.random.Generator(np.random.PCG64(block_seed_sequence(seed, block_index)))
+
+
+def block_random(seed: int, block_index: int) -> random.Random:
+    """
+    Crée un générateur random.Random (Mersenne Twister) propre à un bloc.
+
+    Utilisé par le noyau Python pur: chaque worker a ainsi ses propres
+    instances, au lieu de se partager l'état global du module random.
+
+    Args:
+        seed: Graine maître
+        block_index: Numéro du bloc
+
+    Returns:
+        random.Random: Générateur propre à ce bloc
+    """
+    state = block_seed_sequence(seed, block_index).generate_state(2, np.uint64)
+    return random.Random((int(state[0]) << 64) | int(state[1]))
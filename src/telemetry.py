@@ -0,0 +1,324 @@
+"""
+Télémétrie en direct des workers et rappels de progression
+
+Pendant une longue simulation, on veut savoir où en est chaque worker, et
+distinguer un worker bloqué d'un worker simplement lent. Les workers écrivent
+déjà leur progression dans leur case de ResultSlots après chaque segment
+d'échantillons (mises à jour groupées, jamais point par point). Un thread de
+surveillance (TelemetryMonitor) lit ces cases à intervalle régulier et envoie
+un instantané (TelemetrySnapshot) à des rappels enfichables:
+
+- n'importe quelle fonction (snapshot) -> None
+- ProgressRenderer: barre de progression sur une ligne du terminal
+- TelemetryRecorder: conserve les instantanés (pour analyse ou tests)
+
+Coût: les workers ne font qu'une écriture par segment (progress_interval
+échantillons); le thread de surveillance mesure le temps qu'il consomme
+lui-même (overhead_time), et measure_telemetry_overhead compare une
+simulation avec et sans télémétrie.
+"""
+
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, TextIO
+
+from src.result_slots import ResultSlots
+from src.seeding import STREAM_BLOCK_SIZE
+
+
+# Nombre d'échantillons entre deux mises à jour de la case d'un worker
+# (multiple de STREAM_BLOCK_SIZE pour ne pas couper les blocs de flux)
+DEFAULT_PROGRESS_INTERVAL = 16 * STREAM_BLOCK_SIZE
+
+# Intervalle par défaut entre deux instantanés, en secondes
+DEFAULT_TELEMETRY_INTERVAL = 0.5
+
+
+@dataclass
+class WorkerTelemetry:
+    """Compteurs d'un worker à un instant donné."""
+    worker_index: int            # Numéro du worker (sa case)
+    samples_done: int            # Échantillons traités
+    hits: int                    # Points dans le cercle
+    samples_per_second: float    # Débit moyen depuis le début
+    idle_time: float             # Temps depuis la dernière mise à jour de sa case
+    share: int = 0               # Échantillons de sa part (0 = inconnu)
+
+    @property
+    def finished(self) -> bool:
+        """True si le worker a traité toute sa part (il peut alors rester inactif)."""
+        return self.share > 0 and self.samples_done >= self.share
+
+
+@dataclass
+class TelemetrySnapshot:
+    """Instantané de la progression de tous les workers."""
+    elapsed_time: float                         # Temps écoulé depuis le début
+    num_samples: int                            # Nombre total d'échantillons
+    workers: List[WorkerTelemetry] = field(default_factory=list)
+    final: bool = False                         # True pour le dernier instantané
+    overhead_time: float = 0.0                  # Temps consommé par la surveillance
+
+    @property
+    def samples_done(self) -> int:
+        """Échantillons traités par l'ensemble des workers."""
+        return sum(worker.samples_done for worker in self.workers)
+
+    @property
+    def hits(self) -> int:
+        """Points dans le cercle comptés par l'ensemble des workers."""
+        return sum(worker.hits for worker in self.workers)
+
+    @property
+    def progress(self) -> float:
+        """Fraction du travail terminée (entre 0 et 1)."""
+        return self.samples_done / self.num_samples
+
+    @property
+    def samples_per_second(self) -> float:
+        """Débit total moyen depuis le début."""
+        if self.elapsed_time <= 0:
+            return 0.0
+        return self.samples_done / self.elapsed_time
+
+
+# Rappel de télémétrie: reçoit chaque instantané
+TelemetryCallback = Callable[[TelemetrySnapshot], None]
+
+
+class TelemetryMonitor:
+    """
+    Thread de surveillance qui lit les cases des workers et appelle les rappels.
+
+    Exemple:
+        with TelemetryMonitor(slots, num_samples, [ProgressRenderer()]):
+            ...  # les workers écrivent dans slots
+    """
+
+    def __init__(self, slots: ResultSlots, num_samples: int,
+                 callbacks: Sequence[TelemetryCallback] = (),
+                 interval: float = DEFAULT_TELEMETRY_INTERVAL,
+                 shares: Optional[Sequence[int]] = None):
+        """
+        Args:
+            slots: Cases de résultats des workers
+            num_samples: Nombre total d'échantillons de la simulation
+            callbacks: Rappels appelés à chaque instantané
+            interval: Temps entre deux instantanés, en secondes
+            shares: Échantillons de la part de chaque worker (None = découpage
+                    de split_samples: parts égales, le reste au dernier)
+
+        Raises:
+            ValueError: Si interval <= 0 ou si shares n'a pas une part par case
+        """
+        if interval <= 0:
+            raise ValueError(f"interval doit être > 0, reçu: {interval}")
+
+        if shares is None:
+            shares = [num_samples // slots.num_workers] * slots.num_workers
+            shares[-1] += num_samples % slots.num_workers
+
+        if len(shares) != slots.num_workers:
+            raise ValueError(f"shares doit contenir {slots.num_workers} parts, "
+                             f"reçu: {len(shares)}")
+
+        self.slots = slots
+        self.num_samples = num_samples
+        self.callbacks = list(callbacks)
+        self.interval = interval
+        self.shares = list(shares)
+        self.overhead_time = 0.0
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_time = 0.0
+        self._last_samples = [0] * slots.num_workers
+        self._last_change = [0.0] * slots.num_workers
+
+    def snapshot(self, final: bool = False) -> TelemetrySnapshot:
+        """
+        Lit les cases des workers et construit un instantané.
+
+        Args:
+            final: True pour le dernier instantané de la simulation
+
+        Returns:
+            TelemetrySnapshot: Compteurs de chaque worker
+        """
+        now = time.perf_counter()
+        elapsed = now - self._start_time
+        hits, samples_done = self.slots.counts()
+
+        workers = []
+        for index in range(self.slots.num_workers):
+            done = int(samples_done[index])
+            if done != self._last_samples[index]:
+                self._last_samples[index] = done
+                self._last_change[index] = now
+
+            workers.append(WorkerTelemetry(
+                worker_index=index,
+                samples_done=done,
+                hits=int(hits[index]),
+                samples_per_second=done / elapsed if elapsed > 0 else 0.0,
+                idle_time=now - self._last_change[index],
+                share=self.shares[index],
+            ))
+
+        return TelemetrySnapshot(
+            elapsed_time=elapsed,
+            num_samples=self.num_samples,
+            workers=workers,
+            final=final,
+            overhead_time=self.overhead_time,
+        )
+
+    def _emit(self, final: bool = False):
+        """Construit un instantané et l'envoie à tous les rappels (temps mesuré)."""
+        emit_start = time.perf_counter()
+        snapshot = self.snapshot(final)
+        for callback in self.callbacks:
+            callback(snapshot)
+        self.overhead_time += time.perf_counter() - emit_start
+
+    def _run(self):
+        """Boucle du thread de surveillance."""
+        while not self._stop.wait(self.interval):
+            self._emit()
+
+    def start(self):
+        """Démarre le thread de surveillance."""
+        self._start_time = time.perf_counter()
+        self._last_change = [self._start_time] * self.slots.num_workers
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Arrête la surveillance et envoie le dernier instantané."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            self._emit(final=True)
+
+    def __enter__(self) -> "TelemetryMonitor":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+class TelemetryRecorder:
+    """Rappel qui conserve tous les instantanés reçus."""
+
+    def __init__(self):
+        self.snapshots: List[TelemetrySnapshot] = []
+
+    def __call__(self, snapshot: TelemetrySnapshot):
+        self.snapshots.append(snapshot)
+
+
+class ProgressRenderer:
+    """
+    Rappel qui affiche la progression sur une seule ligne du terminal.
+
+    Exemple de ligne:
+        [██████░░░░░░░░░░░░░░]  31.5% | 12.4 M éch/s | w0 3.1M w1 3.0M w2 0.0M (bloqué 2.1s)
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, width: int = 20,
+                 stall_after: float = 2.0):
+        """
+        Args:
+            stream: Flux de sortie (sys.stdout si None)
+            width: Largeur de la barre de progression, en caractères
+            stall_after: Temps sans progression au-delà duquel un worker est
+                         signalé comme bloqué, en secondes
+        """
+        self.stream = stream
+        self.width = width
+        self.stall_after = stall_after
+        self._last_length = 0
+
+    def __call__(self, snapshot: TelemetrySnapshot):
+        stream = self.stream or sys.stdout
+        filled = int(round(self.width * min(snapshot.progress, 1.0)))
+        bar = "█" * filled + "░" * (self.width - filled)
+
+        workers = []
+        for worker in snapshot.workers:
+            text = f"w{worker.worker_index} {worker.samples_done / 1e6:.1f}M"
+            # Un worker qui a fini sa part est inactif, pas bloqué
+            if not snapshot.final and worker.idle_time >= self.stall_after \
+                    and not worker.finished:
+                text += f" (bloqué {worker.idle_time:.1f}s)"
+            workers.append(text)
+
+        line = (f"  [{bar}] {snapshot.progress:>6.1%} | "
+                f"{snapshot.samples_per_second / 1e6:.1f} M éch/s | " + " ".join(workers))
+
+        # \r: réécrire la même ligne (en effaçant la fin d'une ligne plus
+        # longue); saut de ligne seulement à la fin
+        padding = " " * max(self._last_length - len(line), 0)
+        self._last_length = 0 if snapshot.final else len(line)
+        stream.write("\r" + line + padding + ("\n" if snapshot.final else ""))
+        stream.flush()
+
+
+def measure_telemetry_overhead(num_samples: int, num_threads: int = 4,
+                               interval: float = 0.05, **options) -> dict:
+    """
+    Mesure le coût de la télémétrie sur une simulation multi-worker.
+
+    La même simulation (même graine) est lancée sans rappel, puis avec un
+    TelemetryRecorder et un intervalle d'instantanés court.
+
+    Args:
+        num_samples: Nombre d'échantillons de la simulation
+        num_threads: Nombre de workers
+        interval: Intervalle entre deux instantanés, en secondes
+        **options: Options de calculate_pi_multi (backend, kernel, seed, ...)
+
+    Returns:
+        dict: Temps sans télémétrie, avec télémétrie, surcoût relatif et
+              nombre d'instantanés
+    """
+    # Import local: monte_carlo_multi dépend lui-même de ce module
+    from src.monte_carlo_multi import calculate_pi_multi
+
+    options.setdefault("seed", 0)
+    options.setdefault("aggregation", "slots")
+
+    _, time_without = calculate_pi_multi(num_samples, num_threads, **options)
+
+    recorder = TelemetryRecorder()
+    _, time_with = calculate_pi_multi(num_samples, num_threads, callbacks=[recorder],
+                                      telemetry_interval=interval, **options)
+
+    return {
+        "time_without": time_without,
+        "time_with": time_with,
+        "relative_overhead": time_with / time_without - 1.0,
+        "snapshots": len(recorder.snapshots),
+    }
+
+
+if __name__ == "__main__":
+    # Test rapide du module
+    from src.monte_carlo_multi import calculate_pi_multi
+
+    print("=== Test de la télémétrie ===\n")
+
+    pi_value, exec_time = calculate_pi_multi(20_000_000, 4, kernel="numpy", seed=42,
+                                             callbacks=[ProgressRenderer()],
+                                             telemetry_interval=0.1)
+    print(f"  Pi calculé: {pi_value:.8f} en {exec_time:.4f}s\n")
+
+    overhead = measure_telemetry_overhead(20_000_000, 4, kernel="numpy")
+    print(f"Sans télémétrie: {overhead['time_without']:.4f}s")
+    print(f"Avec télémétrie: {overhead['time_with']:.4f}s "
+          f"({overhead['snapshots']} instantanés)")
+    print(f"Surcoût relatif: {overhead['relative_overhead']:+.1%}")
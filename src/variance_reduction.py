@@ -0,0 +1,306 @@
+"""
+Estimateurs de Pi à variance réduite
+
+L'estimateur classique compte les points dans le cercle: son erreur standard
+vaut 4 × √(p(1 - p) / n). Les estimateurs de ce module atteignent la même
+précision avec moins de points, en exploitant ce que l'on sait du problème.
+
+Estimateurs disponibles (points dans le quart de disque [0, 1] × [0, 1]):
+- "stratified":      le carré est découpé en k × k sous-carrés (strates) et
+                     l'échantillon i tombe dans la strate i mod k². Seules les
+                     strates traversées par le cercle contribuent à la variance.
+- "antithetic":      chaque tirage (u, v) est évalué avec son "opposé"
+                     (1 - u, 1 - v). Quand l'un est dans le cercle, l'autre a
+                     tendance à ne pas l'être: leurs erreurs se compensent.
+- "control_variate": la variable de contrôle c = u² + v², d'espérance connue
+                     2/3, est très corrélée au test du cercle. On retire à
+                     l'estimation la part de l'écart de c à sa moyenne.
+
+Chaque estimateur réduit une plage d'échantillons [start, start + n) à un
+vecteur de sommes (statistiques suffisantes). Les vecteurs des workers
+s'additionnent: le résultat est le même en mono-thread, avec des threads ou
+avec des processus, pour une graine donnée.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from src.kernels import DEFAULT_CHUNK_SIZE
+from src.monte_carlo_multi import BACKENDS, _wait_for, share_starts, split_samples
+from src.seeding import STREAM_BLOCK_SIZE, block_generator, iter_blocks, resolve_seed
+from src.worker_pool import WorkerPool
+
+
+# Estimateurs à variance réduite acceptés par calculate_pi_variance_reduced
+ESTIMATORS = ("stratified", "antithetic", "control_variate")
+
+# Nombre de strates par axe pour l'estimateur "stratified" (16 × 16 = 256 strates)
+DEFAULT_STRATA_PER_AXIS = 16
+
+# Espérance de la variable de contrôle u² + v² pour (u, v) uniforme dans [0, 1]²
+CONTROL_MEAN = 2.0 / 3.0
+
+
+@dataclass
+class VarianceReducedEstimate:
+    """Résultat d'une estimation de Pi à variance réduite."""
+    pi_value: float              # Valeur de Pi estimée
+    std_error: float             # Erreur standard de l'estimation
+    estimator: str               # Nom de l'estimateur utilisé
+    num_samples: int             # Nombre de tirages (u, v)
+    execution_time: float        # Temps en secondes
+
+
+def _iter_uniform_chunks(num_samples: int, chunk_size: int, seed: int, start: int):
+    """
+    Parcourt les tirages [start, start + num_samples) par blocs vectorisés.
+
+    Le flux est celui du noyau "numpy" (deux tirages de 64 bits par point),
+    ramené dans [0, 1) au lieu de [-1, 1).
+
+    Yields:
+        tuple: (indice_global_du_premier_point, tableau (n, 2) dans [0, 1)²)
+    """
+    for block_index, lo, hi in iter_blocks(start, num_samples):
+        rng = block_generator(seed, block_index)
+
+        # Sauter le début du bloc: chaque point consomme 2 tirages de 64 bits
+        if lo:
+            rng.bit_generator.advance(2 * lo)
+
+        position = block_index * STREAM_BLOCK_SIZE + lo
+        remaining = hi - lo
+        while remaining > 0:
+            n = min(chunk_size, remaining)
+            yield position, rng.random(size=(n, 2))
+            position += n
+            remaining -= n
+
+
+def estimator_statistics(estimator: str, num_samples: int,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         seed: Optional[int] = None, start: int = 0,
+                         strata_per_axis: int = DEFAULT_STRATA_PER_AXIS) -> np.ndarray:
+    """
+    Réduit une plage de tirages aux sommes dont a besoin un estimateur.
+
+    Les vecteurs de deux plages disjointes s'additionnent: c'est ce que
+    renvoie chaque worker.
+
+    Contenu du vecteur selon l'estimateur:
+    - "stratified":      [points dans le cercle par strate..., tirages par strate...]
+    - "antithetic":      [n, Σh, Σh²] avec h la moyenne d'une paire antithétique
+    - "control_variate": [n, Σf, Σc, Σf², Σc², Σf·c] avec f le test du cercle
+
+    Args:
+        estimator: Nom de l'estimateur (voir ESTIMATORS)
+        num_samples: Nombre de tirages (u, v) de la plage
+        chunk_size: Nombre maximal de tirages générés en une seule fois
+        seed: Graine maître (aléatoire si None)
+        start: Indice global du premier tirage de la plage
+        strata_per_axis: Nombre de strates par axe ("stratified")
+
+    Returns:
+        ndarray: Vecteur de sommes (float64)
+    """
+    seed = resolve_seed(seed)
+
+    if estimator == "stratified":
+        num_strata = strata_per_axis * strata_per_axis
+        hits = np.zeros(num_strata, dtype=np.float64)
+        counts = np.zeros(num_strata, dtype=np.float64)
+
+        for position, points in _iter_uniform_chunks(num_samples, chunk_size, seed, start):
+            # Strate de chaque tirage: indice global modulo le nombre de strates
+            strata = np.arange(position, position + len(points)) % num_strata
+            column = strata % strata_per_axis
+            row = strata // strata_per_axis
+
+            # Le tirage (u, v) est placé dans son sous-carré
+            x = (column + points[:, 0]) / strata_per_axis
+            y = (row + points[:, 1]) / strata_per_axis
+            inside = x * x + y * y <= 1.0
+
+            hits += np.bincount(strata, weights=inside, minlength=num_strata)
+            counts += np.bincount(strata, minlength=num_strata)
+
+        return np.concatenate([hits, counts])
+
+    sums = np.zeros(3 if estimator == "antithetic" else 6, dtype=np.float64)
+
+    for _, points in _iter_uniform_chunks(num_samples, chunk_size, seed, start):
+        u = points[:, 0]
+        v = points[:, 1]
+        f = (u * u + v * v <= 1.0).astype(np.float64)
+
+        if estimator == "antithetic":
+            # Point opposé (1 - u, 1 - v), évalué avec le même tirage
+            g = ((1.0 - u) ** 2 + (1.0 - v) ** 2 <= 1.0)
+            h = 0.5 * (f + g)
+            sums += (len(h), h.sum(), np.dot(h, h))
+        else:
+            c = u * u + v * v
+            sums += (len(f), f.sum(), c.sum(), np.dot(f, f), np.dot(c, c), np.dot(f, c))
+
+    return sums
+
+
+def finalize_estimate(estimator: str, statistics: np.ndarray) -> tuple:
+    """
+    Calcule Pi et son erreur standard à partir des sommes agrégées.
+
+    Args:
+        estimator: Nom de l'estimateur (voir ESTIMATORS)
+        statistics: Somme des vecteurs de tous les workers
+
+    Returns:
+        tuple: (valeur_de_pi, erreur_standard)
+    """
+    if estimator == "stratified":
+        hits, counts = np.split(statistics, 2)
+        num_strata = len(hits)
+
+        # Moyenne des proportions de chaque strate (strates de même aire)
+        p = hits / counts
+        pi_estimate = 4.0 * p.mean()
+        std_error = 4.0 * math.sqrt(float(np.sum(p * (1 - p) / counts))) / num_strata
+        return float(pi_estimate), std_error
+
+    if estimator == "antithetic":
+        n, sum_h, sum_h2 = statistics
+        mean_h = sum_h / n
+        var_h = max(sum_h2 / n - mean_h * mean_h, 0.0)
+        return 4.0 * mean_h, 4.0 * math.sqrt(var_h / n)
+
+    n, sum_f, sum_c, sum_f2, sum_c2, sum_fc = statistics
+    mean_f = sum_f / n
+    mean_c = sum_c / n
+    var_f = sum_f2 / n - mean_f * mean_f
+    var_c = sum_c2 / n - mean_c * mean_c
+    cov_fc = sum_fc / n - mean_f * mean_c
+
+    # Coefficient optimal: β = cov(f, c) / var(c)
+    beta = cov_fc / var_c
+    mean_corrected = mean_f - beta * (mean_c - CONTROL_MEAN)
+
+    # Variance résiduelle: var(f) × (1 - corrélation²)
+    var_corrected = max(var_f - cov_fc * cov_fc / var_c, 0.0)
+    return 4.0 * mean_corrected, 4.0 * math.sqrt(var_corrected / n)
+
+
+def calculate_pi_variance_reduced(num_samples: int, estimator: str = "stratified",
+                                  num_threads: int = 1, backend: str = "thread",
+                                  seed: Optional[int] = None,
+                                  chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                  strata_per_axis: int = DEFAULT_STRATA_PER_AXIS,
+                                  pool: Optional[WorkerPool] = None) -> VarianceReducedEstimate:
+    """
+    Calcule Pi avec un estimateur à variance réduite, et son erreur standard.
+
+    Avec num_threads=1 et sans pool, le calcul se fait dans le thread courant
+    (mono-thread). Sinon la plage de tirages est découpée entre les workers
+    comme pour calculate_pi_multi, et leurs vecteurs de sommes sont
+    additionnés. Pour une graine donnée, le résultat ne dépend ni du nombre
+    de workers ni du backend.
+
+    Args:
+        num_samples: Nombre de tirages (u, v)
+        estimator: "stratified", "antithetic" ou "control_variate"
+        num_threads: Nombre de workers (1 = mono-thread)
+        backend: Backend d'exécution multi-worker, "thread" ou "process"
+        seed: Graine maître pour un résultat reproductible (aléatoire si None)
+        chunk_size: Taille des blocs vectorisés (borne la mémoire)
+        strata_per_axis: Nombre de strates par axe pour "stratified"
+        pool: Pool de workers persistant (son backend remplace backend)
+
+    Returns:
+        VarianceReducedEstimate: Estimation, erreur standard et temps d'exécution
+
+    Raises:
+        ValueError: Si un paramètre est invalide
+    """
+    # Validation des entrées
+    if estimator not in ESTIMATORS:
+        raise ValueError(f"estimator doit être parmi {ESTIMATORS}, reçu: {estimator!r}")
+
+    if num_threads <= 0:
+        raise ValueError(f"num_threads doit être > 0, reçu: {num_threads}")
+
+    if pool is not None:
+        backend = pool.backend
+
+    if backend not in BACKENDS:
+        raise ValueError(f"backend doit être parmi {BACKENDS}, reçu: {backend!r}")
+
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size doit être > 0, reçu: {chunk_size}")
+
+    if strata_per_axis <= 0:
+        raise ValueError(f"strata_per_axis doit être > 0, reçu: {strata_per_axis}")
+
+    # Au moins deux tirages par strate pour estimer leur variance
+    min_samples = 2 * strata_per_axis ** 2 if estimator == "stratified" else 2
+    if num_samples < min_samples:
+        raise ValueError(f"num_samples doit être >= {min_samples} pour "
+                         f"l'estimateur {estimator!r}, reçu: {num_samples}")
+
+    seed = resolve_seed(seed)
+
+    start_time = time.perf_counter()
+
+    if num_threads == 1 and pool is None:
+        statistics = estimator_statistics(estimator, num_samples, chunk_size, seed,
+                                          0, strata_per_axis)
+    else:
+        shares = split_samples(num_samples, num_threads)
+        tasks = [(estimator, share, chunk_size, seed, share_start, strata_per_axis)
+                 for share, share_start in zip(shares, share_starts(shares))]
+
+        if pool is not None:
+            pool.resize(num_threads)
+            parts = _wait_for([pool.submit(estimator_statistics, *args) for args in tasks])
+        else:
+            with WorkerPool(backend, num_threads) as temporary_pool:
+                parts = _wait_for([temporary_pool.submit(estimator_statistics, *args)
+                                   for args in tasks])
+
+        # Réduction: les vecteurs de sommes s'additionnent
+        statistics = np.sum(parts, axis=0)
+
+    pi_estimate, std_error = finalize_estimate(estimator, statistics)
+    execution_time = time.perf_counter() - start_time
+
+    return VarianceReducedEstimate(
+        pi_value=pi_estimate,
+        std_error=std_error,
+        estimator=estimator,
+        num_samples=num_samples,
+        execution_time=execution_time,
+    )
+
+
+if __name__ == "__main__":
+    # Test rapide du module
+    print("=== Test des estimateurs à variance réduite ===\n")
+
+    samples = 1_000_000
+
+    # Référence: erreur standard de l'estimateur classique (comptage)
+    p = math.pi / 4
+    plain_error = 4.0 * math.sqrt(p * (1 - p) / samples)
+    print(f"Échantillons: {samples:,} | erreur standard classique: {plain_error:.6f}\n")
+
+    for name in ESTIMATORS:
+        result = calculate_pi_variance_reduced(samples, name, seed=42)
+        gain = (plain_error / result.std_error) ** 2
+
+        print(f"Estimateur: {name}")
+        print(f"  Pi calculé:      {result.pi_value:.8f}")
+        print(f"  Erreur réelle:   {abs(result.pi_value - math.pi):.8f}")
+        print(f"  Erreur standard: {result.std_error:.8f} (≈ {gain:.1f}x moins d'échantillons)")
+        print(f"  Temps:           {result.execution_time:.4f} secondes")
+        print()
@@ -6,20 +6,61 @@ Ce module crée tous les graphiques pour la présentation:
 - Scalabilité (ligne)
 - Visualisation de la méthode Monte Carlo
 - Facteur d'accélération (speedup)
+
+Génération rapide (generate_all_plots):
+- matplotlib n'est importé qu'au premier graphique demandé (_pyplot)
+- les graphiques sont rendus en parallèle dans un pool de processus
+- un graphique n'est pas recalculé si l'empreinte de ses entrées (résultats,
+  paramètres et code de ce module) est celle enregistrée à côté du PNG
 """
 
+import hashlib
+import json
 import os
 import sys
-import random
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from typing import Dict
+from dataclasses import asdict
+from typing import Dict, Iterator, List, Optional, Tuple
 import numpy as np
 
 # Ajouter le dossier parent au path pour les imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.performance_analyzer import BenchmarkResults
+from src.integration import integrand_sums, unit_ball_indicator
+from src.kernels import DEFAULT_CHUNK_SIZE, SQUARE_LOWER, SQUARE_UPPER
+from src.performance_analyzer import BenchmarkResults, fit_series_models, group_series
+from src.seeding import block_random, iter_blocks, resolve_seed
+from src.worker_pool import WorkerPool
+
+
+# Résolution par défaut (pixels par côté) de l'image de densité des points
+DEFAULT_RASTER_RESOLUTION = 512
+
+# Noyaux dont density_raster reproduit exactement les points. Le noyau
+# "integer" tire ses points dans le quart de disque [0, 1)², pas dans le
+# carré [-1, 1]² de la figure: il n'est pas reproduit.
+RASTER_KERNELS = ("numpy", "python")
+
+
+# Extension du fichier qui enregistre l'empreinte des entrées d'un graphique
+CACHE_SUFFIX = ".sha256"
+
+
+def _pyplot():
+    """
+    Importe matplotlib au premier graphique demandé.
+    
+    Sauf si pyplot est déjà chargé par l'appelant, le backend "Agg" (sans
+    fenêtre) est choisi: les graphiques sont enregistrés en PNG, y compris
+    depuis les processus du pool.
+    
+    Returns:
+        module: matplotlib.pyplot
+    """
+    if "matplotlib.pyplot" not in sys.modules:
+        import matplotlib
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
 
 
 def ensure_output_directory():
@@ -29,43 +70,51 @@ def ensure_output_directory():
     os.makedirs("results", exist_ok=True)
 
 
+def series_colors(count: int) -> List[str]:
+    """
+    Couleurs des séries de résultats (palette du projet, répétée si besoin).
+    
+    Args:
+        count: Nombre de couleurs
+        
+    Returns:
+        list: Couleurs hexadécimales
+    """
+    palette = ['#3498db', '#2ecc71', '#9b59b6', '#f39c12', '#1abc9c', '#e67e22', '#34495e']
+    return [palette[i % len(palette)] for i in range(count)]
+
+
 def plot_execution_times(results: Dict[str, BenchmarkResults], output_path: str = "results/execution_times.png"):
     """
     Crée un graphique en barres comparant les temps d'exécution.
     
     Ce graphique montre visuellement la différence de temps entre:
-    - Mono-thread (référence)
-    - Multi-thread avec 2, 4, 8 threads
+    - Mono-thread (référence, en rouge)
+    - Chaque configuration multi-worker mesurée (une couleur par série)
     
     Args:
         results: Dictionnaire des résultats du benchmark
         output_path: Chemin où sauvegarder le graphique
     """
     ensure_output_directory()
+    plt = _pyplot()
     
-    # Préparer les données
-    configurations = []
-    times = []
-    errors = []  # Écart-type pour les barres d'erreur
-    colors = []
-    
-    color_map = {
-        'mono': '#e74c3c',      # Rouge pour mono-thread
-        'multi_2': '#3498db',   # Bleu pour multi-thread
-        'multi_4': '#2ecc71',   # Vert
-        'multi_8': '#9b59b6'    # Violet
-    }
+    # Préparer les données (dans l'ordre d'exécution du benchmark)
+    series = group_series(results)
+    series_color = dict(zip(series, series_colors(len(series))))
+    color_of = {}
+    for label, members in series.items():
+        for r in members:
+            if r.baseline is not None:
+                color_of[id(r)] = series_color[label]
     
-    for key in ['mono', 'multi_2', 'multi_4', 'multi_8']:
-        if key in results:
-            r = results[key]
-            configurations.append(r.configuration)
-            times.append(r.avg_time)
-            errors.append(r.std_time)
-            colors.append(color_map[key])
+    configurations = [r.configuration for r in results.values()]
+    times = [r.avg_time for r in results.values()]
+    errors = [r.std_time for r in results.values()]  # Écart-type pour les barres d'erreur
+    colors = [color_of.get(id(r), '#e74c3c') for r in results.values()]  # Rouge pour mono
     
-    # Créer le graphique
-    fig, ax = plt.subplots(figsize=(10, 6))
+    # Créer le graphique (plus large quand la matrice a beaucoup de configurations)
+    fig, ax = plt.subplots(figsize=(max(10, 0.9 * len(configurations)), 6))
     
     # Créer les barres avec barres d'erreur
     bars = ax.bar(configurations, times, yerr=errors, capsize=5, 
@@ -86,7 +135,7 @@ def plot_execution_times(results: Dict[str, BenchmarkResults], output_path: str
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     
     # Rotation des labels pour meilleure lisibilité
-    plt.xticks(rotation=15, ha='right')
+    plt.xticks(rotation=15 if len(configurations) <= 6 else 45, ha='right')
     
     # Ajuster la mise en page
     plt.tight_layout()
@@ -100,54 +149,64 @@ def plot_execution_times(results: Dict[str, BenchmarkResults], output_path: str
 
 def plot_scalability(results: Dict[str, BenchmarkResults], output_path: str = "results/scalability.png"):
     """
-    Crée un graphique de scalabilité montrant le temps vs nombre de threads.
+    Crée un graphique de scalabilité montrant le temps vs nombre de workers.
     
     Ce graphique montre comment le temps d'exécution diminue quand on augmente
-    le nombre de threads. Idéalement, plus de threads = moins de temps.
+    le nombre de workers. Idéalement, plus de workers = moins de temps.
+    Une courbe par série (backend, noyau, échantillonnage, taille), qui part
+    de son mono-thread de référence (1 worker). La courbe en tirets est le
+    temps prédit par le modèle ajusté: Amdahl en scalabilité forte
+    (temps_mono / S(n)), Gustafson en scalabilité faible (n × temps_mono / S(n)).
     
     Args:
         results: Dictionnaire des résultats du benchmark
         output_path: Chemin où sauvegarder le graphique
     """
     ensure_output_directory()
+    plt = _pyplot()
     
-    # Préparer les données
-    thread_counts = [1, 2, 4, 8]  # 1 = mono-thread
-    times = []
-    errors = []
-    
-    key_map = {1: 'mono', 2: 'multi_2', 4: 'multi_4', 8: 'multi_8'}
-    
-    for threads in thread_counts:
-        key = key_map[threads]
-        if key in results:
-            times.append(results[key].avg_time)
-            errors.append(results[key].std_time)
-        else:
-            times.append(None)
-            errors.append(None)
+    series = group_series(results)
+    fits = fit_series_models(results)
+    worker_counts = sorted({r.num_workers for members in series.values() for r in members})
     
     # Créer le graphique
     fig, ax = plt.subplots(figsize=(10, 6))
     
-    # Ligne avec marqueurs et barres d'erreur
-    ax.errorbar(thread_counts, times, yerr=errors, 
-                marker='o', markersize=10, linewidth=2.5, capsize=5,
-                color='#3498db', markerfacecolor='#e74c3c', 
-                markeredgewidth=2, markeredgecolor='#c0392b')
-    
-    # Ajouter les valeurs sur les points
-    for x, y in zip(thread_counts, times):
-        if y is not None:
-            ax.text(x, y, f'{y:.3f}s', 
-                   ha='center', va='bottom', fontsize=10, fontweight='bold')
+    for (label, members), color in zip(series.items(), series_colors(len(series))):
+        counts = [r.num_workers for r in members]
+        times = [r.avg_time for r in members]
+        errors = [r.std_time for r in members]
+        
+        # Modèle ajusté (courbe continue), si le mono-thread est dans la série
+        if members[0].baseline is None:
+            weak = members[-1].scaling == "weak"
+            fit = fits[label]["gustafson" if weak else "amdahl"]
+            model_counts = np.linspace(1, max(counts), 200)
+            model_times = [members[0].avg_time * (n if weak else 1) / fit.speedup(n)
+                           for n in model_counts]
+            ax.plot(model_counts, model_times, '--', color=color, linewidth=1.5, alpha=0.7,
+                    label=f'{label}: {fit.model.capitalize()} '
+                          f'(s = {fit.serial_fraction:.3f}, R² = {fit.r_squared:.2f})')
+        
+        # Ligne avec marqueurs et barres d'erreur
+        ax.errorbar(counts, times, yerr=errors, label=label,
+                    marker='o', markersize=10, linewidth=2.5, capsize=5,
+                    color=color, markerfacecolor='#e74c3c', 
+                    markeredgewidth=2, markeredgecolor='#c0392b')
+        
+        # Ajouter les valeurs sur les points (une seule série: pas de chevauchement)
+        if len(series) == 1:
+            for x, y in zip(counts, times):
+                ax.text(x, y, f'{y:.3f}s', 
+                       ha='center', va='bottom', fontsize=10, fontweight='bold')
     
     # Configuration du graphique
-    ax.set_xlabel('Nombre de Threads', fontsize=13, fontweight='bold')
+    ax.set_xlabel('Nombre de Workers', fontsize=13, fontweight='bold')
     ax.set_ylabel('Temps d\'Exécution (secondes)', fontsize=13, fontweight='bold')
-    ax.set_title('Scalabilité: Temps d\'Exécution vs Nombre de Threads', 
+    ax.set_title('Scalabilité: Temps d\'Exécution vs Nombre de Workers', 
                  fontsize=15, fontweight='bold', pad=20)
-    ax.set_xticks(thread_counts)
+    ax.set_xticks(worker_counts)
+    ax.legend(fontsize=9)
     ax.grid(True, alpha=0.3, linestyle='--')
     
     # Ajuster la mise en page
@@ -166,53 +225,65 @@ def plot_speedup_chart(results: Dict[str, BenchmarkResults], output_path: str =
     
     Le speedup montre combien de fois le multi-thread est plus rapide que le mono-thread.
     Un speedup de 4x signifie que le multi-thread est 4 fois plus rapide.
+    Les barres de chaque série sont groupées par nombre de workers. Les
+    speedups prédits par les lois d'Amdahl (tirets) et de Gustafson
+    (pointillés) ajustées sur chaque série sont superposés.
     
     Args:
         results: Dictionnaire des résultats du benchmark
         output_path: Chemin où sauvegarder le graphique
     """
     ensure_output_directory()
+    plt = _pyplot()
     
-    # Préparer les données
-    thread_counts = [1, 2, 4, 8]
-    speedups = []
-    
-    key_map = {1: 'mono', 2: 'multi_2', 4: 'multi_4', 8: 'multi_8'}
-    
-    for threads in thread_counts:
-        key = key_map[threads]
-        if key in results:
-            speedups.append(results[key].speedup)
-        else:
-            speedups.append(1.0)
+    # Préparer les données: une position par nombre de workers (1 = mono-thread)
+    series = group_series(results)
+    fits = fit_series_models(results)
+    worker_counts = sorted({r.num_workers for members in series.values() for r in members})
+    positions = {count: i for i, count in enumerate(worker_counts)}
     
     # Créer le graphique
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    # Barres de speedup
-    colors = ['#e74c3c', '#3498db', '#2ecc71', '#9b59b6']
-    bars = ax.bar(thread_counts, speedups, color=colors, alpha=0.8, 
-                   edgecolor='black', linewidth=1.5, width=0.6)
+    fig, ax = plt.subplots(figsize=(max(10, 1.2 * len(worker_counts)), 6))
+    
+    # Barres de speedup, groupées par nombre de workers
+    width = 0.8 / max(len(series), 1)
+    for i, ((label, members), color) in enumerate(zip(series.items(),
+                                                      series_colors(len(series)))):
+        offset = (i - (len(series) - 1) / 2) * width
+        xs = [positions[r.num_workers] + offset for r in members]
+        speedups = [r.speedup for r in members]
+        bars = ax.bar(xs, speedups, width=width, color=color, alpha=0.8,
+                      edgecolor='black', linewidth=1.5, label=label)
+        
+        # Ajouter les valeurs sur les barres
+        for bar, speedup in zip(bars, speedups):
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height,
+                    f'{speedup:.2f}x',
+                    ha='center', va='bottom', fontsize=11 if len(series) == 1 else 8,
+                    fontweight='bold')
+        
+        # Modèles ajustés, évalués aux nombres de workers mesurés
+        for model, style in (("amdahl", '--'), ("gustafson", ':')):
+            fit = fits[label][model]
+            ax.plot([positions[r.num_workers] + offset for r in members],
+                    [fit.speedup(r.num_workers) for r in members], style,
+                    color=color, linewidth=1.5, marker='.',
+                    label=f'{label}: {model.capitalize()} '
+                          f'(s = {fit.serial_fraction:.3f}, R² = {fit.r_squared:.2f})')
     
     # Ligne de référence (speedup idéal = linéaire)
-    ideal_speedup = thread_counts
-    ax.plot(thread_counts, ideal_speedup, 'r--', linewidth=2, 
+    ax.plot(list(positions.values()), worker_counts, 'r--', linewidth=2, 
             label='Speedup Idéal (linéaire)', alpha=0.7)
     
-    # Ajouter les valeurs sur les barres
-    for bar, speedup in zip(bars, speedups):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{speedup:.2f}x',
-                ha='center', va='bottom', fontsize=11, fontweight='bold')
-    
     # Configuration du graphique
-    ax.set_xlabel('Nombre de Threads', fontsize=13, fontweight='bold')
+    ax.set_xlabel('Nombre de Workers', fontsize=13, fontweight='bold')
     ax.set_ylabel('Facteur d\'Accélération (Speedup)', fontsize=13, fontweight='bold')
     ax.set_title('Facteur d\'Accélération: Multi-thread vs Mono-thread', 
                  fontsize=15, fontweight='bold', pad=20)
-    ax.set_xticks(thread_counts)
-    ax.legend(fontsize=11)
+    ax.set_xticks(list(positions.values()))
+    ax.set_xticklabels([str(count) for count in worker_counts])
+    ax.legend(fontsize=9)
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     
     # Ajuster la mise en page
@@ -225,49 +296,142 @@ def plot_speedup_chart(results: Dict[str, BenchmarkResults], output_path: str =
     print(f"✓ Graphique sauvegardé: {output_path}")
 
 
-def plot_monte_carlo_visualization(num_samples: int = 5000, output_path: str = "results/monte_carlo_method.png"):
+def _python_kernel_points(num_samples: int, seed: Optional[int],
+                          chunk_size: int) -> Iterator[np.ndarray]:
+    """
+    Points du noyau "python", générés par blocs vectorisés.
+    
+    Le noyau "python" tire x puis y avec random.Random.uniform(-1, 1), soit
+    -1 + 2 × random(). Le Mersenne Twister de chaque bloc est recopié dans un
+    np.random.RandomState, dont random_sample utilise la même conversion
+    53 bits que random(): les points sont identiques, au bit près.
+    """
+    seed = resolve_seed(seed)
+    for block_index, lo, hi in iter_blocks(0, num_samples):
+        state = block_random(seed, block_index).getstate()[1]
+        generator = np.random.RandomState()
+        generator.set_state(("MT19937", np.array(state[:624], dtype=np.uint32), state[624]))
+        
+        for offset in range(lo, hi, chunk_size):
+            n = min(chunk_size, hi - offset)
+            yield (-1.0 + 2.0 * generator.random_sample(2 * n)).reshape(n, 2)
+
+
+def density_raster(num_samples: int, resolution: int = DEFAULT_RASTER_RESOLUTION,
+                   seed: Optional[int] = None,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   kernel: str = "numpy") -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Compte les points dans et hors du cercle sur une grille de pixels.
+    
+    Les points sont ceux du noyau demandé pour la même graine (mêmes blocs de
+    flux, même ordre): l'image correspond exactement à la simulation
+    calculate_pi_mono(num_samples, kernel=kernel, seed=seed). Ils arrivent
+    bloc par bloc et sont aussitôt accumulés dans la grille: mémoire et temps
+    de rendu ne dépendent pas du nombre de points.
+    
+    Args:
+        num_samples: Nombre de points à tirer
+        resolution: Nombre de pixels par côté de la grille
+        seed: Graine maître (aléatoire si None)
+        chunk_size: Nombre maximal de points traités en une seule fois
+        kernel: Noyau dont les points sont reproduits (voir RASTER_KERNELS)
+        
+    Returns:
+        tuple: (comptes_dans_le_cercle, comptes_hors_du_cercle, points_dans_le_cercle),
+               grilles (resolution, resolution) indexées [y, x]
+        
+    Raises:
+        ValueError: Si num_samples ou resolution <= 0, ou si le noyau n'est
+                    pas dans RASTER_KERNELS
+    """
+    if num_samples <= 0:
+        raise ValueError(f"num_samples doit être > 0, reçu: {num_samples}")
+    
+    if resolution <= 0:
+        raise ValueError(f"resolution doit être > 0, reçu: {resolution}")
+    
+    if kernel not in RASTER_KERNELS:
+        raise ValueError(f"kernel doit être parmi {RASTER_KERNELS}, reçu: {kernel!r}")
+    
+    num_pixels = resolution * resolution
+    inside_counts = np.zeros(num_pixels, dtype=np.int64)
+    outside_counts = np.zeros(num_pixels, dtype=np.int64)
+    
+    def accumulate(points: np.ndarray) -> np.ndarray:
+        # Indicatrice du disque, avec au passage le comptage par pixel
+        inside = unit_ball_indicator(points)
+        pixels = ((points + 1.0) * (resolution / 2.0)).astype(np.int64)
+        np.clip(pixels, 0, resolution - 1, out=pixels)
+        flat = pixels[:, 1] * resolution + pixels[:, 0]
+        inside_counts[:] += np.bincount(flat[inside], minlength=num_pixels)
+        outside_counts[:] += np.bincount(flat[~inside], minlength=num_pixels)
+        return inside
+    
+    if kernel == "python":
+        inside_count = sum(int(accumulate(points).sum())
+                           for points in _python_kernel_points(num_samples, seed, chunk_size))
+    else:
+        sums = integrand_sums(accumulate, num_samples, SQUARE_LOWER, SQUARE_UPPER,
+                              chunk_size, seed)
+        inside_count = int(sums[1])
+    
+    shape = (resolution, resolution)
+    return inside_counts.reshape(shape), outside_counts.reshape(shape), inside_count
+
+
+def plot_monte_carlo_visualization(num_samples: int = 1_000_000,
+                                   output_path: str = "results/monte_carlo_method.png",
+                                   seed: Optional[int] = None,
+                                   resolution: int = DEFAULT_RASTER_RESOLUTION,
+                                   kernel: str = "numpy"):
     """
     Crée une visualisation de la méthode Monte Carlo.
     
     Ce graphique montre:
     - Le carré [-1, 1] × [-1, 1]
     - Le cercle unitaire inscrit
-    - Les points aléatoires (rouge = dans le cercle, bleu = hors du cercle)
+    - La densité des points aléatoires (rouge = dans le cercle, bleu = hors du cercle)
     
     C'est une illustration visuelle parfaite pour expliquer la méthode !
     
+    Les points ne sont pas dessinés un par un: ils sont comptés dans une
+    image de resolution × resolution pixels (density_raster), ce qui permet
+    d'afficher des millions de points en mémoire et en temps constants.
+    
     Args:
-        num_samples: Nombre de points à afficher (5000 recommandé pour la clarté)
+        num_samples: Nombre de points à tirer (des millions sont possibles)
         output_path: Chemin où sauvegarder le graphique
+        seed: Graine de la simulation à illustrer (aléatoire si None)
+        resolution: Nombre de pixels par côté de l'image de densité
+        kernel: Noyau de la simulation à illustrer ("numpy" ou "python")
     """
     ensure_output_directory()
+    plt = _pyplot()
+    from matplotlib import patches
     
-    # Générer les points aléatoires
-    points_inside_x = []
-    points_inside_y = []
-    points_outside_x = []
-    points_outside_y = []
-    
-    inside_count = 0
-    
-    for _ in range(num_samples):
-        x = random.uniform(-1, 1)
-        y = random.uniform(-1, 1)
-        
-        if x*x + y*y <= 1:
-            points_inside_x.append(x)
-            points_inside_y.append(y)
-            inside_count += 1
-        else:
-            points_outside_x.append(x)
-            points_outside_y.append(y)
+    # Compter les points de la simulation par pixel (même flux que le noyau)
+    inside_grid, outside_grid, inside_count = density_raster(num_samples, resolution, seed,
+                                                             kernel=kernel)
     
     # Calculer Pi avec ces points
     pi_estimate = 4.0 * inside_count / num_samples
     
+    # Image RGBA: couleur selon la part de points dans le cercle, opacité
+    # selon la densité (échelle logarithmique pour garder les pixels peu remplis visibles)
+    total = inside_grid + outside_grid
+    inside_share = np.divide(inside_grid, total, out=np.zeros(total.shape), where=total > 0)
+    red, blue = np.array([0.906, 0.298, 0.235]), np.array([0.204, 0.596, 0.859])
+    image = np.empty(total.shape + (4,))
+    image[..., :3] = inside_share[..., None] * red + (1.0 - inside_share[..., None]) * blue
+    image[..., 3] = np.log1p(total) / np.log1p(max(total.max(), 1))
+    
     # Créer le graphique
     fig, ax = plt.subplots(figsize=(10, 10))
     
+    # Afficher la densité des points
+    ax.imshow(image, extent=(-1, 1, -1, 1), origin='lower', interpolation='nearest')
+    
     # Dessiner le cercle unitaire
     circle = patches.Circle((0, 0), 1, fill=False, edgecolor='black', linewidth=2.5)
     ax.add_patch(circle)
@@ -276,10 +440,6 @@ def plot_monte_carlo_visualization(num_samples: int = 5000, output_path: str = "
     square = patches.Rectangle((-1, -1), 2, 2, fill=False, edgecolor='black', linewidth=2.5)
     ax.add_patch(square)
     
-    # Afficher les points
-    ax.scatter(points_outside_x, points_outside_y, c='#3498db', s=1, alpha=0.5, label='Hors du cercle')
-    ax.scatter(points_inside_x, points_inside_y, c='#e74c3c', s=1, alpha=0.5, label='Dans le cercle')
-    
     # Configuration du graphique
     ax.set_xlim(-1.1, 1.1)
     ax.set_ylim(-1.1, 1.1)
@@ -288,7 +448,9 @@ def plot_monte_carlo_visualization(num_samples: int = 5000, output_path: str = "
     ax.set_ylabel('Y', fontsize=13, fontweight='bold')
     ax.set_title(f'Méthode Monte Carlo pour Calculer Pi\n{num_samples:,} points | Pi ≈ {pi_estimate:.6f}', 
                  fontsize=15, fontweight='bold', pad=20)
-    ax.legend(fontsize=11, loc='upper right')
+    ax.legend(handles=[patches.Patch(color=blue, alpha=0.8, label='Hors du cercle'),
+                       patches.Patch(color=red, alpha=0.8, label='Dans le cercle')],
+              fontsize=11, loc='upper right')
     ax.grid(True, alpha=0.3, linestyle='--')
     
     # Ajouter une annotation explicative
@@ -311,19 +473,124 @@ def plot_monte_carlo_visualization(num_samples: int = 5000, output_path: str = "
     print(f"✓ Graphique sauvegardé: {output_path}")
 
 
-def generate_all_plots(results: Dict[str, BenchmarkResults]):
+def _inputs_fingerprint(plot_name: str, inputs: dict) -> str:
+    """
+    Empreinte SHA-256 des entrées d'un graphique.
+    
+    Le code source de ce module en fait partie: modifier un graphique
+    invalide les images déjà enregistrées.
+    
+    Args:
+        plot_name: Nom de la fonction de tracé
+        inputs: Arguments du tracé (sérialisables en JSON)
+        
+    Returns:
+        str: Empreinte hexadécimale
+    """
+    digest = hashlib.sha256()
+    with open(__file__, "rb") as source:
+        digest.update(source.read())
+    digest.update(plot_name.encode())
+    digest.update(json.dumps(inputs, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def _render_plot(plot_name: str, kwargs: dict, fingerprint: Optional[str]) -> bool:
+    """
+    Rend un graphique, sauf si l'image existante a la même empreinte.
+    
+    Exécutée dans un processus du pool de generate_all_plots.
+    
+    Args:
+        plot_name: Nom de la fonction de tracé de ce module
+        kwargs: Arguments de la fonction (dont output_path)
+        fingerprint: Empreinte des entrées (None = toujours rendre)
+        
+    Returns:
+        bool: True si le graphique a été rendu, False s'il était à jour
+    """
+    output_path = kwargs["output_path"]
+    cache_path = output_path + CACHE_SUFFIX
+    
+    if fingerprint is not None and os.path.exists(output_path) and os.path.exists(cache_path):
+        with open(cache_path) as cache:
+            if cache.read().strip() == fingerprint:
+                return False
+    
+    globals()[plot_name](**kwargs)
+    
+    if fingerprint is not None:
+        with open(cache_path, "w") as cache:
+            cache.write(fingerprint + "\n")
+    elif os.path.exists(cache_path):
+        os.remove(cache_path)
+    return True
+
+
+def generate_all_plots(results: Dict[str, BenchmarkResults], seed: Optional[int] = 0,
+                       max_workers: Optional[int] = None, use_cache: bool = True,
+                       num_samples: int = 1_000_000):
     """
     Génère tous les graphiques en une seule fois.
     
+    Les graphiques sont rendus en parallèle dans un pool de processus; ceux
+    dont les entrées n'ont pas changé depuis le dernier rendu (même
+    empreinte) sont conservés tels quels.
+    
+    Pour que la visualisation Monte Carlo montre les points du benchmark,
+    passer la graine de son premier run (run_seed(seed, 0)) et son nombre
+    d'échantillons: les points sont alors ceux du run mono-thread, avec le
+    noyau des résultats. Le noyau "integer" (quart de disque) n'est pas
+    reproduit: la figure montre alors les points du noyau "numpy".
+    
     Args:
         results: Dictionnaire des résultats du benchmark
+        seed: Graine de la visualisation Monte Carlo (None = aléatoire, jamais en cache)
+        max_workers: Nombre de processus (None = un par graphique, borné par les cœurs)
+        use_cache: Réutiliser les images dont l'empreinte des entrées est inchangée
+        num_samples: Nombre de points de la visualisation Monte Carlo
     """
     print("\n📊 Génération des graphiques...")
     
-    plot_execution_times(results)
-    plot_scalability(results)
-    plot_speedup_chart(results)
-    plot_monte_carlo_visualization()
+    # Noyau de la visualisation: celui du benchmark, s'il est reproductible
+    kernels = [r.kernel for r in results.values() if r.baseline is None]
+    kernel = kernels[0] if kernels and kernels[0] in RASTER_KERNELS else "numpy"
+    if kernels and kernels[0] != kernel:
+        print(f"⚠️  Noyau {kernels[0]!r} non reproduit: visualisation avec le noyau {kernel!r}")
+    
+    results_inputs = {key: asdict(r) for key, r in results.items()}
+    jobs = [
+        ("plot_execution_times", {"results": results,
+                                  "output_path": "results/execution_times.png"}),
+        ("plot_scalability", {"results": results,
+                              "output_path": "results/scalability.png"}),
+        ("plot_speedup_chart", {"results": results,
+                                "output_path": "results/speedup.png"}),
+        ("plot_monte_carlo_visualization", {"output_path": "results/monte_carlo_method.png",
+                                            "seed": seed, "num_samples": num_samples,
+                                            "kernel": kernel}),
+    ]
+    
+    submissions = []
+    for plot_name, kwargs in jobs:
+        fingerprint = None
+        if use_cache and kwargs.get("seed", 0) is not None:
+            inputs = {**kwargs, "results": results_inputs} if "results" in kwargs else kwargs
+            fingerprint = _inputs_fingerprint(plot_name, inputs)
+        submissions.append((plot_name, kwargs, fingerprint))
+    
+    num_workers = max_workers or min(len(submissions), os.cpu_count() or 1)
+    
+    if num_workers <= 1:
+        rendered = [_render_plot(*submission) for submission in submissions]
+    else:
+        with WorkerPool("process", num_workers) as pool:
+            futures = [pool.submit(_render_plot, *submission) for submission in submissions]
+            rendered = [future.result() for future in futures]
+    
+    for (_, kwargs, _), was_rendered in zip(submissions, rendered):
+        if not was_rendered:
+            print(f"↺ Graphique inchangé: {kwargs['output_path']}")
     
     print("✓ Tous les graphiques ont été générés avec succès!\n")
 
@@ -337,9 +604,11 @@ if __name__ == "__main__":
     
     test_results = {
         'mono': BenchmarkResults('Mono-thread', [1.0, 1.1, 0.9], 1.0, 0.1, 0.9, 1.1, 3.14, 0.001, 1.0),
-        'multi_2': BenchmarkResults('Multi-thread (2 threads)', [0.6, 0.65, 0.55], 0.6, 0.05, 0.55, 0.65, 3.14, 0.001, 1.67),
-        'multi_4': BenchmarkResults('Multi-thread (4 threads)', [0.35, 0.4, 0.3], 0.35, 0.05, 0.3, 0.4, 3.14, 0.001, 2.86),
-        'multi_8': BenchmarkResults('Multi-thread (8 threads)', [0.25, 0.3, 0.2], 0.25, 0.05, 0.2, 0.3, 3.14, 0.001, 4.0),
     }
+    for num_threads, avg_time in [(2, 0.6), (4, 0.35), (8, 0.25)]:
+        test_results[f'multi_{num_threads}'] = BenchmarkResults(
+            f'Multi-thread ({num_threads} threads)', [avg_time] * 3, avg_time, 0.05,
+            avg_time, avg_time, 3.14, 0.001, 1.0 / avg_time,
+            num_workers=num_threads, backend="thread", baseline='mono')
     
     generate_all_plots(test_results)
@@ -0,0 +1,128 @@
+"""
+Pool de workers persistant pour les simulateurs Monte Carlo
+
+Créer et démarrer des threads (ou pire, des processus) a un coût fixe qui
+s'ajoute au temps mesuré de chaque simulation. Un WorkerPool est créé une
+seule fois, puis réutilisé pour plusieurs simulations: les workers restent
+"chauds" entre deux appels.
+
+Exemple:
+    with WorkerPool("process", num_workers=4) as pool:
+        for _ in range(5):
+            calculate_pi_multi(1_000_000, 4, pool=pool)
+"""
+
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Optional
+
+
+# Backends d'exécution acceptés par WorkerPool
+POOL_BACKENDS = ("thread", "process")
+
+
+def _noop() -> None:
+    """Tâche vide utilisée pour démarrer les workers à l'avance."""
+    return None
+
+
+class WorkerPool:
+    """
+    Pool de threads ou de processus réutilisable entre plusieurs simulations.
+
+    Le pool est dimensionné une fois, puis redimensionné seulement quand une
+    simulation demande un nombre de workers différent (resize).
+    """
+
+    def __init__(self, backend: str = "thread", num_workers: int = 1):
+        """
+        Args:
+            backend: "thread" (ThreadPoolExecutor) ou "process" (ProcessPoolExecutor)
+            num_workers: Nombre de workers du pool
+
+        Raises:
+            ValueError: Si le backend est inconnu ou num_workers <= 0
+        """
+        if backend not in POOL_BACKENDS:
+            raise ValueError(f"backend doit être parmi {POOL_BACKENDS}, reçu: {backend!r}")
+
+        if num_workers <= 0:
+            raise ValueError(f"num_workers doit être > 0, reçu: {num_workers}")
+
+        self.backend = backend
+        self.num_workers = num_workers
+        self._executor: Optional[Executor] = None
+
+    def _create_executor(self) -> Executor:
+        """Crée l'exécuteur concurrent.futures correspondant au backend."""
+        if self.backend == "process":
+            # Import local: multiprocessing n'est chargé que pour un pool de processus
+            from concurrent.futures import ProcessPoolExecutor
+
+            return ProcessPoolExecutor(max_workers=self.num_workers)
+        return ThreadPoolExecutor(max_workers=self.num_workers,
+                                  thread_name_prefix="monte-carlo")
+
+    @property
+    def executor(self) -> Executor:
+        """Exécuteur sous-jacent (créé au premier usage)."""
+        if self._executor is None:
+            self._executor = self._create_executor()
+        return self._executor
+
+    def submit(self, fn, *args) -> Future:
+        """
+        Soumet une tâche au pool.
+
+        Args:
+            fn: Fonction à exécuter (doit être picklable pour le backend "process")
+            *args: Arguments de la fonction
+
+        Returns:
+            Future: Résultat futur de la tâche
+        """
+        return self.executor.submit(fn, *args)
+
+    def resize(self, num_workers: int):
+        """
+        Change le nombre de workers du pool (seulement s'il est différent).
+
+        Les workers existants terminent leurs tâches avant d'être remplacés.
+
+        Args:
+            num_workers: Nouveau nombre de workers
+
+        Raises:
+            ValueError: Si num_workers <= 0
+        """
+        if num_workers <= 0:
+            raise ValueError(f"num_workers doit être > 0, reçu: {num_workers}")
+
+        if num_workers == self.num_workers:
+            return
+
+        self.shutdown()
+        self.num_workers = num_workers
+
+    def warm_up(self):
+        """
+        Démarre les workers à l'avance, pour que la prochaine simulation
+        ne paie pas leur coût de démarrage.
+        """
+        futures = [self.submit(_noop) for _ in range(self.num_workers)]
+        for future in futures:
+            future.result()
+
+    def shutdown(self):
+        """Arrête les workers du pool (il sera recréé au prochain usage)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def __repr__(self) -> str:
+        return f"WorkerPool(backend={self.backend!r}, num_workers={self.num_workers})"